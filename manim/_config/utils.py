@@ -257,20 +257,25 @@ class ManimConfig(MutableMapping):
         "images_dir",
         "input_file",
         "media_width",
+        "min_frames_per_shard",
         "webgl_renderer_path",
         "log_dir",
         "log_to_file",
+        "max_cache_size",
         "max_files_cached",
         "media_dir",
         "movie_file_extension",
         "notify_outdated_version",
         "output_file",
+        "parallel",
         "partial_movie_dir",
         "pixel_height",
         "pixel_width",
         "plugins",
         "preview",
+        "profile_updaters",
         "progress_bar",
+        "render_workers",
         "save_as_gif",
         "save_last_frame",
         "save_pngs",
@@ -295,6 +300,7 @@ class ManimConfig(MutableMapping):
         "window_monitor",
         "write_all",
         "write_to_movie",
+        "frame_queue_size",
     }
 
     def __init__(self) -> None:
@@ -527,6 +533,8 @@ class ManimConfig(MutableMapping):
             "use_webgl_renderer",
             "enable_gui",
             "fullscreen",
+            "parallel",
+            "profile_updaters",
             "use_projection_fill_shaders",
             "use_projection_stroke_shaders",
         ]:
@@ -537,10 +545,14 @@ class ManimConfig(MutableMapping):
             "from_animation_number",
             "upto_animation_number",
             "max_files_cached",
+            "max_cache_size",
             # the next two must be set BEFORE digesting frame_width and frame_height
             "pixel_height",
             "pixel_width",
             "window_monitor",
+            "render_workers",
+            "min_frames_per_shard",
+            "frame_queue_size",
         ]:
             setattr(self, key, parser["CLI"].getint(key))
 
@@ -673,6 +685,9 @@ class ManimConfig(MutableMapping):
             "use_webgl_renderer",
             "enable_gui",
             "fullscreen",
+            "parallel",
+            "render_workers",
+            "profile_updaters",
             "use_projection_fill_shaders",
             "use_projection_stroke_shaders",
         ]:
@@ -1014,6 +1029,12 @@ class ManimConfig(MutableMapping):
         doc="Maximum number of files cached.  Use -1 for infinity (no flag).",
     )
 
+    max_cache_size = property(
+        lambda self: self._d["max_cache_size"],
+        lambda self, val: self._set_pos_number("max_cache_size", val, True),
+        doc="Maximum total size of the cached partial movie files, in megabytes.  Use -1 for infinity (no flag).",
+    )
+
     window_monitor = property(
         lambda self: self._d["window_monitor"],
         lambda self, val: self._set_pos_number("window_monitor", val, True),
@@ -1213,6 +1234,30 @@ class ManimConfig(MutableMapping):
         doc="Expand the window to its maximum possible size.",
     )
 
+    parallel = property(
+        lambda self: self._d["parallel"],
+        lambda self, val: self._set_boolean("parallel", val),
+        doc="Whether to render the animations of a scene in worker processes (--parallel).",
+    )
+
+    render_workers = property(
+        lambda self: self._d["render_workers"],
+        lambda self, val: self._set_pos_number("render_workers", val, False),
+        doc="Number of worker processes used by --parallel.  Use 0 for one per core (--render_workers).",
+    )
+
+    min_frames_per_shard = property(
+        lambda self: self._d["min_frames_per_shard"],
+        lambda self, val: self._set_pos_number("min_frames_per_shard", val, False),
+        doc="Minimum number of frames rendered by each worker when --parallel splits a long animation.  Use 0 to never split animations (no flag).",
+    )
+
+    profile_updaters = property(
+        lambda self: self._d["profile_updaters"],
+        lambda self, val: self._set_boolean("profile_updaters", val),
+        doc="Whether to time the updaters of the mobjects and log the slowest ones (--profile_updaters).",
+    )
+
     use_projection_fill_shaders = property(
         lambda self: self._d["use_projection_fill_shaders"],
         lambda self, val: self._set_boolean("use_projection_fill_shaders", val),
@@ -1225,6 +1270,12 @@ class ManimConfig(MutableMapping):
         doc="Use shaders for OpenGLVMobject stroke which are compatible with transformation matrices.",
     )
 
+    frame_queue_size = property(
+        lambda self: self._d["frame_queue_size"],
+        lambda self, val: self._set_pos_number("frame_queue_size", val, False),
+        doc="Number of frames buffered for the ffmpeg pipe by the background writer thread.  Use 0 to write frames synchronously (no flag).",
+    )
+
     def get_dir(self, key: str, **kwargs: str) -> Path:
         """Resolve a config option that stores a directory.
 
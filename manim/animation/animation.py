@@ -1,7 +1,7 @@
 """Animate mobjects."""
 
 
-from .. import logger
+from .. import config, logger
 from ..mobject import mobject, opengl_mobject
 from ..mobject.mobject import Mobject
 from ..mobject.opengl_mobject import OpenGLMobject
@@ -209,7 +209,9 @@ class Animation:
 
     def create_starting_mobject(self) -> Mobject:
         # Keep track of where the mobject starts
-        return self.mobject.copy()
+        if config.renderer == "opengl":
+            return self.mobject.copy()
+        return self.mobject.copy(shallow=True)
 
     def get_all_mobjects(self) -> Sequence[Mobject]:
         """Get all mobjects involved in the animation.
@@ -24,6 +24,7 @@ import numpy as np
 
 from manim.mobject.opengl_mobject import OpenGLMobject
 
+from .. import config
 from ..animation.transform import Transform
 from ..constants import DOWN, ORIGIN
 from ..mobject.mobject import Group, Mobject
@@ -91,7 +92,10 @@ class _Fade(Transform):
         Mobject
             The faded, shifted and scaled copy of the mobject.
         """
-        faded_mobject = self.mobject.copy()
+        if config.renderer == "opengl":
+            faded_mobject = self.mobject.copy()
+        else:
+            faded_mobject = self.mobject.copy(shallow=True)
         faded_mobject.fade(1)
         direction_modifier = -1 if fadeIn and not self.point_target else 1
         faded_mobject.shift(self.shift_vector * direction_modifier)
@@ -33,15 +33,151 @@ import numpy as np
 from .. import config
 from ..animation.animation import Animation
 from ..constants import DEFAULT_POINTWISE_FUNCTION_RUN_TIME, DEGREES, OUT
-from ..mobject.mobject import Group, Mobject
+from ..mobject.mobject import Group, Mobject, _SubmobjectList
 from ..mobject.opengl_mobject import OpenGLGroup, OpenGLMobject
-from ..utils.paths import path_along_arc
+from ..mobject.types.vectorized_mobject import VMobject
+from ..utils.paths import path_along_arc, straight_path
 from ..utils.rate_functions import smooth, squish_rate_func
 
 if TYPE_CHECKING:
     from ..scene.scene import Scene
 
 
+class _FamilyInterpolation:
+    """The points and style of the aligned families of a :class:`Transform`,
+    packed into contiguous arrays to interpolate all the submobjects at once.
+
+    Use :meth:`pack` to create it, which checks the families can be packed.
+
+    Parameters
+    ----------
+    families
+        The submobjects, starting submobjects and target submobjects zipped
+        together, as given by :meth:`Transform.get_all_families_zipped`.
+    """
+
+    RGBAS_ATTRS = ["fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"]
+    SCALAR_ATTRS = ["stroke_width", "background_stroke_width", "sheen_factor"]
+    VECTOR_ATTRS = ["sheen_direction"]
+
+    def __init__(self, families: Sequence[tuple]) -> None:
+        self.submobjects = [mobs[0] for mobs in families]
+        starts = [mobs[1] for mobs in families]
+        targets = [mobs[2] for mobs in families]
+        # For each array of rows (points or rgbas): the rows of the starting
+        # and target submobjects, the slice of each submobject and the index
+        # of the submobject of each row.
+        self.rows = {}
+        for attr in ["points"] + self.RGBAS_ATTRS:
+            start_arrays = [getattr(mob, attr) for mob in starts]
+            counts = [len(array) for array in start_arrays]
+            ends = np.cumsum(counts)
+            self.rows[attr] = (
+                np.concatenate(start_arrays),
+                np.concatenate([getattr(mob, attr) for mob in targets]),
+                [slice(end - count, end) for count, end in zip(counts, ends)],
+                np.repeat(np.arange(len(families)), counts),
+            )
+        self.values = {
+            attr: (
+                np.array([getattr(mob, attr) for mob in starts], dtype=float),
+                np.array([getattr(mob, attr) for mob in targets], dtype=float),
+            )
+            for attr in self.SCALAR_ATTRS + self.VECTOR_ATTRS
+        }
+        self.targets = targets
+
+    @classmethod
+    def pack(cls, families: Sequence[tuple]) -> Optional["_FamilyInterpolation"]:
+        """Pack the families of a :class:`Transform`, if they only consist of
+        :class:`~.VMobject` using the default interpolation, with aligned
+        points and colors.
+
+        Returns
+        -------
+        Optional[_FamilyInterpolation]
+            The packed families, or ``None`` if they can't be packed.
+        """
+        if not families:
+            return None
+        for mob, start, target in families:
+            if not (
+                isinstance(mob, VMobject)
+                and isinstance(start, VMobject)
+                and isinstance(target, VMobject)
+                and type(mob).interpolate is Mobject.interpolate
+                and type(mob).interpolate_color is VMobject.interpolate_color
+            ):
+                return None
+            for attr in ["points"] + cls.RGBAS_ATTRS:
+                if np.shape(getattr(start, attr)) != np.shape(getattr(target, attr)):
+                    return None
+            for attr in cls.SCALAR_ATTRS:
+                if np.ndim(getattr(start, attr)) or np.ndim(getattr(target, attr)):
+                    return None
+            for attr in cls.VECTOR_ATTRS:
+                if np.shape(getattr(start, attr)) != (mob.dim,) or np.shape(
+                    getattr(target, attr)
+                ) != (mob.dim,):
+                    return None
+        return cls(families)
+
+    def interpolate(
+        self, alphas: np.ndarray, path_func: Callable, pointwise: bool
+    ) -> None:
+        """Interpolate all the submobjects, like :meth:`.Mobject.interpolate`.
+
+        Parameters
+        ----------
+        alphas
+            The interpolation parameter of each submobject.
+        path_func
+            The path function moving the points.
+        pointwise
+            Whether ``path_func`` moves each point independently of the others,
+            so that it can be applied to the points of several submobjects at
+            once.
+        """
+        start, end, slices, owners = self.rows["points"]
+        if path_func is straight_path:
+            point_alphas = alphas[owners, np.newaxis]
+            points = (1 - point_alphas) * start + point_alphas * end
+        elif pointwise and np.all(alphas == alphas[0]):
+            points = path_func(start, end, alphas[0])
+        else:
+            points = np.concatenate(
+                [
+                    path_func(start[s], end[s], alpha)
+                    for s, alpha in zip(slices, alphas.tolist())
+                ]
+            )
+        new_rows = {}
+        for attr in self.RGBAS_ATTRS:
+            start, end, _, owners = self.rows[attr]
+            row_alphas = alphas[owners, np.newaxis]
+            new_rows[attr] = (1 - row_alphas) * start + row_alphas * end
+        new_values = {}
+        for attr, (start, end) in self.values.items():
+            value_alphas = alphas.reshape((-1,) + (1,) * (start.ndim - 1))
+            new_values[attr] = (1 - value_alphas) * start + value_alphas * end
+            if attr in self.SCALAR_ATTRS:
+                new_values[attr] = new_values[attr].tolist()
+
+        at_target = (alphas == 1).tolist()
+        for i, mob in enumerate(self.submobjects):
+            mob.points = points[slices[i]]
+            if at_target[i]:
+                # As in VMobject.interpolate_color
+                target = self.targets[i]
+                for attr in self.RGBAS_ATTRS + self.SCALAR_ATTRS + self.VECTOR_ATTRS:
+                    setattr(mob, attr, getattr(target, attr))
+                continue
+            for attr in self.RGBAS_ATTRS:
+                setattr(mob, attr, new_rows[attr][self.rows[attr][2][i]])
+            for attr in self.SCALAR_ATTRS + self.VECTOR_ATTRS:
+                setattr(mob, attr, new_values[attr][i])
+
+
 class Transform(Animation):
     def __init__(
         self,
@@ -62,6 +198,7 @@ class Transform(Animation):
         self.target_mobject: Mobject = (
             target_mobject if target_mobject is not None else Mobject()
         )
+        self.family_interpolation = None
         super().__init__(mobject, **kwargs)
 
     @property
@@ -72,6 +209,7 @@ class Transform(Animation):
     def path_arc(self, path_arc: float) -> None:
         self._path_arc = path_arc
         self._path_func = path_along_arc(self._path_arc, self.path_arc_axis)
+        self._arc_path_func = self._path_func
 
     @property
     def path_func(
@@ -96,7 +234,11 @@ class Transform(Animation):
         # call so that the actual target_mobject stays
         # preserved.
         self.target_mobject = self.create_target()
-        self.target_copy = self.target_mobject.copy()
+        if config.renderer == "opengl":
+            self.target_copy = self.target_mobject.copy()
+        else:
+            self.target_copy = self.target_mobject.copy(shallow=True)
+        self.family_interpolation = None
         # Note, this potentially changes the structure
         # of both mobject and target_mobject
         if config["renderer"] == "opengl":
@@ -132,6 +274,46 @@ class Transform(Animation):
         ]
         return zip(*[mob.family_members_with_points() for mob in mobs])
 
+    def interpolate_mobject(self, alpha: float) -> None:
+        # The families are packed to interpolate all the submobjects at once,
+        # unless a subclass interpolates the submobjects differently. They are
+        # packed again when the structure of a mobject may have changed, or
+        # when the starting or target mobjects may be modified by updaters.
+        if (
+            config.renderer == "opengl"
+            or type(self).interpolate_submobject is not Transform.interpolate_submobject
+        ):
+            super().interpolate_mobject(alpha)
+            return
+        if (
+            self.family_interpolation is None
+            or self.family_interpolation[0] != _SubmobjectList.generation
+            or any(mob.has_updaters for mob in self.get_all_mobjects_to_update())
+        ):
+            self.family_interpolation = (
+                _SubmobjectList.generation,
+                _FamilyInterpolation.pack(list(self.get_all_families_zipped())),
+            )
+        families = self.family_interpolation[1]
+        if families is None:
+            super().interpolate_mobject(alpha)
+            return
+
+        num_submobjects = len(families.submobjects)
+        if self.lag_ratio == 0 and type(self).get_sub_alpha is Animation.get_sub_alpha:
+            sub_alphas = np.full(num_submobjects, self.get_sub_alpha(alpha, 0, 1))
+        else:
+            sub_alphas = np.array(
+                [
+                    self.get_sub_alpha(alpha, i, num_submobjects)
+                    for i in range(num_submobjects)
+                ],
+                dtype=float,
+            )
+        families.interpolate(
+            sub_alphas, self.path_func, self.path_func is self._arc_path_func
+        )
+
     def interpolate_submobject(
         self,
         submobject: Mobject,
@@ -455,6 +637,8 @@ class TransformAnimations(Transform):
     def interpolate(self, alpha: float) -> None:
         self.start_anim.interpolate(alpha)
         self.end_anim.interpolate(alpha)
+        # The starting and target mobjects have just been modified.
+        self.family_interpolation = None
         Transform.interpolate(self, alpha)
 
 
@@ -521,7 +705,10 @@ class FadeTransform(Transform):
         mobject replaces the starting mobject (and is completely faded). In the
         end, it is set to be the other way around.
         """
-        self.ending_mobject = self.mobject.copy()
+        if config.renderer == "opengl":
+            self.ending_mobject = self.mobject.copy()
+        else:
+            self.ending_mobject = self.mobject.copy(shallow=True)
         Animation.begin(self)
         # Both 'start' and 'end' consists of the source and target mobjects.
         # At the start, the target should be faded replacing the source,
@@ -529,6 +716,7 @@ class FadeTransform(Transform):
         start, end = self.starting_mobject, self.ending_mobject
         for m0, m1 in ((start[1], start[0]), (end[0], end[1])):
             self.ghost_to(m0, m1)
+        self.family_interpolation = None
 
     def ghost_to(self, source, target):
         """Replaces the source by the target and sets the opacity to 0."""
@@ -8,6 +8,7 @@ import itertools as it
 import operator as op
 import pathlib
 import time
+import weakref
 from functools import reduce
 from typing import Union
 
@@ -24,7 +25,7 @@ from ..mobject.types.point_cloud_mobject import PMobject
 from ..mobject.types.vectorized_mobject import VMobject
 from ..utils.color import color_to_int_rgba
 from ..utils.family import extract_mobject_family_members
-from ..utils.images import get_full_raster_image_path
+from ..utils.images import alpha_composite, get_full_raster_image_path
 from ..utils.iterables import list_difference_update
 from ..utils.simple_functions import fdiv
 from ..utils.space_ops import angle_of_vector
@@ -45,8 +46,16 @@ class Camera:
     pixel_height : :class:`int`, optional
         The height of the scene in pixels.
 
+    use_dirty_regions : :class:`bool`, optional
+        Whether :meth:`capture_mobjects_over_background` only redraws the region
+        of the frame covered by the mobjects, instead of the whole frame.
+
     """
 
+    # Cairo's default miter limit: the maximal length of a miter join, relative
+    # to the line width.
+    CAIRO_MITER_LIMIT = 10
+
     def __init__(
         self,
         background_image=None,
@@ -63,6 +72,7 @@ class Camera:
         frame_height=None,
         frame_width=None,
         frame_rate=None,
+        use_dirty_regions=True,
         **kwargs,
     ):
         """Initialises the Camera.
@@ -83,6 +93,11 @@ class Camera:
         self.cairo_line_width_multiple = cairo_line_width_multiple
         self.use_z_index = use_z_index
         self.background = background
+        self.use_dirty_regions = use_dirty_regions
+        # The background the pixel array was last reset to by
+        # capture_mobjects_over_background, the state of the frame at the time, and
+        # the region drawn over it. None when the pixel array was modified otherwise.
+        self.dirty_region = None
 
         if pixel_height is None:
             pixel_height = config["pixel_height"]
@@ -113,6 +128,9 @@ class Camera:
 
         self.rgb_max_val = np.iinfo(self.pixel_array_dtype).max
         self.pixel_array_to_cairo_context = {}
+        # The Cairo path of each VMobject drawn, with the points and the
+        # transformation matrix of the context it was built with.
+        self.cairo_path_cache = weakref.WeakKeyDictionary()
 
         # Contains the correct method to process a list of Mobjects of the
         # corresponding class.  If a Mobject is not an instance of a class in
@@ -310,6 +328,7 @@ class Camera:
         convert_from_floats : bool, optional
             Whether or not to convert float values to proper RGB values, by default False
         """
+        self.dirty_region = None
         converted_array = self.convert_pixel_array(pixel_array, convert_from_floats)
         if not (
             hasattr(self, "pixel_array")
@@ -484,10 +503,149 @@ class Camera:
         # VMobject], [PMobject, PMobject], and [VMobject].  This must be done
         # without altering their order.  it.groupby computes exactly this
         # partition while at the same time preserving order.
+        self.dirty_region = None
         mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
         for group_type, group in it.groupby(mobjects, self.type_or_raise):
             self.display_funcs[group_type](list(group), self.pixel_array)
 
+    def capture_mobjects_over_background(self, mobjects, background, **kwargs):
+        """Reset :attr:`pixel_array` to ``background`` and capture mobjects on it.
+
+        When called repeatedly with the same background, e.g. for each frame of an
+        animation with ``background`` being the static image of the scene, only the
+        region covered by the mobjects at the previous call and at this call is
+        reset and redrawn, so that a small mobject moving on a large frame does not
+        cost a full-frame copy.
+
+        Parameters
+        ----------
+        mobjects : List[:class:`~.Mobject`]
+            Mobjects to capture.
+        background : np.ndarray
+            The pixel array to draw the mobjects on. It must not be modified
+            in place between two calls.
+        kwargs : Any
+            Keyword arguments to be passed to :meth:`get_mobjects_to_display`.
+        """
+        mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
+        region = self.get_pixel_bounding_box(mobjects)
+        frame_state = self.get_frame_state()
+        previous = self.dirty_region
+        if (
+            not self.use_dirty_regions
+            or previous is None
+            or previous[0] is not background
+            or previous[1] != frame_state
+            or self.pixel_array.shape != background.shape
+        ):
+            self.set_frame_to_background(background)
+        else:
+            dirty_region = self.get_union_of_regions(previous[2], region)
+            if dirty_region is not None:
+                x0, y0, x1, y1 = dirty_region
+                self.pixel_array[y0:y1, x0:x1] = background[y0:y1, x0:x1]
+        # The mobjects are not clipped to the region: it bounds everything they
+        # draw, and Cairo only rasterizes the extents of each path anyway.
+        self.capture_mobjects(mobjects, include_submobjects=False)
+        self.dirty_region = (background, frame_state, region)
+
+    def get_frame_state(self):
+        """Returns the position and size of the frame, which determine where
+        mobjects are drawn in the pixel array.
+
+        Returns
+        -------
+        tuple
+            The center, width and height of the frame.
+        """
+        return (
+            tuple(self.frame_center),
+            self.frame_width,
+            self.frame_height,
+        )
+
+    def get_pixel_bounding_box(self, mobjects):
+        """Returns the region of the pixel array that capturing the given
+        mobjects can modify.
+
+        The region bounds the points of the mobjects, which contain their
+        Bézier curves, widened by their stroke widths (including miter joins)
+        and antialiasing.
+
+        Parameters
+        ----------
+        mobjects : List[:class:`~.Mobject`]
+            The mobjects to display, submobjects included.
+
+        Returns
+        -------
+        Optional[Tuple[int, int, int, int]]
+            The region as ``(x0, y0, x1, y1)``, clipped to the frame, or ``None``
+            if the mobjects are off screen or have no points.
+        """
+        pixels_per_unit = self.pixel_width / self.frame_width
+        x0 = y0 = np.inf
+        x1 = y1 = -np.inf
+        for mobject in mobjects:
+            points = mobject.points
+            if len(points) == 0:
+                continue
+            if isinstance(mobject, AbstractImageMobject):
+                # Add the bottom right corner to the three other ones.
+                points = np.vstack([points, points[1] + points[2] - points[0]])
+            coords = self.points_to_pixel_coords(mobject, points)
+            if isinstance(mobject, VMobject):
+                width = max(mobject.get_stroke_width(), mobject.get_stroke_width(True))
+                margin = (
+                    width
+                    * self.cairo_line_width_multiple
+                    * pixels_per_unit
+                    * self.CAIRO_MITER_LIMIT
+                    / 2
+                )
+            elif isinstance(mobject, PMobject):
+                margin = self.adjusted_thickness(mobject.stroke_width)
+            else:
+                margin = 0
+            # Antialiasing, and rounding of the pixel coordinates.
+            margin += 2
+            mins = coords.min(axis=0) - margin
+            maxs = coords.max(axis=0) + margin
+            x0 = min(x0, mins[0])
+            y0 = min(y0, mins[1])
+            x1 = max(x1, maxs[0])
+            y1 = max(y1, maxs[1])
+        x0, x1 = np.clip([x0, x1], 0, self.pixel_width)
+        y0, y1 = np.clip([y0, y1], 0, self.pixel_height)
+        if x0 >= x1 or y0 >= y1:
+            return None
+        return int(x0), int(y0), int(np.ceil(x1)), int(np.ceil(y1))
+
+    @staticmethod
+    def get_union_of_regions(region, other_region):
+        """Returns the smallest region containing two regions of the pixel array.
+
+        Parameters
+        ----------
+        region, other_region : Optional[Tuple[int, int, int, int]]
+            Regions as ``(x0, y0, x1, y1)``, or ``None`` for empty regions.
+
+        Returns
+        -------
+        Optional[Tuple[int, int, int, int]]
+            The union of both regions.
+        """
+        if region is None:
+            return other_region
+        if other_region is None:
+            return region
+        return (
+            min(region[0], other_region[0]),
+            min(region[1], other_region[1]),
+            max(region[2], other_region[2]),
+            max(region[3], other_region[3]),
+        )
+
     # Methods associated with svg rendering
 
     # NOTE: None of the methods below have been mentioned outside of their definitions. Their DocStrings are not as
@@ -642,16 +800,40 @@ class Camera:
             return
 
         ctx.new_path()
-        subpaths = vmobject.gen_subpaths_from_points_2d(points)
-        for subpath in subpaths:
-            quads = vmobject.gen_cubic_bezier_tuples_from_points(subpath)
+        matrix = ctx.get_matrix()
+        cached = self.cairo_path_cache.get(vmobject)
+        if cached is not None:
+            cached_points, cached_matrix, path = cached
+            if cached_matrix == matrix and np.array_equal(cached_points, points):
+                ctx.append_path(path)
+                return self
+
+        nppcc = vmobject.n_points_per_cubic_curve
+        points_2d = points[:, :2]
+        # Split the path where consecutive curves don't meet, with the same
+        # criterion as VMobject.consider_points_equals_2d.
+        rtol = 1.0e-5
+        atol = vmobject.tolerance_for_point_equality
+        starts = np.arange(nppcc, len(points), nppcc)
+        breaks = np.any(
+            np.abs(points_2d[starts - 1] - points_2d[starts])
+            > atol + rtol * np.abs(points_2d[starts]),
+            axis=1,
+        )
+        split_indices = [0, *starts[breaks].tolist(), len(points_2d)]
+        for i1, i2 in zip(split_indices, split_indices[1:]):
+            n_curves = (i2 - i1) // nppcc
+            if n_curves == 0:
+                continue
+            curves = points_2d[i1 : i1 + n_curves * nppcc].reshape((n_curves, -1))
             ctx.new_sub_path()
-            start = subpath[0]
-            ctx.move_to(*start[:2])
-            for p0, p1, p2, p3 in quads:
-                ctx.curve_to(*p1[:2], *p2[:2], *p3[:2])
-            if vmobject.consider_points_equals_2d(subpath[0], subpath[-1]):
+            ctx.move_to(*points_2d[i1].tolist())
+            # Converting to lists first avoids a lot of indexing of arrays.
+            for x1, y1, x2, y2, x3, y3 in curves[:, 2:].tolist():
+                ctx.curve_to(x1, y1, x2, y2, x3, y3)
+            if vmobject.consider_points_equals_2d(points_2d[i1], points_2d[i2 - 1]):
                 ctx.close_path()
+        self.cairo_path_cache[vmobject] = (np.array(points), matrix, ctx.copy_path())
         return self
 
     def set_cairo_context_color(self, ctx, rgbas, vmobject):
@@ -925,27 +1107,17 @@ class Camera:
 
         # TODO, there is no accounting for a shear...
 
-        # Paste into an image as large as the camera's pixel array
-        full_image = Image.fromarray(
-            np.zeros((self.pixel_height, self.pixel_width)), mode="RGBA"
-        )
+        # Paint on top of existing pixel array
         new_ul_coords = center_coords - np.array(sub_image.size) / 2
         new_ul_coords = new_ul_coords.astype(int)
-        full_image.paste(
-            sub_image,
-            box=(
-                new_ul_coords[0],
-                new_ul_coords[1],
-                new_ul_coords[0] + sub_image.size[0],
-                new_ul_coords[1] + sub_image.size[1],
-            ),
-        )
-        # Paint on top of existing pixel array
-        self.overlay_PIL_image(pixel_array, full_image)
+        alpha_composite(pixel_array, np.asarray(sub_image), offset=new_ul_coords)
 
     def overlay_rgba_array(self, pixel_array, new_array):
         """Overlays an RGBA array on top of the given Pixel array.
 
+        Only the smallest rectangle containing the pixels of ``new_array``
+        which are not fully transparent is composited.
+
         Parameters
         ----------
         pixel_array : np.array
@@ -953,7 +1125,16 @@ class Camera:
         new_array : np.array
             The new pixel array to overlay.
         """
-        self.overlay_PIL_image(pixel_array, self.get_image(new_array))
+        alpha = new_array[:, :, 3]
+        rows = np.flatnonzero(alpha.any(axis=1))
+        if len(rows) == 0:
+            return
+        cols = np.flatnonzero(alpha.any(axis=0))
+        alpha_composite(
+            pixel_array,
+            new_array[rows[0] : rows[-1] + 1, cols[0] : cols[-1] + 1],
+            offset=(cols[0], rows[0]),
+        )
 
     def overlay_PIL_image(self, pixel_array, image):
         """Overlays a PIL image on the passed pixel array.
@@ -965,9 +1146,7 @@ class Camera:
         image : PIL.Image
             The Image to overlay.
         """
-        pixel_array[:, :] = np.array(
-            Image.alpha_composite(self.get_image(pixel_array), image), dtype="uint8"
-        )
+        self.overlay_rgba_array(pixel_array, np.asarray(image))
 
     def adjust_out_of_range_points(self, points):
         """If any of the points in the passed array are out of
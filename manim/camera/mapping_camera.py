@@ -28,6 +28,8 @@ class MappingCamera(Camera):
         self.mapping_func = mapping_func
         self.min_num_curves = min_num_curves
         self.allow_object_intrusion = allow_object_intrusion
+        # Mobjects are not drawn where their points are.
+        kwargs.setdefault("use_dirty_regions", False)
         Camera.__init__(self, **kwargs)
 
     def points_to_pixel_coords(self, points):
@@ -78,6 +80,8 @@ class OldMultiCamera(Camera):
             )
             for camera_with_start_positions in cameras_with_start_positions
         ]
+        # Mobjects are drawn by the shifted cameras.
+        kwargs.setdefault("use_dirty_regions", False)
         Camera.__init__(self, **kwargs)
 
     def capture_mobjects(self, mobjects, **kwargs):
@@ -32,6 +32,8 @@ class MultiCamera(MovingCamera):
         self.allow_cameras_to_capture_their_own_display = (
             allow_cameras_to_capture_their_own_display
         )
+        # The displays of the sub cameras change without moving.
+        kwargs.setdefault("use_dirty_regions", False)
         MovingCamera.__init__(self, **kwargs)
 
     def add_image_mobject_from_camera(self, image_mobject_from_camera):
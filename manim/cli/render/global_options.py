@@ -78,4 +78,10 @@ global_options = option_group(
         help="Expand the window to its maximum possible size.",
         default=None,
     ),
+    option(
+        "--profile_updaters",
+        is_flag=True,
+        help="Time the updaters of the mobjects and log the slowest ones.",
+        default=None,
+    ),
 )
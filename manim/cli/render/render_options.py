@@ -90,6 +90,18 @@ render_options = option_group(
         help="Select a renderer for your Scene.",
         default=None,
     ),
+    option(
+        "--parallel",
+        is_flag=True,
+        help="Render the animations of the scene in several worker processes.",
+        default=None,
+    ),
+    option(
+        "--render_workers",
+        type=int,
+        help="Number of worker processes used by --parallel (0 for one per core).",
+        default=None,
+    ),
     option(
         "--use_opengl_renderer",
         is_flag=True,
@@ -1,7 +1,9 @@
 import copy
+import itertools as it
 import subprocess as sp
 import traceback
 import types
+from collections import OrderedDict
 from concurrent import futures
 
 import grpc
@@ -21,6 +23,12 @@ from ..gen import (
     renderserver_pb2_grpc,
 )
 
+# The maximum number of copies of keyframes kept in memory.
+KEYFRAME_COPY_CACHE_SIZE = 8
+
+# The maximum number of serialized mobjects kept in memory.
+SERIALIZED_MOBJECT_CACHE_SIZE = 4096
+
 
 class FrameServer(frameserver_pb2_grpc.FrameServerServicer):
     def __init__(self, server, input_file_path):
@@ -66,7 +74,7 @@ class FrameServer(frameserver_pb2_grpc.FrameServerServicer):
                 requested_scene = self.previous_scene
                 update_previous_scene = False
             else:
-                requested_scene = copy.deepcopy(self.keyframes[requested_scene_index])
+                requested_scene = self.get_keyframe_copy(requested_scene_index)
                 update_previous_scene = True
 
             requested_scene.update_to_time(animation_offset)
@@ -76,29 +84,17 @@ class FrameServer(frameserver_pb2_grpc.FrameServerServicer):
             animations = []
             updaters = []
             update_data = []
-            # TODO: Only remove/add changed mobjects rather than all of them.
-            if self.previous_scene is not None and (
-                request.first_request or self.previous_scene != requested_scene
-            ):
-                previous_mobjects = extract_mobject_family_members(
-                    self.previous_scene.mobjects, only_those_with_points=True
-                )
-                # Remove everything from the previous scene.
-                ids_to_remove = [
-                    mob.original_id
-                    for mob in previous_mobjects
-                    if not isinstance(mob, ValueTracker)
-                ]
-
             if request.first_request or self.previous_scene != requested_scene:
-                # Add everything from the requested scene.
-                mobjects_to_add = [
-                    serialize_mobject(mobject)
-                    for mobject in extract_mobject_family_members(
-                        requested_scene.mobjects, only_those_with_points=True
-                    )
-                    if not isinstance(mobject, ValueTracker)
-                ]
+                # Only send the mobjects which were removed, added or changed
+                # since the frame displayed by the frontend.
+                served_mobjects = get_served_mobjects(requested_scene.mobjects)
+                if request.first_request:
+                    ids_to_remove = self.serializer.clear_client()
+                else:
+                    ids_to_remove = self.serializer.remove_missing(served_mobjects)
+                mobjects_to_add, update_data = self.serializer.serialize_changes(
+                    served_mobjects
+                )
 
                 # Send animation and updater info.
                 all_animations_tweened = True
@@ -116,11 +112,14 @@ class FrameServer(frameserver_pb2_grpc.FrameServerServicer):
                         ]
                     else:
                         if animation.mobject is not None:
+                            tweened_mobjects = extract_mobject_family_members(
+                                animation.mobject, only_those_with_points=True
+                            )
+                            # The frontend animates these mobjects itself.
+                            self.serializer.forget(tweened_mobjects)
                             # Add offset vector to submobjects.
                             root_mobject_center = animation.mobject.get_center()
-                            for updated_mobject in extract_mobject_family_members(
-                                animation.mobject, only_those_with_points=True
-                            ):
+                            for updated_mobject in tweened_mobjects:
                                 mobject_tween_data_list.append(
                                     frameserver_pb2.Animation.MobjectTweenData(
                                         id=updated_mobject.original_id,
@@ -169,13 +168,11 @@ class FrameServer(frameserver_pb2_grpc.FrameServerServicer):
                     # Only send update data for animations that don't have tween data.
                     if generate_attribute_tween_data(animation) is None:
                         update_data.extend(
-                            [
-                                serialize_mobject(mobject)
-                                for mobject in extract_mobject_family_members(
-                                    animation.mobject, only_those_with_points=True
+                            it.chain(
+                                *self.serializer.serialize_changes(
+                                    get_served_mobjects([animation.mobject])
                                 )
-                                if not isinstance(mobject, ValueTracker)
-                            ]
+                            )
                         )
                 for (
                     updated_mobject,
@@ -185,13 +182,11 @@ class FrameServer(frameserver_pb2_grpc.FrameServerServicer):
                         # Only send update data for updaters that don't have tween data.
                         if generate_attribute_tween_data(updater) is None:
                             update_data.extend(
-                                [
-                                    serialize_mobject(mobject)
-                                    for mobject in extract_mobject_family_members(
-                                        updated_mobject, only_those_with_points=True
+                                it.chain(
+                                    *self.serializer.serialize_changes(
+                                        get_served_mobjects([updated_mobject])
                                     )
-                                    if not isinstance(mobject, ValueTracker)
-                                ]
+                                )
                             )
 
             resp = frameserver_pb2.FrameResponse(
@@ -258,12 +253,48 @@ class FrameServer(frameserver_pb2_grpc.FrameServerServicer):
 
     def generate_keyframe_data(self):
         self.keyframes = []
+        self.keyframe_copies = OrderedDict()
+        self.serializer = MobjectSerializer()
         self.previous_scene_index = None
         self.previous_scene = None
         self.renderer = WebGLRenderer(self)
         self.scene = self.scene_class(self.renderer)
         self.scene.render()
 
+    def get_keyframe_copy(self, index):
+        """A copy of a keyframe, to be updated to the requested times.
+
+        The copies of the most recently requested keyframes are kept, so that
+        scrubbing back and forth doesn't copy the keyframes over and over. The
+        mobjects of the copy keep the ids of the mobjects of the keyframe, which
+        are the same for all keyframes, so that the mobjects of consecutive
+        keyframes can be matched.
+
+        Parameters
+        ----------
+        index : :class:`int`
+            The index of the keyframe.
+
+        Returns
+        -------
+        :class:`~.Scene`
+            The copy of the keyframe.
+        """
+        if index in self.keyframe_copies:
+            self.keyframe_copies.move_to_end(index)
+            return self.keyframe_copies[index]
+        keyframe = self.keyframes[index]
+        copied_objects = {}
+        keyframe_copy = copy.deepcopy(keyframe, copied_objects)
+        for mobject in extract_mobject_family_members(keyframe.mobjects):
+            mobject_copy = copied_objects.get(id(mobject))
+            if mobject_copy is not None and hasattr(mobject, "original_id"):
+                mobject_copy.original_id = mobject.original_id
+        self.keyframe_copies[index] = keyframe_copy
+        if len(self.keyframe_copies) > KEYFRAME_COPY_CACHE_SIZE:
+            self.keyframe_copies.popitem(last=False)
+        return keyframe_copy
+
     def update_renderer_scene_data(self):
         # If a javascript renderer is running, notify it of the scene being served. If
         # not, spawn one and it will request the scene when it starts.
@@ -339,22 +370,153 @@ def animations_to_name(animations):
     return f"{str(animations[0].__class__.__name__)}..."
 
 
-def serialize_mobject(mobject):
+class MobjectSerializer:
+    """Serializes the mobjects sent to the frontend, and keeps track of the
+    version of each mobject displayed by the frontend, so that only the
+    mobjects which were added, removed or changed are sent to it.
+
+    Attributes
+    ----------
+    client_versions : Dict[:class:`str`, Optional[:class:`tuple`]]
+        The version of each mobject displayed by the frontend, by id, or
+        ``None`` if the frontend animates the mobject itself.
+    serialized_mobjects : OrderedDict[Tuple[:class:`str`, :class:`tuple`], MobjectData]
+        The most recently serialized mobjects, by id and version.
+    """
+
+    def __init__(self):
+        self.client_versions = {}
+        self.serialized_mobjects = OrderedDict()
+
+    def clear_client(self):
+        """Forgets all the mobjects displayed by the frontend, and returns their
+        ids."""
+        ids = list(self.client_versions)
+        self.client_versions = {}
+        return ids
+
+    def remove_missing(self, mobjects):
+        """Forgets the mobjects displayed by the frontend which are not among
+        the given mobjects, and returns their ids."""
+        ids = {mobject.original_id for mobject in mobjects}
+        removed_ids = [id_ for id_ in self.client_versions if id_ not in ids]
+        for id_ in removed_ids:
+            del self.client_versions[id_]
+        return removed_ids
+
+    def forget(self, mobjects):
+        """Marks mobjects as animated by the frontend, so that they are sent
+        again even if they didn't change."""
+        for mobject in mobjects:
+            if mobject.original_id in self.client_versions:
+                self.client_versions[mobject.original_id] = None
+
+    def serialize_changes(self, mobjects):
+        """Serializes the mobjects which are not displayed by the frontend, or
+        changed since they were last sent to it.
+
+        Parameters
+        ----------
+        mobjects : List[:class:`~.Mobject`]
+            The mobjects to send to the frontend.
+
+        Returns
+        -------
+        Tuple[List[MobjectData], List[MobjectData]]
+            The serialization of the new mobjects, and of the changed mobjects.
+        """
+        added = []
+        updated = []
+        for mobject in mobjects:
+            version = get_mobject_version(mobject)
+            client_version = self.client_versions.get(mobject.original_id)
+            if client_version == version:
+                continue
+            mob_proto = frameserver_pb2.MobjectData()
+            mob_proto.CopyFrom(self.get_serialized_mobject(mobject, version))
+            if isinstance(mobject, VMobject):
+                mob_proto.vectorized_mobject_data.needs_redraw = (
+                    client_version is None or client_version[0] != version[0]
+                )
+            if mobject.original_id in self.client_versions:
+                updated.append(mob_proto)
+            else:
+                added.append(mob_proto)
+            self.client_versions[mobject.original_id] = version
+        return added, updated
+
+    def get_serialized_mobject(self, mobject, version):
+        """The serialization of a mobject, reused if the same version of the
+        mobject was recently serialized."""
+        key = (mobject.original_id, version)
+        mob_proto = self.serialized_mobjects.get(key)
+        if mob_proto is not None:
+            self.serialized_mobjects.move_to_end(key)
+            return mob_proto
+        mob_proto = serialize_mobject(mobject)
+        self.serialized_mobjects[key] = mob_proto
+        if len(self.serialized_mobjects) > SERIALIZED_MOBJECT_CACHE_SIZE:
+            self.serialized_mobjects.popitem(last=False)
+        return mob_proto
+
+
+def get_served_mobjects(mobjects):
+    """The mobjects sent to the frontend for a list of mobjects, i.e. the
+    members of their families which have points, except value trackers."""
+    return [
+        mobject
+        for mobject in extract_mobject_family_members(
+            mobjects, only_those_with_points=True
+        )
+        if not isinstance(mobject, ValueTracker)
+    ]
+
+
+def get_mobject_version(mobject):
+    """A stamp of the data of a mobject sent to the frontend, which is cheap
+    to compute, to tell whether the mobject changed without serializing it.
+
+    Returns
+    -------
+    Tuple[:class:`tuple`, :class:`tuple`]
+        The stamp of the geometry of the mobject, which the frontend redraws
+        whenever it changes, and the stamp of its style.
+    """
+    if isinstance(mobject, VMobject):
+        # The colors sent are those of the first RGBA of the fill and stroke,
+        # whose arrays are compared rather than the converted colors.
+        return (
+            (mobject.points.shape, hash(mobject.points.tobytes())),
+            (
+                mobject.get_fill_rgbas()[0].tobytes(),
+                mobject.get_stroke_rgbas()[0].tobytes(),
+                float(mobject.get_stroke_width()),
+            ),
+        )
+    elif isinstance(mobject, ImageMobject):
+        mob_style = mobject.get_style()
+        return (
+            (
+                mobject.path,
+                float(mobject.height),
+                float(mobject.width),
+                tuple(mobject.get_center()),
+            ),
+            (mob_style["fill_color"], float(mob_style["fill_opacity"])),
+        )
+    return (), ()
+
+
+def serialize_mobject(mobject, needs_redraw=True):
     mob_proto = frameserver_pb2.MobjectData(id=mobject.original_id)
 
     if isinstance(mobject, VMobject):
-        needs_redraw = False
-        point_hash = hash(tuple(mobject.points.flatten()))
-        if mobject.point_hash != point_hash:
-            mobject.point_hash = point_hash
-            needs_redraw = True
         mob_proto.vectorized_mobject_data.needs_redraw = needs_redraw
-
-        for point in mobject.points:
-            point_proto = mob_proto.vectorized_mobject_data.points.add()
-            point_proto.x = point[0]
-            point_proto.y = point[1]
-            point_proto.z = point[2]
+        # The points are sent as a single array of float32, rather than as a
+        # message for each point.
+        mob_proto.vectorized_mobject_data.packed_points = mobject.points.astype(
+            "<f4"
+        ).tobytes()
 
         mob_style = mobject.get_style(simple=True)
         mob_proto.style.fill_color = mob_style["fill_color"]
@@ -11,7 +11,8 @@ import random
 import sys
 import types
 import warnings
-from functools import reduce
+import weakref
+from functools import reduce, wraps
 from math import ceil
 from pathlib import Path
 from typing import (
@@ -51,6 +52,7 @@ from ..utils.space_ops import (
     rotation_matrix,
     rotation_matrix_transpose,
 )
+from ..utils.updater_timings import time_updater_call
 from .opengl_compatibility import ConvertToOpenGL
 
 # TODO: Explain array_attrs
@@ -58,10 +60,105 @@ from .opengl_compatibility import ConvertToOpenGL
 Updater = Union[Callable[["Mobject"], None], Callable[["Mobject", float], None]]
 T = TypeVar("T", bound="Mobject")
 
+
 if TYPE_CHECKING:
     from ..animation.animation import Animation
 
 
+# Attribute values of these types are never modified in place, so shallow
+# copies of mobjects share them without inspecting them.
+_IMMUTABLE_TYPES = {int, float, bool, str, complex, type(None), Color}
+
+
+class _TrackedList(list):
+    """A list counting the changes made to all the lists of its class.
+
+    Any change to any list of a subclass, made in place or by assigning a new
+    list to a mobject, increments the ``generation`` of that subclass. Values
+    cached from such lists remain valid as long as their generation is
+    unchanged.
+    """
+
+    __slots__ = ()
+    generation = 0
+
+
+def _count_changes(method):
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        type(self).generation += 1
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+for _name in [
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+]:
+    setattr(_TrackedList, _name, _count_changes(getattr(list, _name)))
+del _name
+
+
+class _SubmobjectList(_TrackedList):
+    """The list of :attr:`~.Mobject.submobjects` of a :class:`~.Mobject`.
+
+    Its generation invalidates the families cached by
+    :meth:`~.Mobject.get_family`. Whether submobjects are changed through
+    :meth:`~.Mobject.add`, by assigning :attr:`~.Mobject.submobjects` or by
+    modifying the list in place, the families of all the ancestors of the
+    mobject are invalidated.
+    """
+
+    __slots__ = ()
+    generation = 0
+
+
+class _UpdaterList(_TrackedList):
+    """The list of :attr:`~.Mobject.updaters` of a :class:`~.Mobject`.
+
+    Its generation invalidates the values cached by
+    :attr:`~.Mobject.has_updaters`.
+    """
+
+    __slots__ = ()
+    generation = 0
+
+
+# Whether each updater takes a dt parameter, see _updater_uses_dt.
+_updaters_using_dt = weakref.WeakKeyDictionary()
+
+
+def _updater_uses_dt(updater: Updater) -> bool:
+    """Whether an updater takes a ``dt`` parameter.
+
+    The signature of each updater is only inspected once, usually when it is
+    added with :meth:`~.Mobject.add_updater`.
+    """
+    # The bound methods of an object are created anew at each access.
+    key = getattr(updater, "__func__", updater)
+    try:
+        return _updaters_using_dt[key]
+    except KeyError:
+        pass
+    except TypeError:
+        # Updaters which can't be weakly referenced are not cached.
+        return "dt" in get_parameters(updater)
+    uses_dt = "dt" in get_parameters(updater)
+    _updaters_using_dt[key] = uses_dt
+    return uses_dt
+
+
 class Mobject:
     """Mathematical Object: base class for objects that can be displayed on screen.
 
@@ -317,6 +414,8 @@ class Mobject:
         result = cls.__new__(cls)
         clone_from_id[id(self)] = result
         for k, v in self.__dict__.items():
+            if k in ["_family_cache", "_has_updaters_cache"]:
+                continue
             setattr(result, k, copy.deepcopy(v, clone_from_id))
         result.original_id = str(id(self))
         return result
@@ -327,6 +426,46 @@ class Mobject:
         else:
             return str(self.name)
 
+    @property
+    def submobjects(self) -> List["Mobject"]:
+        """The contained objects."""
+        return self._submobjects
+
+    @submobjects.setter
+    def submobjects(self, submobjects: Iterable["Mobject"]):
+        if not isinstance(submobjects, _SubmobjectList):
+            submobjects = _SubmobjectList(submobjects)
+        _SubmobjectList.generation += 1
+        self._submobjects = submobjects
+
+    @property
+    def updaters(self) -> List[Updater]:
+        """The update functions of this mobject, see :meth:`add_updater`."""
+        return self._updaters
+
+    @updaters.setter
+    def updaters(self, updaters: Iterable[Updater]):
+        if not isinstance(updaters, _UpdaterList):
+            updaters = _UpdaterList(updaters)
+        _UpdaterList.generation += 1
+        self._updaters = updaters
+
+    @property
+    def has_updaters(self) -> bool:
+        """Whether this mobject or any of its submobjects, recursively, has
+        updaters.
+
+        The result is cached until the updaters or the submobjects of any
+        mobject change.
+        """
+        generations = (_SubmobjectList.generation, _UpdaterList.generation)
+        cached = getattr(self, "_has_updaters_cache", None)
+        if cached is not None and cached[0] == generations:
+            return cached[1]
+        has_updaters = any(mob.updaters for mob in self.get_family())
+        self._has_updaters_cache = (generations, has_updaters)
+        return has_updaters
+
     def reset_points(self):
         """Sets :attr:`points` to be an empty array."""
         self.points = np.zeros((0, self.dim))
@@ -747,9 +886,20 @@ class Mobject:
             Path(config.get_dir("video_dir")).joinpath((name or str(self)) + ".png")
         )
 
-    def copy(self: T) -> T:
+    def copy(self: T, shallow: bool = False) -> T:
         """Create and return an identical copy of the :class:`Mobject` including all :attr:`submobjects`.
 
+        Parameters
+        ----------
+        shallow
+            If ``True``, only the structure of the mobject is copied: the
+            mobjects of its family, their numpy arrays such as :attr:`points`,
+            and their attributes referring to mobjects of the family, also
+            through lists, tuples and dictionaries. Other attributes are shared
+            with the original. Values referenced several times are copied
+            once. This is much faster than a deep copy, and is used by
+            animations for their starting and target mobjects.
+
         Returns
         -------
         :class:`Mobject`
@@ -759,7 +909,50 @@ class Mobject:
         ----
         The clone is initially not visible in the Scene, even if the original was.
         """
-        return copy.deepcopy(self)
+        if not shallow:
+            return copy.deepcopy(self)
+
+        family = self.get_family()
+        copies = {}
+        for mob in family:
+            result = mob.__class__.__new__(mob.__class__)
+            copies[id(mob)] = result
+
+        # Values referenced several times are copied once, as by a deep copy.
+        copied_values = {}
+
+        def copy_value(value):
+            if type(value) in _IMMUTABLE_TYPES:
+                return value
+            if isinstance(value, Mobject):
+                return copies.get(id(value), value)
+            result = copied_values.get(id(value))
+            if result is not None:
+                return result
+            if isinstance(value, np.ndarray):
+                # Read-only arrays can't be modified in place, so they are shared.
+                result = value.copy() if value.flags.writeable else value
+            elif type(value) in (list, tuple):
+                result = type(value)(map(copy_value, value))
+            elif type(value) is dict:
+                result = {key: copy_value(item) for key, item in value.items()}
+            else:
+                result = value
+            copied_values[id(value)] = result
+            return result
+
+        for mob in family:
+            result = copies[id(mob)]
+            result.__dict__.update(mob.__dict__)
+            for k, v in mob.__dict__.items():
+                if type(v) not in _IMMUTABLE_TYPES:
+                    result.__dict__[k] = copy_value(v)
+            result.__dict__.pop("_family_cache", None)
+            result.__dict__.pop("_has_updaters_cache", None)
+            result.submobjects = [copies[id(sm)] for sm in mob.submobjects]
+            result.updaters = list(mob.updaters)
+            result.original_id = str(id(mob))
+        return copies[id(self)]
 
     def generate_target(self, use_deepcopy=False):
         self.target = None  # Prevent unbounded linear recursion
@@ -794,14 +987,15 @@ class Mobject:
         :meth:`get_updaters`
 
         """
-        if self.updating_suspended:
+        if self.updating_suspended or not self.has_updaters:
             return self
+        profile_updaters = config.profile_updaters
         for updater in self.updaters:
-            parameters = get_parameters(updater)
-            if "dt" in parameters:
-                updater(self, dt)
+            args = (self, dt) if _updater_uses_dt(updater) else (self,)
+            if profile_updaters:
+                time_updater_call(updater, *args)
             else:
-                updater(self)
+                updater(*args)
         if recursive:
             for submob in self.submobjects:
                 submob.update(dt, recursive)
@@ -823,7 +1017,7 @@ class Mobject:
         :meth:`has_time_based_updater`
 
         """
-        return [updater for updater in self.updaters if "dt" in get_parameters(updater)]
+        return [updater for updater in self.updaters if _updater_uses_dt(updater)]
 
     def has_time_based_updater(self) -> bool:
         """Test if ``self`` has a time based updater.
@@ -838,10 +1032,7 @@ class Mobject:
         :meth:`get_time_based_updaters`
 
         """
-        for updater in self.updaters:
-            if "dt" in get_parameters(updater):
-                return True
-        return False
+        return any(_updater_uses_dt(updater) for updater in self.updaters)
 
     def get_updaters(self) -> List[Updater]:
         """Return all updaters.
@@ -923,6 +1114,8 @@ class Mobject:
         :class:`~.UpdateFromFunc`
         """
 
+        # Inspect the signature of the updater now rather than at each frame.
+        _updater_uses_dt(update_function)
         if index is None:
             self.updaters.append(update_function)
         else:
@@ -1852,11 +2045,17 @@ class Mobject:
         ]
 
     def get_merged_array(self, array_attr):
-        result = getattr(self, array_attr)
-        for submob in self.submobjects:
-            result = np.append(result, submob.get_merged_array(array_attr), axis=0)
-            submob.get_merged_array(array_attr)
-        return result
+        arrays = []
+
+        def collect(mobject):
+            arrays.append(getattr(mobject, array_attr))
+            for submob in mobject.submobjects:
+                collect(submob)
+
+        collect(self)
+        if len(arrays) == 1:
+            return arrays[0]
+        return np.concatenate(arrays, axis=0)
 
     def get_all_points(self):
         return self.get_merged_array("points")
@@ -1898,15 +2097,17 @@ class Mobject:
             max_y_3 = sample.get_extremum_along_dim(dim=1, key=1)
 
         """
-        result = np.zeros(self.dim)
         all_points = self.get_points_defining_boundary()
         if len(all_points) == 0:
-            return result
-        for dim in range(self.dim):
-            result[dim] = self.get_extremum_along_dim(
-                all_points, dim=dim, key=direction[dim]
-            )
-        return result
+            return np.zeros(self.dim)
+        # Same as get_extremum_along_dim, for all the dimensions at once.
+        all_points = all_points[:, : self.dim]
+        mins = np.min(all_points, axis=0)
+        maxs = np.max(all_points, axis=0)
+        direction = np.asarray(direction)[: self.dim]
+        return np.where(
+            direction < 0, mins, np.where(direction == 0, (mins + maxs) / 2, maxs)
+        ).astype(float)
 
     # Pseudonyms for more general get_critical_point method
 
@@ -2143,9 +2344,16 @@ class Mobject:
             else:
                 return [self]
         else:
+            # The family is cached until the submobjects of any mobject change.
+            generation = _SubmobjectList.generation
+            cached = getattr(self, "_family_cache", None)
+            if cached is not None and cached[0] == generation and cached[1][0] is self:
+                return list(cached[1])
             sub_families = list(map(Mobject.get_family, self.submobjects))
             all_mobjects = [self] + list(it.chain(*sub_families))
-            return remove_list_redundancies(all_mobjects)
+            family = remove_list_redundancies(all_mobjects)
+            self._family_cache = (generation, family)
+            return list(family)
 
     def family_members_with_points(self):
         return [m for m in self.get_family() if m.get_num_points() > 0]
@@ -33,6 +33,7 @@ from ..utils.space_ops import (
     normalize,
     rotation_matrix_transpose,
 )
+from ..utils.updater_timings import time_updater_call
 
 
 class OpenGLMobject:
@@ -841,10 +842,16 @@ class OpenGLMobject:
     def update(self, dt=0, recurse=True):
         if not self.has_updaters or self.updating_suspended:
             return self
-        for updater in self.time_based_updaters:
-            updater(self, dt)
-        for updater in self.non_time_updaters:
-            updater(self)
+        if config.profile_updaters:
+            for updater in self.time_based_updaters:
+                time_updater_call(updater, self, dt)
+            for updater in self.non_time_updaters:
+                time_updater_call(updater, self)
+        else:
+            for updater in self.time_based_updaters:
+                updater(self, dt)
+            for updater in self.non_time_updaters:
+                updater(self)
         if recurse:
             for submob in self.submobjects:
                 submob.update(dt, recurse)
@@ -182,7 +182,7 @@ from ...mobject.types.opengl_vectorized_mobject import (
 from ...utils.color import BLACK
 from ...utils.deprecation import deprecated
 from ...utils.strings import split_string_list_to_isolate_substrings
-from ...utils.tex_file_writing import tex_to_svg_file
+from ...utils.tex_file_writing import tex_to_svg_file, tex_to_svg_files
 from .style_utils import parse_style
 
 # from ...utils.tex import TexTemplate
@@ -399,6 +399,16 @@ class OpenGLMathTex(OpenGLSingleStringMathTex):
         self.tex_environment = tex_environment
         tex_strings = self.break_up_tex_strings(tex_strings)
         self.tex_strings = tex_strings
+        # Compile the whole string and the substrings compiled by
+        # break_up_by_substrings at once.
+        tex_to_svg_files(
+            [
+                self.get_modified_expression(tex_string)
+                for tex_string in [self.arg_separator.join(tex_strings), *tex_strings]
+            ],
+            environment=self.tex_environment,
+            tex_template=self.tex_template,
+        )
         OpenGLSingleStringMathTex.__init__(
             self,
             self.arg_separator.join(tex_strings),
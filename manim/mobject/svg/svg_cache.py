@@ -0,0 +1,304 @@
+"""Cache of the mobjects generated from SVG files.
+
+The same SVG files are parsed over and over: each :class:`~.Tex`,
+:class:`~.MathTex` or :class:`~.Text` with a known string reuses the SVG file
+of a previous run, but still has to parse it into mobjects, which takes much
+longer than compiling the string in the first place. The mobjects generated
+from an SVG file are kept in memory, so that generating them again is a copy,
+and the mobjects generated from the files of the Tex and text directories are
+also saved to an ``.npz`` file next to the SVG file, to be reused by later
+runs.
+
+Cached mobjects are looked up by a hash of the content of the SVG file and of
+the parameters of the parsing, so that a cache entry is never reused for a
+modified file.
+"""
+
+__all__ = ["get_svg_cache_key", "load_svg_mobjects", "save_svg_mobjects"]
+
+
+import hashlib
+import json
+import os
+import sys
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from colour import Color, RGB_equivalence
+
+from ... import __version__, config, logger
+from ...utils.hashing import KEYS_TO_FILTER_OUT
+from ..mobject import Mobject
+
+# The maximum number of SVG files whose mobjects are kept in memory.
+SVG_MEMORY_CACHE_SIZE = 256
+
+# Version of the format of the cache files, to be incremented whenever the
+# encoding of the mobjects changes.
+_CACHE_FORMAT_VERSION = 1
+
+# The mobjects generated from each SVG file, as the submobjects of a container,
+# so that they can be copied together.
+_memory_cache: "OrderedDict[str, Mobject]" = OrderedDict()
+
+
+class _UnsupportedValue(Exception):
+    """Raised when a mobject can't be saved to a cache file."""
+
+
+def get_svg_cache_key(file_path: str, parameters: Sequence[Any]) -> str:
+    """The key of the mobjects generated from an SVG file.
+
+    Parameters
+    ----------
+    file_path
+        The path of the SVG file.
+    parameters
+        Everything besides the content of the file that the generated mobjects
+        depend on. Their ``repr`` must not change from one run to the next.
+
+    Returns
+    -------
+    :class:`str`
+        A hash of the content of the file, of the parameters and of the version
+        of manim.
+    """
+    hasher = hashlib.sha256()
+    with open(file_path, "rb") as svg_file:
+        hasher.update(svg_file.read())
+    hasher.update(repr((__version__, _CACHE_FORMAT_VERSION, *parameters)).encode())
+    return hasher.hexdigest()[:32]
+
+
+def load_svg_mobjects(file_path: str, key: str) -> Optional[List[Mobject]]:
+    """Copies of the cached mobjects generated from an SVG file, or ``None`` if
+    they are not cached.
+
+    Parameters
+    ----------
+    file_path
+        The path of the SVG file.
+    key
+        The key returned by :func:`get_svg_cache_key`.
+    """
+    container = _memory_cache.get(key)
+    if container is not None:
+        _memory_cache.move_to_end(key)
+    else:
+        cache_file = _get_cache_file(file_path, key)
+        if cache_file is None or not os.path.exists(cache_file):
+            return None
+        container = Mobject()
+        try:
+            container.submobjects = _read_cache_file(cache_file)
+        except Exception as exception:
+            logger.debug(f"Could not read the SVG cache file {cache_file}: {exception}")
+            return None
+        _remember(key, container)
+    return container.copy(shallow=True).submobjects
+
+
+def save_svg_mobjects(file_path: str, key: str, mobjects: List[Mobject]) -> None:
+    """Cache the mobjects generated from an SVG file.
+
+    The mobjects are copied, so that they can be modified afterwards without
+    altering the cache. The mobjects which can't be encoded, e.g. because they
+    have updaters, are only cached in memory.
+
+    Parameters
+    ----------
+    file_path
+        The path of the SVG file.
+    key
+        The key returned by :func:`get_svg_cache_key`.
+    mobjects
+        The mobjects generated from the file.
+    """
+    container = Mobject()
+    container.submobjects = mobjects
+    _remember(key, container.copy(shallow=True))
+    cache_file = _get_cache_file(file_path, key)
+    if cache_file is None or os.path.exists(cache_file):
+        return
+    try:
+        _write_cache_file(cache_file, mobjects)
+    except (_UnsupportedValue, OSError) as exception:
+        logger.debug(f"Could not write the SVG cache file {cache_file}: {exception}")
+
+
+def _remember(key: str, container: Mobject) -> None:
+    _memory_cache[key] = container
+    _memory_cache.move_to_end(key)
+    while len(_memory_cache) > SVG_MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+
+
+def _get_cache_file(file_path: str, key: str) -> Optional[str]:
+    """The cache file of an SVG file, or ``None`` if the mobjects generated from
+    this file are only cached in memory.
+
+    Only the SVG files generated by manim are cached on disk, so that no cache
+    files are added to the directories of the user.
+    """
+    directory = os.path.dirname(os.path.realpath(file_path))
+    for cache_dir in ("tex_dir", "text_dir"):
+        try:
+            if directory == os.path.realpath(config.get_dir(cache_dir)):
+                return os.path.join(directory, f"{key}.npz")
+        except (KeyError, ValueError):
+            continue
+    return None
+
+
+def _write_cache_file(cache_file: str, mobjects: List[Mobject]) -> None:
+    """Save mobjects to an ``.npz`` file.
+
+    The arrays of the mobjects are concatenated into one array of the file for
+    each data type, as reading each array of an ``.npz`` file has a large
+    overhead, and everything else is stored as a JSON document, so that the
+    file can be loaded without pickle.
+    Objects referenced several times, e.g. a color used for both the fill and
+    the stroke of a mobject, are encoded once and then referenced by index, so
+    that the loaded mobjects share the same objects, and have the same hash.
+    """
+    arrays: Dict[str, List[np.ndarray]] = {}
+    array_sizes: Dict[str, int] = {}
+    entries: List[dict] = []
+    # Indices of the mobjects, and of the other objects, in the order they
+    # are first encountered, which is also the order they are decoded in.
+    mobject_indices: Dict[int, int] = {}
+    object_indices: Dict[int, int] = {}
+    pending_mobjects: List[Mobject] = []
+
+    def encode(value: Any) -> Any:
+        if value is None or type(value) in (bool, int, float, str):
+            return value
+        if isinstance(value, Mobject):
+            index = mobject_indices.get(id(value))
+            if index is None:
+                index = mobject_indices[id(value)] = len(mobject_indices)
+                pending_mobjects.append(value)
+            return {"mobject": index}
+        index = object_indices.get(id(value))
+        if index is not None:
+            return {"ref": index}
+        object_indices[id(value)] = len(object_indices)
+        if isinstance(value, (np.ndarray, np.generic)):
+            if value.dtype.hasobject:
+                raise _UnsupportedValue("array of objects")
+            dtype = value.dtype.str
+            offset = array_sizes.get(dtype, 0)
+            arrays.setdefault(dtype, []).append(np.ravel(value))
+            array_sizes[dtype] = offset + value.size
+            kind = "array" if isinstance(value, np.ndarray) else "scalar"
+            return {kind: [dtype, offset, list(value.shape)]}
+        if type(value) is Color:
+            if value.equality is not RGB_equivalence:
+                raise _UnsupportedValue("color with a custom equality")
+            return {"color": list(value.hsl)}
+        if isinstance(value, list):
+            return {"list": [encode(item) for item in value]}
+        if type(value) is tuple:
+            return {"tuple": [encode(item) for item in value]}
+        if type(value) is dict and all(type(key) is str for key in value):
+            return {"dict": [[key, encode(item)] for key, item in value.items()]}
+        raise _UnsupportedValue(f"value of type {type(value).__qualname__}")
+
+    roots = [encode(mobject)["mobject"] for mobject in mobjects]
+    # The attributes of the mobjects are encoded one mobject after the other,
+    # rather than recursively, so that they can be decoded in the same order.
+    while len(entries) < len(pending_mobjects):
+        mobject = pending_mobjects[len(entries)]
+        cls = type(mobject)
+        if not cls.__module__.startswith("manim."):
+            raise _UnsupportedValue(f"{cls.__qualname__} is not a manim class")
+        entries.append(
+            {
+                "class": [cls.__module__, cls.__qualname__],
+                "attrs": [
+                    [name, encode(value)]
+                    for name, value in mobject.__dict__.items()
+                    if name not in KEYS_TO_FILTER_OUT
+                ],
+            }
+        )
+    state = json.dumps(
+        {"roots": roots, "mobjects": entries, "dtypes": list(arrays)},
+    )
+    buffers = {
+        f"buffer_{index}": np.concatenate(arrays[dtype])
+        for index, dtype in enumerate(arrays)
+    }
+    # Write to a temporary file first, so that other processes never read a
+    # partial cache file.
+    temporary_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        with open(temporary_file, "wb") as npz_file:
+            np.savez(npz_file, state=np.array(state), **buffers)
+        os.replace(temporary_file, cache_file)
+    finally:
+        if os.path.exists(temporary_file):
+            os.remove(temporary_file)
+
+
+def _read_cache_file(cache_file: str) -> List[Mobject]:
+    """Load the mobjects saved by :func:`_write_cache_file`."""
+    with np.load(cache_file, allow_pickle=False) as npz_file:
+        state = json.loads(str(npz_file["state"]))
+        buffers = {
+            dtype: npz_file[f"buffer_{index}"]
+            for index, dtype in enumerate(state["dtypes"])
+        }
+
+    mobjects = []
+    for entry in state["mobjects"]:
+        module_name, class_name = entry["class"]
+        # Only classes that are already imported are looked up, so that loading
+        # a cache file never imports anything.
+        cls = sys.modules[module_name]
+        for name in class_name.split("."):
+            cls = getattr(cls, name)
+        if not (isinstance(cls, type) and issubclass(cls, Mobject)):
+            raise TypeError(f"{class_name} is not a mobject class")
+        mobjects.append(cls.__new__(cls))
+
+    objects: List[Any] = []
+
+    def decode(value: Any) -> Any:
+        if not isinstance(value, dict):
+            return value
+        ((kind, content),) = value.items()
+        if kind == "mobject":
+            return mobjects[content]
+        if kind == "ref":
+            return objects[content]
+        index = len(objects)
+        objects.append(None)
+        if kind in ("array", "scalar"):
+            dtype, offset, shape = content
+            size = int(np.prod(shape))
+            decoded = buffers[dtype][offset : offset + size].reshape(shape)
+            if kind == "scalar":
+                decoded = decoded[()]
+        elif kind == "color":
+            decoded = Color()
+            decoded.hsl = content
+        elif kind == "list":
+            decoded = [decode(item) for item in content]
+        elif kind == "tuple":
+            decoded = tuple(decode(item) for item in content)
+        elif kind == "dict":
+            decoded = {key: decode(item) for key, item in content}
+        else:
+            raise ValueError(f"Unknown value of kind {kind}")
+        objects[index] = decoded
+        return decoded
+
+    for mobject, entry in zip(mobjects, state["mobjects"]):
+        mobject.__dict__.update((name, decode(value)) for name, value in entry["attrs"])
+        # Wrap the lists of submobjects and updaters, keeping the order of the
+        # attributes, which is hashed.
+        mobject.submobjects = mobject.__dict__.get("_submobjects", [])
+        mobject.updaters = mobject.__dict__.get("_updaters", [])
+    return [mobjects[index] for index in state["roots"]]
@@ -22,6 +22,7 @@ from ...mobject.geometry import Circle, Line, Rectangle, RoundedRectangle
 from ...mobject.types.vectorized_mobject import VMobject
 from ..opengl_compatibility import ConvertToOpenGL
 from .style_utils import cascade_element_style, parse_style
+from .svg_cache import get_svg_cache_key, load_svg_mobjects, save_svg_mobjects
 from .svg_path import SVGPathMobject, string_to_numbers
 
 
@@ -132,6 +133,32 @@ class SVGMobject(VMobject, metaclass=ConvertToOpenGL):
         the SVGMobject's points from XML tags, populating self.mobjects, and
         any submobjects within self.mobjects.
         """
+        if config.renderer == "opengl":
+            self.parse_svg_file()
+            return
+        cls = type(self)
+        cache_key = get_svg_cache_key(
+            self.file_path,
+            (
+                f"{cls.__module__}.{cls.__qualname__}",
+                sorted(self.generate_style().items()),
+                self.unpack_groups,
+                sorted(self.path_string_config.items()),
+            ),
+        )
+        mobjects = load_svg_mobjects(self.file_path, cache_key)
+        if mobjects is not None:
+            self.add(*mobjects)
+            return
+        self.parse_svg_file()
+        save_svg_mobjects(self.file_path, cache_key, self.submobjects)
+
+    init_points = generate_points
+
+    def parse_svg_file(self):
+        """Parses the SVG file, and adds the mobjects generated from its
+        elements as submobjects.
+        """
         doc = minidom_parse(self.file_path)
         for svg in doc.getElementsByTagName("svg"):
             mobjects = self.get_mobjects_from(svg, self.generate_style())
@@ -141,8 +168,6 @@ class SVGMobject(VMobject, metaclass=ConvertToOpenGL):
                 self.add(*mobjects[0].submobjects)
         doc.unlink()
 
-    init_points = generate_points
-
     def get_mobjects_from(
         self,
         element: MinidomElement,
@@ -5,8 +5,9 @@ __all__ = ["SVGPathMobject", "string_to_numbers"]
 
 
 import re
+from collections import OrderedDict
 from math import *
-from typing import List
+from typing import List, Optional, Tuple
 
 import numpy as np
 
@@ -183,6 +184,62 @@ def elliptical_arc_to_cubic_bezier(x1, y1, rx, ry, phi, fA, fS, x2, y2):
     return bezier_points
 
 
+def elliptical_arcs_to_cubic_bezier(numbers, is_relative, start_point, dim=3):
+    """Generate cubic bezier points to approximate the elliptical arcs of an SVG
+    ``A`` command.
+
+    Parameters
+    ----------
+    numbers : List[:class:`float`]
+        The parameters of the arcs, seven numbers per arc.
+    is_relative : :class:`bool`
+        Whether the end points of the arcs are relative to their start points.
+    start_point : :class:`numpy.ndarray`
+        The start point of the first arc.
+    dim : :class:`int`
+        The dimension of the generated points.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        The handles and anchors of the cubic bezier curves, three points per
+        curve.
+    """
+    result = np.zeros((0, dim))
+    last_end_point = None
+    for elliptic_numbers in grouped(numbers, 7):
+        # The startpoint changes with each iteration.
+        if last_end_point is not None:
+            start_point = last_end_point
+
+        # We have to handle offsets here because ellipses are complicated.
+        if is_relative:
+            elliptic_numbers[5] += start_point[0]
+            elliptic_numbers[6] += start_point[1]
+
+        # If the endpoints (x1, y1) and (x2, y2) are identical, then this
+        # is equivalent to omitting the elliptical arc segment entirely.
+        # for more information of where this math came from visit:
+        #  http://www.w3.org/TR/SVG11/implnote.html#ArcImplementationNotes
+        if (
+            start_point[0] == elliptic_numbers[5]
+            and start_point[1] == elliptic_numbers[6]
+        ):
+            continue
+
+        result = np.append(
+            result,
+            elliptical_arc_to_cubic_bezier(*start_point[:2], *elliptic_numbers),
+            axis=0,
+        )
+
+        # We store the endpoint so that it can be the startpoint for the
+        # next iteration.
+        last_end_point = elliptic_numbers[5:]
+
+    return result
+
+
 def string_to_numbers(num_string: str) -> List[float]:
     """Parse the SVG string representing a sequence of numbers into an array of floats.
 
@@ -211,11 +268,207 @@ def string_to_numbers(num_string: str) -> List[float]:
     return float_results
 
 
+# The maximum number of path strings whose points are kept in memory.
+PARSED_PATHS_CACHE_SIZE = 4096
+
+# The points generated from the most recently parsed path strings, along with the
+# start of their last subpath. Text and Tex mobjects are made of the outlines of
+# their glyphs, so that the same path strings are parsed for each occurrence of
+# a character.
+_parsed_paths: "OrderedDict[Tuple[type, str], Tuple[np.ndarray, Optional[np.ndarray]]]" = (
+    OrderedDict()
+)
+
+
 def grouped(iterable, n):
     """Group iterable into arrays of n items."""
     return (np.array(v) for v in zip(*[iter(iterable)] * n))
 
 
+# A path command, a number, or any other character which is not a separator.
+_PATH_TOKEN_RE = re.compile(
+    r"([A-Za-z])|([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)|([^\s,])"
+)
+
+# The number of points of each command, which are made relative to the end of
+# the previous command at once.
+_POINTS_PER_COMMAND = {"M": 1, "L": 1, "T": 1, "C": 3, "S": 2, "Q": 2}
+
+
+def path_string_to_points(path_string):
+    """Generate the points of the cubic bezier curves described by an SVG
+    ``d`` attribute, in a single pass over the path string.
+
+    This gives the same points as :meth:`SVGPathMobject.handle_command` with
+    four points per cubic curve, but builds them as a list of coordinates
+    converted to an array once, instead of appending them to the points of
+    the mobject one curve at a time.
+
+    Parameters
+    ----------
+    path_string : :class:`str`
+        The ``d`` attribute of an SVG path element.
+
+    Returns
+    -------
+    Tuple[:class:`numpy.ndarray`, Optional[:class:`numpy.ndarray`]]
+        The points of the path, and the start of its last subpath, or ``None``
+        if the path has no subpath.
+
+    Raises
+    ------
+    :class:`ValueError`
+        If the path string is malformed, or uses a command in a way that is
+        only supported by :meth:`SVGPathMobject.handle_command`.
+    """
+    commands = []
+    numbers = None
+    for command, number, other in _PATH_TOKEN_RE.findall(path_string):
+        if number:
+            if numbers is None:
+                raise ValueError("The path string does not start with a command")
+            numbers.append(float(number))
+        elif command:
+            numbers = []
+            commands.append((command, numbers))
+        else:
+            raise ValueError(f"Unexpected character {other!r} in the path string")
+    if commands and commands[0][0] not in "Mm":
+        raise ValueError("The path string does not start with a moveto command")
+
+    points = []
+    current_path_start = None
+    # The interpolation parameters of the points of a line, and the weights of
+    # the handles of a cubic curve equivalent to a quadratic curve, as in
+    # VMobject.add_line_to and VMobject.add_quadratic_bezier_curve_to.
+    line_weights = [(alpha, 1 - alpha) for alpha in np.linspace(0, 1, 4)[1:].tolist()]
+    two_thirds = 2 / 3
+    one_third = 1 / 3
+
+    def add_cubic_bezier_curve_to(handle1, handle2, anchor):
+        if len(points) % 4 == 1:
+            points.extend((handle1, handle2, anchor))
+        else:
+            points.extend((points[-1], handle1, handle2, anchor))
+
+    def add_quadratic_bezier_curve_to(handle, anchor):
+        last = points[-1]
+        add_cubic_bezier_curve_to(
+            tuple(two_thirds * h + one_third * l for h, l in zip(handle, last)),
+            tuple(two_thirds * h + one_third * a for h, a in zip(handle, anchor)),
+            anchor,
+        )
+
+    def add_line_to(point):
+        lx, ly, lz = points[-1]
+        px, py, pz = point
+        add_cubic_bezier_curve_to(
+            *(
+                (b * lx + a * px, b * ly + a * py, b * lz + a * pz)
+                for a, b in line_weights
+            )
+        )
+
+    prev_command = None
+    for command, numbers in commands:
+        is_relative = command.islower()
+        command = command.upper()
+        start_point = points[-1] if points else (0.0, 0.0, 0.0)
+
+        # Produce the (absolute) coordinates of the controls and handles
+        if command == "A":
+            new_points = [
+                tuple(point)
+                for point in elliptical_arcs_to_cubic_bezier(
+                    numbers, is_relative, np.array(start_point)
+                ).tolist()
+            ]
+        elif command in "HV":
+            x, y, z = start_point
+            new_points = []
+            for number in numbers:
+                if not is_relative:
+                    new_points.append(
+                        (number, y, 0.0) if command == "H" else (x, number, 0.0)
+                    )
+                    continue
+                if command == "H":
+                    x, y, z = number + x, 0.0 + y, 0.0 + z
+                else:
+                    x, y, z = 0.0 + x, number + y, 0.0 + z
+                new_points.append((x, y, z))
+        elif command in _POINTS_PER_COMMAND:
+            entries = _POINTS_PER_COMMAND[command]
+            if len(numbers) % (2 * entries):
+                raise ValueError(f"Unexpected number of coordinates for {command}")
+            if not is_relative:
+                new_points = [
+                    (numbers[i], numbers[i + 1], 0.0) for i in range(0, len(numbers), 2)
+                ]
+            else:
+                # Each control / target point is calculated relative to the
+                # ending position of the previous curve.
+                new_points = []
+                ox, oy, oz = start_point
+                for i in range(0, len(numbers), 2):
+                    new_points.append((numbers[i] + ox, numbers[i + 1] + oy, 0.0 + oz))
+                    if len(new_points) % entries == 0:
+                        ox, oy, oz = new_points[-1]
+        elif command == "Z":
+            if numbers:
+                raise ValueError("Unexpected coordinates for Z")
+        else:
+            raise ValueError(f"Unknown path command {command}")
+
+        if command == "M":  # moveto
+            if not new_points:
+                raise ValueError("Missing coordinates for M")
+            current_path_start = new_points[0]
+            points.append(current_path_start)
+            for point in new_points[1:]:
+                add_line_to(point)
+        elif command in "HVL":  # lineto of any kind
+            for point in new_points:
+                add_line_to(point)
+        elif command in "CA":  # Cubic, elliptical arc
+            for i in range(0, len(new_points), 3):
+                add_cubic_bezier_curve_to(*new_points[i : i + 3])
+        elif command == "S":  # Smooth cubic
+            prev_handle = start_point
+            if prev_command in "CS":
+                prev_handle = points[-2]
+            for i in range(0, len(new_points), 2):
+                new_handle = tuple(2 * s - h for s, h in zip(start_point, prev_handle))
+                add_cubic_bezier_curve_to(new_handle, new_points[i], new_points[i + 1])
+                start_point = new_points[i + 1]
+                prev_handle = new_points[i]
+        elif command == "Q":  # quadratic Bezier curve
+            for i in range(0, len(new_points), 2):
+                add_quadratic_bezier_curve_to(new_points[i], new_points[i + 1])
+        elif command == "T":  # smooth quadratic
+            prev_quad_handle = start_point
+            if prev_command in "QT":
+                # because of the conversion from quadratic to cubic,
+                # our actual previous handle was 3/2 in the direction of p[-2] from p[-1]
+                prev_quad_handle = tuple(
+                    1.5 * h - 0.5 * a for h, a in zip(points[-2], points[-1])
+                )
+            for point in new_points:
+                new_quad_handle = tuple(
+                    2 * s - h for s, h in zip(start_point, prev_quad_handle)
+                )
+                add_quadratic_bezier_curve_to(new_quad_handle, point)
+                start_point = point
+                prev_quad_handle = new_quad_handle
+        elif command == "Z":  # closepath
+            add_line_to(current_path_start)
+        prev_command = command
+
+    if current_path_start is not None:
+        current_path_start = np.array(current_path_start)
+    return np.array(points, dtype=float).reshape((-1, 3)), current_path_start
+
+
 class SVGPathMobject(VMobject, metaclass=ConvertToOpenGL):
     def __init__(self, path_string, **kwargs):
         self.path_string = path_string
@@ -253,6 +506,50 @@ class SVGPathMobject(VMobject, metaclass=ConvertToOpenGL):
 
     def generate_points(self):
         """Generates points from a given an SVG ``d`` attribute."""
+        if config["renderer"] != "opengl":
+            self.generate_points_from_cache()
+        else:
+            self.parse_path_string()
+        # people treat y-coordinate differently
+        self.rotate(np.pi, RIGHT, about_point=ORIGIN)
+
+    init_points = generate_points
+
+    def generate_points_from_cache(self):
+        """Generates the points of the path string, reusing the points generated
+        for an identical path string if possible."""
+        key = (type(self), self.path_string)
+        parsed_path = _parsed_paths.get(key)
+        if parsed_path is not None:
+            _parsed_paths.move_to_end(key)
+            points, current_path_start = parsed_path
+            self.points = points.copy()
+            if current_path_start is not None:
+                self.current_path_start = current_path_start.copy()
+            return
+        self.parse_path_string()
+        _parsed_paths[key] = (
+            self.points.copy(),
+            self.__dict__.get("current_path_start"),
+        )
+        if len(_parsed_paths) > PARSED_PATHS_CACHE_SIZE:
+            _parsed_paths.popitem(last=False)
+
+    def parse_path_string(self):
+        """Adds the points described by the path string."""
+        if config["renderer"] != "opengl" and self.n_points_per_cubic_curve == 4:
+            try:
+                points, current_path_start = path_string_to_points(self.path_string)
+            except ValueError:
+                # Malformed path strings are handled, or reported, by the
+                # parsing of each command below.
+                pass
+            else:
+                if len(points):
+                    self.points = points
+                if current_path_start is not None:
+                    self.current_path_start = current_path_start
+                return
         pattern = "[%s]" % ("".join(self.get_path_commands()))
         pairs = list(
             zip(
@@ -272,10 +569,6 @@ class SVGPathMobject(VMobject, metaclass=ConvertToOpenGL):
             if self.should_remove_null_curves:
                 # Get rid of any null curves
                 self.set_points(self.get_points_without_null_curves())
-        # people treat y-coordinate differently
-        self.rotate(np.pi, RIGHT, about_point=ORIGIN)
-
-    init_points = generate_points
 
     def handle_command(self, command, coord_string, prev_command):
         """Core logic for handling each of the various path commands."""
@@ -385,39 +678,9 @@ class SVGPathMobject(VMobject, metaclass=ConvertToOpenGL):
 
         # arcs are weirdest, handle them first.
         if command == "A":
-            result = np.zeros((0, self.dim))
-            last_end_point = None
-            for elliptic_numbers in grouped(numbers, 7):
-                # The startpoint changes with each iteration.
-                if last_end_point is not None:
-                    start_point = last_end_point
-
-                # We have to handle offsets here because ellipses are complicated.
-                if is_relative:
-                    elliptic_numbers[5] += start_point[0]
-                    elliptic_numbers[6] += start_point[1]
-
-                # If the endpoints (x1, y1) and (x2, y2) are identical, then this
-                # is equivalent to omitting the elliptical arc segment entirely.
-                # for more information of where this math came from visit:
-                #  http://www.w3.org/TR/SVG11/implnote.html#ArcImplementationNotes
-                if (
-                    start_point[0] == elliptic_numbers[5]
-                    and start_point[1] == elliptic_numbers[6]
-                ):
-                    continue
-
-                result = np.append(
-                    result,
-                    elliptical_arc_to_cubic_bezier(*start_point[:2], *elliptic_numbers),
-                    axis=0,
-                )
-
-                # We store the endpoint so that it can be the startpoint for the
-                # next iteration.
-                last_end_point = elliptic_numbers[5:]
-
-            return result
+            return elliptical_arcs_to_cubic_bezier(
+                numbers, is_relative, start_point, self.dim
+            )
 
         # H and V expect a sequence of single coords, not coord pairs like the rest of the commands.
         elif command == "H":
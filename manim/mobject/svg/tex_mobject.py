@@ -36,7 +36,7 @@ from ...mobject.svg.svg_path import SVGPathMobject
 from ...mobject.types.vectorized_mobject import VectorizedPoint, VGroup
 from ...utils.color import BLACK, WHITE
 from ...utils.tex import TexTemplate
-from ...utils.tex_file_writing import tex_to_svg_file
+from ...utils.tex_file_writing import tex_to_svg_file, tex_to_svg_files
 from .style_utils import parse_style
 
 TEX_MOB_SCALE_FACTOR = 0.05
@@ -255,6 +255,19 @@ class MathTex(SingleStringMathTex):
         self.brace_notation_split_occurred = False
         self.tex_strings = self.break_up_tex_strings(tex_strings)
         try:
+            # Compile the whole string and the substrings compiled by
+            # break_up_by_substrings at once.
+            tex_to_svg_files(
+                [
+                    self.get_modified_expression(tex_string)
+                    for tex_string in [
+                        self.arg_separator.join(self.tex_strings),
+                        *self.tex_strings,
+                    ]
+                ],
+                environment=self.tex_environment,
+                tex_template=self.tex_template,
+            )
             SingleStringMathTex.__init__(
                 self,
                 self.arg_separator.join(self.tex_strings),
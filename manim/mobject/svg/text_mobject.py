@@ -67,6 +67,7 @@ from ...constants import *
 from ...mobject.geometry import Dot
 from ...mobject.svg.svg_mobject import SVGMobject
 from ...mobject.types.vectorized_mobject import VGroup
+from ...utils.bezier import interpolate
 from ...utils.color import WHITE, Colors
 
 TEXT_MOB_SCALE_FACTOR = 0.05
@@ -106,6 +107,57 @@ def remove_invisible_chars(mobject):
     return mobject_without_dots
 
 
+def _close_subpaths(mobject, nppc):
+    """Adds a line from the end of each subpath of a glyph to its start.
+
+    Parameters
+    ----------
+    mobject : :class:`~.VMobject`
+        A glyph of a text.
+    nppc : :class:`int`
+        The number of points per curve of the glyph.
+    """
+    points = mobject.get_points()
+    if len(points) == 0:
+        return
+    if config.renderer != "opengl" and len(points) % nppc == 0:
+        # A subpath ends at each curve that the next curve does not start at,
+        # and at the last curve.
+        curves = points.reshape((-1, nppc, points.shape[1]))
+        ends = np.append(
+            np.flatnonzero(np.any(curves[:-1, -1] != curves[1:, 0], axis=1)),
+            len(curves) - 1,
+        )
+        starts = np.insert(ends[:-1] + 1, 0, 0)
+        end_points = curves[ends, -1]
+        start_points = curves[starts, 0]
+        # The same lines as VMobject.add_line_to.
+        lines = np.stack(
+            [end_points]
+            + [
+                interpolate(end_points, start_points, alpha)
+                for alpha in np.linspace(0, 1, nppc)[1:]
+            ],
+            axis=1,
+        )
+        mobject.points = np.insert(curves, ends + 1, lines, axis=0).reshape(
+            (-1, points.shape[1])
+        )
+        return
+    last = points[0]
+    mobject.clear_points()
+    for index, point in enumerate(points):
+        mobject.append_points([point])
+        if (
+            index != len(points) - 1
+            and (index + 1) % nppc == 0
+            and any(point != points[index + 1])
+        ):
+            mobject.add_line_to(last)
+            last = points[index + 1]
+    mobject.add_line_to(last)
+
+
 class Paragraph(VGroup):
     r"""Display a paragraph of text.
 
@@ -486,21 +538,7 @@ class Text(SVGMobject):
         else:
             nppc = self.n_points_per_cubic_curve
         for each in self:
-            if len(each.get_points()) == 0:
-                continue
-            points = each.get_points()
-            last = points[0]
-            each.clear_points()
-            for index, point in enumerate(points):
-                each.append_points([point])
-                if (
-                    index != len(points) - 1
-                    and (index + 1) % nppc == 0
-                    and any(point != points[index + 1])
-                ):
-                    each.add_line_to(last)
-                    last = points[index + 1]
-            each.add_line_to(last)
+            _close_subpaths(each, nppc)
         if self.t2c:
             self.set_color_by_t2c()
         if self.gradient:
@@ -1050,21 +1088,7 @@ class MarkupText(SVGMobject):
         else:
             nppc = self.n_points_per_cubic_curve
         for each in self:
-            if len(each.get_points()) == 0:
-                continue
-            points = each.get_points()
-            last = points[0]
-            each.clear_points()
-            for index, point in enumerate(points):
-                each.append_points([point])
-                if (
-                    index != len(points) - 1
-                    and (index + 1) % nppc == 0
-                    and any(point != points[index + 1])
-                ):
-                    each.add_line_to(last)
-                    last = points[index + 1]
-            each.add_line_to(last)
+            _close_subpaths(each, nppc)
 
         if self.gradient:
             self.set_color_by_gradient(*self.gradient)
@@ -27,6 +27,8 @@ from ...mobject.mobject import Mobject
 from ...mobject.three_d_utils import get_3d_vmob_gradient_start_and_end_points
 from ...utils.bezier import (
     bezier,
+    bezier_weights,
+    get_bezier_split_matrices,
     get_smooth_handle_points,
     integer_interpolate,
     interpolate,
@@ -1103,6 +1105,84 @@ class VMobject(Mobject):
         for n in range(num_curves):
             yield self.get_nth_curve_function_with_length(n, **kwargs)
 
+    def get_curve_lengths(self) -> np.ndarray:
+        """Gets the approximate lengths of the curves of the mobject.
+
+        The lengths are computed as in :meth:`get_nth_curve_function_with_length`,
+        with the default number of sample points. They are cached until the
+        points of the mobject change.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The lengths of the curves.
+        """
+        points = self.points
+        cached = getattr(self, "_curve_lengths_cache", None)
+        if cached is not None and np.array_equal(cached[0], points):
+            return cached[1]
+
+        nppcc = self.n_points_per_cubic_curve
+        num_curves = self.get_num_curves()
+        curves = points[: nppcc * num_curves].reshape((num_curves, nppcc, self.dim))
+        samples = np.matmul(bezier_weights(nppcc, np.linspace(0, 1, 10)), curves)
+        lengths = np.linalg.norm(np.diff(samples, axis=1), axis=2).sum(axis=1)
+        lengths.setflags(write=False)
+        self._curve_lengths_cache = (points.copy(), lengths)
+        return lengths
+
+    def points_from_proportions(self, alphas: typing.Iterable[float]) -> np.ndarray:
+        """Gets the points at several proportions along the path of the
+        :class:`VMobject`.
+
+        This is equivalent to calling :meth:`point_from_proportion` for each
+        proportion, but finds all the points at once.
+
+        Parameters
+        ----------
+        alphas
+            The proportions along the the path of the :class:`VMobject`.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The points on the :class:`VMobject`, one per proportion.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            If one of the ``alphas`` is not between 0 and 1.
+        :exc:`Exception`
+            If the :class:`VMobject` has no points.
+        """
+        alphas = np.asarray(alphas, dtype=float).reshape(-1)
+        invalid = (alphas < 0) | (alphas > 1)
+        if invalid.any():
+            raise ValueError(f"Alpha {alphas[invalid][0]} not between 0 and 1.")
+
+        self.throw_error_if_no_points()
+        lengths = self.get_curve_lengths()
+        ends = np.cumsum(lengths)
+        if len(ends) == 0:
+            return np.repeat(self.points[-1:], len(alphas), axis=0)
+
+        # The point at each proportion lies on the first curve ending past it.
+        target_lengths = alphas * ends[-1]
+        indices = np.searchsorted(ends, target_lengths).clip(max=len(ends) - 1)
+        curve_lengths = lengths[indices]
+        residues = np.divide(
+            target_lengths - (ends[indices] - curve_lengths),
+            curve_lengths,
+            out=np.zeros_like(target_lengths),
+            where=curve_lengths != 0,
+        )
+        nppcc = self.n_points_per_cubic_curve
+        curves = self.points[: nppcc * len(ends)].reshape((len(ends), nppcc, -1))
+        weights = bezier_weights(nppcc, residues)
+        points = np.einsum("ij,ijk->ik", weights, curves[indices])
+        points[alphas == 1] = self.points[-1]
+        return points
+
     def point_from_proportion(self, alpha: float) -> np.ndarray:
         """Gets the point at a proportion along the path of the :class:`VMobject`.
 
@@ -1122,6 +1202,10 @@ class VMobject(Mobject):
             If ``alpha`` is not between 0 and 1.
         :exc:`Exception`
             If the :class:`VMobject` has no points.
+
+        See Also
+        --------
+        :meth:`points_from_proportions`
         """
 
         if alpha < 0 or alpha > 1:
@@ -1131,21 +1215,7 @@ class VMobject(Mobject):
         if alpha == 1:
             return self.get_points()[-1]
 
-        curves_and_lengths = tuple(self.get_curve_functions_with_lengths())
-
-        target_length = alpha * np.sum(length for _, length in curves_and_lengths)
-        current_length = 0
-
-        for curve, length in curves_and_lengths:
-            if current_length + length >= target_length:
-                if length != 0:
-                    residue = (target_length - current_length) / length
-                else:
-                    residue = 0
-
-                return curve(residue)
-
-            current_length += length
+        return self.points_from_proportions([alpha])[0]
 
     def get_anchors_and_handles(self) -> typing.Iterable[np.ndarray]:
         """Returns anchors1, handles1, handles2, anchors2,
@@ -1192,13 +1262,17 @@ class VMobject(Mobject):
         """
         if self.points.shape[0] == 1:
             return self.points
-        return np.array(
-            list(it.chain(*zip(self.get_start_anchors(), self.get_end_anchors())))
-        )
+        start_anchors = self.get_start_anchors()
+        end_anchors = self.get_end_anchors()
+        n_curves = min(len(start_anchors), len(end_anchors))
+        anchors = np.empty((2 * n_curves, self.points.shape[1]), self.points.dtype)
+        anchors[0::2] = start_anchors[:n_curves]
+        anchors[1::2] = end_anchors[:n_curves]
+        return anchors
 
     def get_points_defining_boundary(self):
         # Probably returns all anchors, but this is weird regarding  the name of the method.
-        return np.array(list(it.chain(*[sm.get_anchors() for sm in self.get_family()])))
+        return np.concatenate([sm.get_anchors() for sm in self.get_family()])
 
     def get_arc_length(self, sample_points_per_curve: Optional[int] = None) -> float:
         """Return the approximated length of the whole curve.
@@ -1214,6 +1288,9 @@ class VMobject(Mobject):
             The length of the :class:`VMobject`.
         """
 
+        if sample_points_per_curve is None:
+            return np.sum(self.get_curve_lengths())
+
         return np.sum(
             length
             for _, length in self.get_curve_functions_with_lengths(
@@ -1308,11 +1385,13 @@ class VMobject(Mobject):
             Points generated.
         """
 
+        nppcc = self.n_points_per_cubic_curve
         if len(points) == 1:
-            nppcc = self.n_points_per_cubic_curve
             return np.repeat(points, nppcc * n, 0)
         bezier_quads = self.get_cubic_bezier_tuples_from_points(points)
         curr_num = len(bezier_quads)
+        if curr_num == 0:
+            return np.zeros((0, self.dim))
         target_num = curr_num + n
         # This is an array with values ranging from 0
         # up to curr_num,  with repeats such that
@@ -1325,18 +1404,18 @@ class VMobject(Mobject):
         # that the nth curve of our path should be split
         # into k pieces.  In the above example, this would
         # be [2, 1, 2, 1, 2, 1, 2, 1, 2, 1]
-        split_factors = [sum(repeat_indices == i) for i in range(curr_num)]
-        new_points = np.zeros((0, self.dim))
-        for quad, sf in zip(bezier_quads, split_factors):
-            # What was once a single cubic curve defined
-            # by "quad" will now be broken into sf
-            # smaller cubic curves
-            alphas = np.linspace(0, 1, sf + 1)
-            for a1, a2 in zip(alphas, alphas[1:]):
-                new_points = np.append(
-                    new_points, partial_bezier_points(quad, a1, a2), axis=0
-                )
-        return new_points
+        split_factors = np.bincount(repeat_indices, minlength=curr_num)
+        # Index of the first of the new curves replacing each curve
+        first_pieces = np.cumsum(split_factors) - split_factors
+
+        new_quads = np.zeros((target_num, nppcc, bezier_quads.shape[2]))
+        # All the curves split into the same number of pieces are split at once.
+        for sf in np.unique(split_factors[split_factors > 0]):
+            indices = np.flatnonzero(split_factors == sf)
+            split_matrices = get_bezier_split_matrices(nppcc, sf)
+            pieces = np.matmul(split_matrices, bezier_quads[indices, np.newaxis])
+            new_quads[first_pieces[indices, np.newaxis] + np.arange(sf)] = pieces
+        return new_quads.reshape((-1, new_quads.shape[2]))
 
     def align_rgbas(self, vmobject):
         attrs = ["fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"]
@@ -1400,8 +1479,9 @@ class VMobject(Mobject):
         if a <= 0 and b >= 1:
             self.set_points(vmobject.points)
             return self
-        bezier_quads = vmobject.get_cubic_bezier_tuples()
-        num_cubics = len(bezier_quads)
+        nppcc = vmobject.n_points_per_cubic_curve
+        points = vmobject.points
+        num_cubics = len(points) // nppcc
 
         # The following two lines will compute which bezier curves of the given mobject need to be processed.
         # The residue basically indicates de proportion of the selected bezier curve that have to be selected.
@@ -1409,23 +1489,25 @@ class VMobject(Mobject):
         lower_index, lower_residue = integer_interpolate(0, num_cubics, a)
         upper_index, upper_residue = integer_interpolate(0, num_cubics, b)
 
-        self.clear_points()
         if num_cubics == 0:
+            self.clear_points()
             return self
+        lower_quad = points[nppcc * lower_index : nppcc * (lower_index + 1)]
+        upper_quad = points[nppcc * upper_index : nppcc * (upper_index + 1)]
         if lower_index == upper_index:
-            self.append_points(
-                partial_bezier_points(
-                    bezier_quads[lower_index], lower_residue, upper_residue
-                )
+            self.set_points(
+                partial_bezier_points(lower_quad, lower_residue, upper_residue)
             )
         else:
-            self.append_points(
-                partial_bezier_points(bezier_quads[lower_index], lower_residue, 1)
-            )
-            for quad in bezier_quads[lower_index + 1 : upper_index]:
-                self.append_points(quad)
-            self.append_points(
-                partial_bezier_points(bezier_quads[upper_index], 0, upper_residue)
+            # The curves between the first and the last are copied at once.
+            self.set_points(
+                np.concatenate(
+                    [
+                        partial_bezier_points(lower_quad, lower_residue, 1),
+                        points[nppcc * (lower_index + 1) : nppcc * upper_index],
+                        partial_bezier_points(upper_quad, 0, upper_residue),
+                    ]
+                )
             )
         return self
 
@@ -1,3 +1,4 @@
+import functools
 import time
 import typing
 
@@ -10,7 +11,9 @@ from ..camera.camera import Camera
 from ..mobject.mobject import Mobject
 from ..scene.scene_file_writer import SceneFileWriter
 from ..utils.exceptions import EndSceneEarlyException
+from ..utils.file_ops import is_png_format, write_to_movie
 from ..utils.iterables import list_update
+from ..utils.parallel import ForkedWorkerPool, fork_is_available, get_worker_count
 
 
 def handle_play_like_call(func):
@@ -74,15 +77,42 @@ class CairoRenderer:
         self._original_skipping_status = skip_animations
         self.skip_animations = skip_animations
         self.animations_hashes = []
+        # The hashes of the play calls already rendered, or being rendered by a
+        # worker, in this scene.
+        self.rendered_hashes = set()
         self.num_plays = 0
         self.time = 0
         self.static_image = None
+        self.worker_pool = None
+        self.frames_rendered_by_worker = False
 
     def init_scene(self, scene):
         self.file_writer = self._file_writer_class(
             self,
             scene.__class__.__name__,
         )
+        if config["parallel"]:
+            self.worker_pool = self.create_worker_pool()
+
+    def create_worker_pool(self):
+        """Create the pool of worker processes used to render play calls in parallel.
+
+        Returns
+        -------
+        Optional[:class:`~.ForkedWorkerPool`]
+            The worker pool, or ``None`` if the play calls of this scene cannot be
+            rendered in parallel and have to be rendered sequentially.
+        """
+        if not fork_is_available():
+            logger.warning(
+                "Parallel rendering requires fork(), which is not available "
+                "on this platform. Rendering sequentially."
+            )
+            return None
+        if not write_to_movie() or is_png_format():
+            logger.info("Parallel rendering only applies to movie files.")
+            return None
+        return ForkedWorkerPool(get_worker_count())
 
     def play(self, scene, *args, **kwargs):
         # Reset skip_animations to the original state.
@@ -103,12 +133,19 @@ class CairoRenderer:
                 hash_current_animation = get_hash_from_play_call(
                     scene, self.camera, scene.animations, scene.mobjects
                 )
-                if self.file_writer.is_already_cached(hash_current_animation):
+                if (
+                    hash_current_animation in self.rendered_hashes
+                    or self.file_writer.is_already_cached(hash_current_animation)
+                ):
                     logger.info(
                         f"Animation {self.num_plays} : Using cached data (hash : %(hash_current_animation)s)",
                         {"hash_current_animation": hash_current_animation},
                     )
                     self.skip_animations = True
+                else:
+                    # A later identical play call reuses this partial movie file,
+                    # instead of writing to it concurrently.
+                    self.rendered_hashes.add(hash_current_animation)
         # adding None as a partial movie file will make file_writer ignore the latter.
         self.file_writer.add_partial_movie_file(hash_current_animation)
         self.animations_hashes.append(hash_current_animation)
@@ -117,21 +154,138 @@ class CairoRenderer:
             {"h": str(self.animations_hashes[:5])},
         )
 
-        # Save a static image, to avoid rendering non moving objects.
-        self.static_image = self.save_static_frame_data(scene, scene.static_mobjects)
+        if self.worker_pool is not None and not self.skip_animations:
+            self.play_in_worker(scene)
+        else:
+            self.render_play(scene)
 
-        self.file_writer.begin_animation(not self.skip_animations)
+        self.num_plays += 1
+
+    def render_play(self, scene, frame_range=None, file_path=None):
+        """Render the frames of the current play call into its partial movie file.
+
+        Parameters
+        ----------
+        scene : Scene
+            The scene played.
+        frame_range : Tuple[int, int], optional
+            If given, only the frames with index in ``[start, end)`` are rendered.
+        file_path : str, optional
+            The movie file to write to, instead of the partial movie file of the
+            play call.
+        """
+        if self.skip_animations:
+            # Nothing is written for a skipped or cached play call, it only has to
+            # bring the scene to its final state.
+            self.static_image = None
+        else:
+            # Save a static image, to avoid rendering non moving objects.
+            self.static_image = self.save_static_frame_data(
+                scene, scene.static_mobjects
+            )
+
+        static_frames = None
+        if scene.is_current_animation_frozen_frame():
+            static_frames = self.get_num_frozen_frames(scene.duration)
+        self.file_writer.begin_animation(
+            not self.skip_animations,
+            file_path=file_path,
+            static_frames=static_frames,
+        )
         scene.begin_animations()
         if scene.is_current_animation_frozen_frame():
-            self.update_frame(scene)
+            if not self.skip_animations:
+                self.update_frame(scene)
             # self.duration stands for the total run time of all the animations.
             # In this case, as there is only a wait, it will be the length of the wait.
             self.freeze_current_frame(scene.duration)
         else:
-            scene.play_internal()
+            scene.play_internal(frame_range=frame_range)
         self.file_writer.end_animation(not self.skip_animations)
 
-        self.num_plays += 1
+    def play_in_worker(self, scene):
+        """Render the current play call in worker processes.
+
+        Workers are forked at the play boundary, so they start from the exact
+        state of the scene and write the partial movie file of this play call.
+        Long play calls are split into contiguous frame ranges, each rendered
+        into its own shard file by a separate worker (see
+        :meth:`get_frame_ranges`). Meanwhile, the main process only advances the
+        scene to the end of the play call, without rasterizing any frame, and goes
+        on with ``construct``.
+
+        Parameters
+        ----------
+        scene : Scene
+            The scene played.
+        """
+
+        def render_partial_movie_file(frame_range=None, file_path=None):
+            config["progress_bar"] = "none"
+            self.worker_pool = None
+            self.render_play(scene, frame_range=frame_range, file_path=file_path)
+
+        frame_ranges = self.get_frame_ranges(scene)
+        if frame_ranges is None:
+            self.worker_pool.submit(
+                render_partial_movie_file,
+                description=f"animation {self.num_plays}",
+            )
+        else:
+            shard_files = self.file_writer.add_partial_movie_shards(len(frame_ranges))
+            for i, (frame_range, shard_file) in enumerate(
+                zip(frame_ranges, shard_files)
+            ):
+                self.worker_pool.submit(
+                    functools.partial(
+                        render_partial_movie_file, frame_range, shard_file
+                    ),
+                    description=f"animation {self.num_plays} (shard {i})",
+                )
+
+        scene.begin_animations()
+        if scene.is_current_animation_frozen_frame():
+            self.time += (
+                self.get_num_frozen_frames(scene.duration) / self.camera.frame_rate
+            )
+            return
+        self.frames_rendered_by_worker = True
+        try:
+            scene.play_internal()
+        finally:
+            self.frames_rendered_by_worker = False
+
+    def get_frame_ranges(self, scene):
+        """Split the frames of the current play call into contiguous ranges, to be
+        rendered by separate workers.
+
+        A play call is split only if every range gets at least
+        ``config.min_frames_per_shard`` frames.
+
+        Parameters
+        ----------
+        scene : Scene
+            The scene played.
+
+        Returns
+        -------
+        Optional[List[Tuple[int, int]]]
+            The ``(start, end)`` frame index of each range, or ``None`` if the play
+            call is rendered by a single worker.
+        """
+        min_frames = config["min_frames_per_shard"]
+        if (
+            not min_frames
+            or scene.is_current_animation_frozen_frame()
+            or scene.stop_condition is not None
+        ):
+            return None
+        num_frames = len(scene.get_frame_times(scene.duration))
+        num_shards = min(self.worker_pool.max_workers, num_frames // min_frames)
+        if num_shards < 2:
+            return None
+        bounds = np.linspace(0, num_frames, num_shards + 1).astype(int)
+        return [(int(start), int(end)) for start, end in zip(bounds[:-1], bounds[1:])]
 
     def update_frame(  # TODO Description in Docstring
         self,
@@ -160,6 +314,14 @@ class CairoRenderer:
         """
         if self.skip_animations and not ignore_skipping:
             return
+        kwargs["include_submobjects"] = include_submobjects
+        if mobjects and self.static_image is not None:
+            # Only the moving mobjects are drawn over the static image: redraw
+            # the region of the frame they cover.
+            self.camera.capture_mobjects_over_background(
+                mobjects, self.static_image, **kwargs
+            )
+            return
         if not mobjects:
             mobjects = list_update(
                 scene.mobjects,
@@ -170,12 +332,17 @@ class CairoRenderer:
         else:
             self.camera.reset()
 
-        kwargs["include_submobjects"] = include_submobjects
         self.camera.capture_mobjects(mobjects, **kwargs)
 
     def render(self, scene, time, moving_mobjects):
+        if self.frames_rendered_by_worker or self.skip_animations:
+            # The frame is written by a worker process, or not written at all:
+            # only keep the time in sync.
+            self.time += 1 / self.camera.frame_rate
+            return
         self.update_frame(scene, moving_mobjects)
-        self.add_frame(self.get_frame())
+        # The file writer copies the frame, no need to copy the pixel array here.
+        self.add_frame(self.camera.pixel_array)
 
     def get_frame(self):
         """
@@ -204,8 +371,7 @@ class CairoRenderer:
         self.time += num_frames * dt
         if self.skip_animations:
             return
-        for _ in range(num_frames):
-            self.file_writer.write_frame(frame)
+        self.file_writer.write_frame(frame, num_frames=num_frames)
 
     def freeze_current_frame(self, duration: float):
         """Adds a static frame to the movie for a given duration. The static frame is the current frame.
@@ -215,12 +381,27 @@ class CairoRenderer:
         duration : float
             [description]
         """
-        dt = 1 / self.camera.frame_rate
         self.add_frame(
-            self.get_frame(),
-            num_frames=int(duration / dt),
+            self.camera.pixel_array,
+            num_frames=self.get_num_frozen_frames(duration),
         )
 
+    def get_num_frozen_frames(self, duration: float) -> int:
+        """Get the number of frames a static frame is shown for a given duration.
+
+        Parameters
+        ----------
+        duration : float
+            The duration the frame is shown, in seconds.
+
+        Returns
+        -------
+        int
+            The number of frames.
+        """
+        dt = 1 / self.camera.frame_rate
+        return int(duration / dt)
+
     def show_frame(self):
         """
         Opens the current frame in the Default Image Viewer
@@ -273,6 +454,8 @@ class CairoRenderer:
                 raise EndSceneEarlyException()
 
     def scene_finished(self, scene):
+        if self.worker_pool is not None:
+            self.worker_pool.join()
         # If no animations in scene, render an image instead
         if self.num_plays:
             self.file_writer.finish()
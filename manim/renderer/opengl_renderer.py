@@ -1,3 +1,4 @@
+import collections
 import itertools as it
 import time
 
@@ -5,7 +6,7 @@ import moderngl
 import numpy as np
 from PIL import Image
 
-from manim import config
+from manim import config, logger
 from manim.renderer.cairo_renderer import handle_play_like_call
 from manim.utils.caching import handle_caching_play
 from manim.utils.color import color_to_rgba
@@ -16,6 +17,7 @@ from ..mobject.opengl_mobject import OpenGLMobject, OpenGLPoint
 from ..mobject.types.opengl_vectorized_mobject import OpenGLVMobject
 from ..scene.scene_file_writer import SceneFileWriter
 from ..utils import opengl
+from ..utils.iterables import batch_by_property
 from ..utils.simple_functions import clip
 from ..utils.space_ops import (
     angle_of_vector,
@@ -25,7 +27,7 @@ from ..utils.space_ops import (
     rotation_matrix_transpose_from_quaternion,
 )
 from .opengl_renderer_window import Window
-from .shader import Mesh, Shader
+from .shader import Mesh, Shader, get_vertex_array_cache
 from .vectorized_mobject_rendering import (
     render_opengl_vectorized_mobject_fill,
     render_opengl_vectorized_mobject_stroke,
@@ -235,6 +237,11 @@ class OpenGLRenderer:
         # Initialize texture map.
         self.path_to_texture_id = {}
 
+        # Pixel buffer objects the frames are read into asynchronously, see
+        # begin_frame_readback.
+        self.pending_pixel_buffers = collections.deque()
+        self.free_pixel_buffers = []
+
     def init_scene(self, scene):
         self.partial_movie_files = []
         self.file_writer = self._file_writer_class(
@@ -249,7 +256,12 @@ class OpenGLRenderer:
                 self.frame_buffer_object = self.context.detect_framebuffer()
             else:
                 self.window = None
-                self.context = moderngl.create_standalone_context()
+                try:
+                    self.context = moderngl.create_standalone_context()
+                except Exception:
+                    # Without a display, e.g. on a headless server, fall back
+                    # to an EGL context, which can be a software renderer.
+                    self.context = moderngl.create_standalone_context(backend="egl")
                 self.frame_buffer_object = self.get_frame_buffer_object(self.context, 0)
                 self.frame_buffer_object.use()
             self.context.enable(moderngl.BLEND)
@@ -287,55 +299,114 @@ class OpenGLRenderer:
         }
 
     def render_mobject(self, mobject):
-        if isinstance(mobject, OpenGLVMobject):
-            if config["use_projection_fill_shaders"]:
-                render_opengl_vectorized_mobject_fill(self, mobject)
+        self.render_mobjects([mobject])
 
-            if config["use_projection_stroke_shaders"]:
-                render_opengl_vectorized_mobject_stroke(self, mobject)
+    def render_mobjects(self, mobjects):
+        """Renders mobjects in order.
 
-        shader_wrapper_list = mobject.get_shader_wrapper_list()
+        The consecutive shader wrappers of the mobjects with the same shader id,
+        i.e. the same program, uniforms, textures and depth test, are combined
+        and drawn with a single draw call. Only consecutive shader wrappers are
+        combined, so that the mobjects are still drawn in the same order.
 
-        # Convert ShaderWrappers to Meshes.
-        for shader_wrapper in shader_wrapper_list:
-            shader = Shader(self.context, shader_wrapper.shader_folder)
+        Parameters
+        ----------
+        mobjects : List[:class:`~.OpenGLMobject`]
+            The mobjects to render.
+        """
+        # The shader wrappers to draw, along with the mobject they come from and
+        # their index in its list of shader wrappers.
+        pending_shader_wrappers = []
+        for mobject in mobjects:
+            if isinstance(mobject, OpenGLVMobject) and (
+                config["use_projection_fill_shaders"]
+                or config["use_projection_stroke_shaders"]
+            ):
+                # These are drawn right away, after the pending shader wrappers.
+                self.render_shader_wrappers(pending_shader_wrappers)
+                pending_shader_wrappers = []
+                if config["use_projection_fill_shaders"]:
+                    render_opengl_vectorized_mobject_fill(self, mobject)
+
+                if config["use_projection_stroke_shaders"]:
+                    render_opengl_vectorized_mobject_stroke(self, mobject)
+
+            pending_shader_wrappers.extend(
+                (mobject, index, shader_wrapper)
+                for index, shader_wrapper in enumerate(
+                    mobject.get_shader_wrapper_list()
+                )
+            )
+        self.render_shader_wrappers(pending_shader_wrappers)
 
-            # Set textures.
-            for name, path in shader_wrapper.texture_paths.items():
-                tid = self.get_texture_id(path)
-                shader.shader_program[name].value = tid
+    def render_shader_wrappers(self, shader_wrappers):
+        """Renders shader wrappers in order, combining the consecutive shader
+        wrappers which can be drawn together.
 
-            # Set uniforms.
-            for name, value in it.chain(
-                shader_wrapper.uniforms.items(), self.perspective_uniforms.items()
-            ):
-                try:
-                    shader.set_uniform(name, value)
-                except KeyError:
-                    pass
+        Parameters
+        ----------
+        shader_wrappers : List[Tuple[:class:`~.OpenGLMobject`, :class:`int`, :class:`~.ShaderWrapper`]]
+            The shader wrappers, along with the mobject they come from and their
+            index in its list of shader wrappers.
+        """
+        batches = batch_by_property(
+            shader_wrappers,
+            lambda item: (
+                item[2].get_id(),
+                item[2].vert_indices is not None and len(item[2].vert_indices) > 0,
+            ),
+        )
+        for batch, _ in batches:
+            mobject, index, shader_wrapper = batch[0]
+            shader_wrapper.combine_with(*(item[2] for item in batch[1:]))
+            if len(shader_wrapper.vert_data) == 0:
+                continue
+            # Render with the buffers used for the same ShaderWrapper of the
+            # mobject in the previous frames.
+            self.render_shader_wrapper(
+                shader_wrapper, ("shader_wrapper", id(mobject), index)
+            )
+
+    def render_shader_wrapper(self, shader_wrapper, key):
+        shader = Shader(self.context, shader_wrapper.shader_folder)
+
+        # Set textures.
+        for name, path in shader_wrapper.texture_paths.items():
+            tid = self.get_texture_id(path)
+            shader.shader_program[name].value = tid
+
+        # Set uniforms.
+        for name, value in it.chain(
+            shader_wrapper.uniforms.items(), self.perspective_uniforms.items()
+        ):
             try:
-                shader.set_uniform("u_view_matrix", self.scene.camera.get_view_matrix())
-                shader.set_uniform(
-                    "u_projection_matrix", self.scene.camera.projection_matrix
-                )
+                shader.set_uniform(name, value)
             except KeyError:
                 pass
-
-            # Set depth test.
-            if shader_wrapper.depth_test:
-                self.context.enable(moderngl.DEPTH_TEST)
-            else:
-                self.context.disable(moderngl.DEPTH_TEST)
-
-            # Render.
-            mesh = Mesh(
-                shader,
-                shader_wrapper.vert_data,
-                indices=shader_wrapper.vert_indices,
-                use_depth_test=shader_wrapper.depth_test,
+        try:
+            shader.set_uniform("u_view_matrix", self.scene.camera.get_view_matrix())
+            shader.set_uniform(
+                "u_projection_matrix", self.scene.camera.projection_matrix
             )
-            mesh.set_uniforms(self)
-            mesh.render()
+        except KeyError:
+            pass
+
+        # Set depth test.
+        if shader_wrapper.depth_test:
+            self.context.enable(moderngl.DEPTH_TEST)
+        else:
+            self.context.disable(moderngl.DEPTH_TEST)
+
+        # Render.
+        mesh = Mesh(
+            shader,
+            shader_wrapper.vert_data,
+            indices=shader_wrapper.vert_indices,
+            use_depth_test=shader_wrapper.depth_test,
+        )
+        mesh.vertex_array_key = key
+        mesh.set_uniforms(self)
+        mesh.render()
 
     def get_texture_id(self, path):
         if path not in self.path_to_texture_id:
@@ -400,17 +471,23 @@ class OpenGLRenderer:
         self.frame_buffer_object.clear(*window_background_color)
         self.refresh_perspective_uniforms(scene.camera)
 
-        for mobject in scene.mobjects:
-            self.render_mobject(mobject)
+        self.render_mobjects(scene.mobjects)
 
         for obj in scene.meshes:
             for mesh in obj.get_meshes():
                 mesh.set_uniforms(self)
                 mesh.render()
 
+        get_vertex_array_cache(self.context).end_frame()
         self.animation_elapsed_time = time.time() - self.animation_start_time
 
     def scene_finished(self, scene):
+        vertex_array_cache = get_vertex_array_cache(self.context)
+        logger.debug(
+            f"Uploaded {vertex_array_cache.total_bytes_uploaded} bytes of vertex "
+            f"data to {vertex_array_cache.buffers_created} buffers."
+        )
+        vertex_array_cache.release()
         self.file_writer.finish()
 
     def save_static_frame_data(self, scene, static_mobjects):
@@ -447,6 +524,42 @@ class OpenGLRenderer:
         )
         return ret
 
+    def begin_frame_readback(self):
+        """Starts reading the pixels of the frame into a pixel buffer object.
+
+        The pixels are copied by the GPU asynchronously, so that the next frame
+        can be rendered in the meantime, and are retrieved by
+        :meth:`end_frame_readback`, in the order the frames were read.
+        """
+        pixel_width, pixel_height = self.get_pixel_shape()
+        size = pixel_width * pixel_height * 4
+        buffer = self.free_pixel_buffers.pop() if self.free_pixel_buffers else None
+        if buffer is not None and buffer.size != size:
+            buffer.release()
+            buffer = None
+        if buffer is None:
+            buffer = self.context.buffer(reserve=size, dynamic=True)
+        self.frame_buffer_object.read_into(
+            buffer, viewport=self.frame_buffer_object.viewport, components=4
+        )
+        self.pending_pixel_buffers.append(buffer)
+
+    def end_frame_readback(self, out):
+        """Writes the pixels of the oldest frame read by
+        :meth:`begin_frame_readback` into a buffer, waiting for the GPU to have
+        copied them if needed.
+
+        Parameters
+        ----------
+        out
+            A writable buffer of the size of the frame, e.g. a
+            :class:`numpy.ndarray`. The rows of pixels are written bottom to
+            top, as with :meth:`get_raw_frame_buffer_object_data`.
+        """
+        buffer = self.pending_pixel_buffers.popleft()
+        buffer.read_into(out)
+        self.free_pixel_buffers.append(buffer)
+
     def get_frame(self):
         # get current pixel values as numpy data in order to test output
         raw = self.get_raw_frame_buffer_object_data(dtype="f1")
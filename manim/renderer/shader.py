@@ -13,12 +13,16 @@ from ..utils.simple_functions import get_parameters
 SHADER_FOLDER = Path(__file__).parent / "shaders"
 shader_program_cache = {}
 file_path_to_code_map = {}
+# The vertex array cache of each OpenGL context.
+vertex_array_caches = {}
 
 __all__ = [
     "Object3D",
     "Mesh",
     "Shader",
     "FullScreenQuad",
+    "VertexArrayCache",
+    "get_vertex_array_cache",
 ]
 
 
@@ -65,6 +69,215 @@ def filter_attributes(unfiltered_attributes, attributes):
     return filtered_attributes
 
 
+class _CachedVertexArray:
+    """The buffers and vertex array used to draw some vertex data."""
+
+    def __init__(self):
+        self.program = None
+        self.attribute_names = None
+        self.vertex_buffer = None
+        self.index_buffer = None
+        self.vertex_array = None
+        self.vertex_data = None
+        self.index_data = None
+        self.last_frame = 0
+
+
+class VertexArrayCache:
+    """Persistent vertex buffers and vertex arrays of an OpenGL context.
+
+    The vertex data drawn for a given key, e.g. the fill of a mobject, is kept
+    in the same buffers from one frame to the next, and only uploaded again
+    when it changed, instead of being uploaded to new buffers which are
+    released right after drawing. The buffers of keys which weren't drawn
+    during a frame are put back in a pool of buffers, to be reused for other
+    keys.
+
+    Parameters
+    ----------
+    context : :class:`moderngl.Context`
+        The context in which the buffers are created.
+    max_pooled_buffers : :class:`int`
+        The maximum number of unused buffers kept in the pool.
+
+    Attributes
+    ----------
+    frame_bytes_uploaded : :class:`int`
+        The number of bytes uploaded during the current frame.
+    last_frame_bytes_uploaded : :class:`int`
+        The number of bytes uploaded during the previous frame.
+    total_bytes_uploaded : :class:`int`
+        The number of bytes uploaded since the cache was created.
+    buffers_created : :class:`int`
+        The number of buffers created since the cache was created.
+    frame_draw_calls : :class:`int`
+        The number of draw calls during the current frame.
+    last_frame_draw_calls : :class:`int`
+        The number of draw calls during the previous frame.
+    """
+
+    def __init__(self, context, max_pooled_buffers=64):
+        self.context = context
+        self.max_pooled_buffers = max_pooled_buffers
+        self.vertex_arrays = {}
+        self.pooled_buffers = []
+        self.frame = 1
+        self.frame_bytes_uploaded = 0
+        self.last_frame_bytes_uploaded = 0
+        self.total_bytes_uploaded = 0
+        self.buffers_created = 0
+        self.frame_draw_calls = 0
+        self.last_frame_draw_calls = 0
+
+    def render(
+        self,
+        key,
+        shader_program,
+        attributes,
+        indices=None,
+        primitive=moderngl.TRIANGLES,
+    ):
+        """Draws vertex data, reusing the buffers previously used for the same key.
+
+        Parameters
+        ----------
+        key
+            A hashable identifying what is drawn, e.g. a mobject and the index
+            of its shader wrapper.
+        shader_program : :class:`moderngl.Program`
+            The program drawing the vertices.
+        attributes : :class:`numpy.ndarray`
+            A structured array of the attributes of each vertex.
+        indices : Optional[:class:`numpy.ndarray`]
+            The indices of the drawn vertices. All vertices are drawn in order if
+            this is ``None`` or empty.
+        primitive : :class:`int`
+            The primitive drawn with the vertices.
+        """
+        if len(attributes) == 0:
+            return
+        cached = self.vertex_arrays.get(key)
+        if cached is None:
+            cached = self.vertex_arrays[key] = _CachedVertexArray()
+        cached.last_frame = self.frame
+
+        vertex_data = attributes.tobytes()
+        index_data = None
+        if indices is not None and len(indices):
+            index_data = indices.astype("i4").tobytes()
+        rebuild = (
+            cached.program is not shader_program
+            or cached.attribute_names != attributes.dtype.names
+            or (cached.index_data is None) != (index_data is None)
+        )
+        if cached.vertex_data != vertex_data:
+            cached.vertex_buffer = self.upload(cached.vertex_buffer, vertex_data)
+            cached.vertex_data = vertex_data
+        if cached.index_data != index_data:
+            if index_data is None:
+                self.recycle(cached.index_buffer)
+                cached.index_buffer = None
+            else:
+                cached.index_buffer = self.upload(cached.index_buffer, index_data)
+            cached.index_data = index_data
+
+        if rebuild:
+            if cached.vertex_array is not None:
+                cached.vertex_array.release()
+            cached.vertex_array = self.context.simple_vertex_array(
+                shader_program,
+                cached.vertex_buffer,
+                *attributes.dtype.names,
+                index_buffer=cached.index_buffer,
+            )
+            cached.program = shader_program
+            cached.attribute_names = attributes.dtype.names
+        # The number of vertices of a vertex array is computed from the size of
+        # its buffers when it is created, so it is passed explicitly.
+        vertices = len(attributes) if index_data is None else len(indices)
+        cached.vertex_array.render(primitive, vertices=vertices)
+        self.frame_draw_calls += 1
+
+    def upload(self, buffer, data):
+        """Writes data to a buffer, orphaning its previous storage so that
+        drawing calls still using it don't have to complete first.
+
+        Parameters
+        ----------
+        buffer : Optional[:class:`moderngl.Buffer`]
+            The buffer to write to, or ``None`` to write to a buffer of the pool.
+        data : :class:`bytes`
+            The data to write.
+
+        Returns
+        -------
+        :class:`moderngl.Buffer`
+            The buffer the data was written to.
+        """
+        if buffer is None and self.pooled_buffers:
+            buffer = self.pooled_buffers.pop()
+        if buffer is None:
+            buffer = self.context.buffer(data, dynamic=True)
+            self.buffers_created += 1
+        else:
+            buffer.orphan(len(data))
+            buffer.write(data)
+        self.frame_bytes_uploaded += len(data)
+        self.total_bytes_uploaded += len(data)
+        return buffer
+
+    def recycle(self, buffer):
+        """Puts a buffer back in the pool, or releases it if the pool is full."""
+        if buffer is None:
+            return
+        if len(self.pooled_buffers) < self.max_pooled_buffers:
+            self.pooled_buffers.append(buffer)
+        else:
+            buffer.release()
+
+    def end_frame(self):
+        """Recycles the buffers of the keys which weren't drawn during the
+        frame, and resets the counters of the frame."""
+        for key, cached in list(self.vertex_arrays.items()):
+            if cached.last_frame == self.frame:
+                continue
+            del self.vertex_arrays[key]
+            if cached.vertex_array is not None:
+                cached.vertex_array.release()
+            self.recycle(cached.vertex_buffer)
+            self.recycle(cached.index_buffer)
+        self.last_frame_bytes_uploaded = self.frame_bytes_uploaded
+        self.frame_bytes_uploaded = 0
+        self.last_frame_draw_calls = self.frame_draw_calls
+        self.frame_draw_calls = 0
+        self.frame += 1
+
+    def release(self):
+        """Releases all the buffers and vertex arrays."""
+        for cached in self.vertex_arrays.values():
+            for gl_object in (
+                cached.vertex_array,
+                cached.vertex_buffer,
+                cached.index_buffer,
+            ):
+                if gl_object is not None:
+                    gl_object.release()
+        for buffer in self.pooled_buffers:
+            buffer.release()
+        self.vertex_arrays.clear()
+        self.pooled_buffers.clear()
+        if vertex_array_caches.get(self.context) is self:
+            del vertex_array_caches[self.context]
+
+
+def get_vertex_array_cache(context):
+    """Returns the :class:`VertexArrayCache` of an OpenGL context."""
+    cache = vertex_array_caches.get(context)
+    if cache is None:
+        cache = vertex_array_caches[context] = VertexArrayCache(context)
+    return cache
+
+
 class Object3D:
     def __init__(self, *children):
         self.model_matrix = np.eye(4)
@@ -274,6 +487,8 @@ class Mesh(Object3D):
         self.use_depth_test = use_depth_test
         self.primitive = primitive
         self.skip_render = False
+        # The key of the buffers of the mesh in the vertex array cache.
+        self.vertex_array_key = ("mesh", id(self))
         self.init_updaters()
 
     def single_copy(self):
@@ -309,34 +524,19 @@ class Mesh(Object3D):
         else:
             self.shader.context.disable(moderngl.DEPTH_TEST)
 
-        from moderngl.program_members.attribute import Attribute
-
         shader_attributes = []
         for k, v in self.shader.shader_program._members.items():
-            if isinstance(v, Attribute):
+            if isinstance(v, moderngl.Attribute):
                 shader_attributes.append(k)
         shader_attributes = filter_attributes(self.attributes, shader_attributes)
 
-        vertex_buffer_object = self.shader.context.buffer(shader_attributes.tobytes())
-        if self.indices is None:
-            index_buffer_object = None
-        else:
-            vert_index_data = self.indices.astype("i4").tobytes()
-            if vert_index_data:
-                index_buffer_object = self.shader.context.buffer(vert_index_data)
-            else:
-                index_buffer_object = None
-        vertex_array_object = self.shader.context.simple_vertex_array(
+        get_vertex_array_cache(self.shader.context).render(
+            self.vertex_array_key,
             self.shader.shader_program,
-            vertex_buffer_object,
-            *shader_attributes.dtype.names,
-            index_buffer=index_buffer_object,
+            shader_attributes,
+            indices=self.indices,
+            primitive=self.primitive,
         )
-        vertex_array_object.render(self.primitive)
-        vertex_buffer_object.release()
-        vertex_array_object.release()
-        if index_buffer_object is not None:
-            index_buffer_object.release()
 
 
 class Shader:
@@ -350,8 +550,11 @@ class Shader:
         self.context = context
         self.name = name
 
-        # See if the program is cached.
-        if self.name in shader_program_cache:
+        # See if the program is cached, for this context.
+        if (
+            self.name in shader_program_cache
+            and shader_program_cache[self.name].ctx is context
+        ):
             self.shader_program = shader_program_cache[self.name]
         elif source is not None:
             # Generate the shader from inline code if it was passed.
@@ -372,7 +575,7 @@ class Shader:
             self.shader_program = context.program(**source_dict)
 
         # Cache the shader.
-        if name is not None and name not in shader_program_cache:
+        if name is not None:
             shader_program_cache[self.name] = self.shader_program
 
     def set_uniform(self, name, value):
@@ -41,6 +41,7 @@ from ..utils.family import extract_mobject_family_members
 from ..utils.family_ops import restructure_list_to_exclude_certain_family_members
 from ..utils.file_ops import open_media_file
 from ..utils.iterables import list_difference_update, list_update
+from ..utils.updater_timings import log_updater_timings
 
 
 class RerunSceneHandler(FileSystemEventHandler):
@@ -233,6 +234,8 @@ class Scene:
             logger.info(
                 f"Rendered {str(self)}\nPlayed {self.renderer.num_plays} animations"
             )
+        if config.profile_updaters:
+            log_updater_timings(str(self))
 
         # If preview open up the render after rendering.
         if preview:
@@ -755,7 +758,7 @@ class Scene:
 
         return animations
 
-    def _get_animation_time_progression(self, animations, duration):
+    def _get_animation_time_progression(self, animations, duration, frame_range=None):
         """
         You will hardly use this when making your own animations.
         This method is for Manim's internal use.
@@ -773,6 +776,10 @@ class Scene:
         duration : int or float
             duration of wait time
 
+        frame_range : Tuple[int, int], optional
+            If given, only the frames with index in ``[start, end)`` are
+            iterated over.
+
         Returns
         -------
         time_progression
@@ -789,7 +796,9 @@ class Scene:
                 )
             else:
                 time_progression = self.get_time_progression(
-                    duration, f"Waiting {self.renderer.num_plays}"
+                    duration,
+                    f"Waiting {self.renderer.num_plays}",
+                    frame_range=frame_range,
                 )
         else:
             time_progression = self.get_time_progression(
@@ -801,11 +810,17 @@ class Scene:
                         (", etc." if len(animations) > 1 else ""),
                     ]
                 ),
+                frame_range=frame_range,
             )
         return time_progression
 
     def get_time_progression(
-        self, run_time, description, n_iterations=None, override_skip_animations=False
+        self,
+        run_time,
+        description,
+        n_iterations=None,
+        override_skip_animations=False,
+        frame_range=None,
     ):
         """
         You will hardly use this when making your own animations.
@@ -828,6 +843,10 @@ class Scene:
         override_skip_animations : bool, optional
             Whether or not to show skipped animations in the progress bar.
 
+        frame_range : Tuple[int, int], optional
+            If given, only the frames with index in ``[start, end)`` are
+            iterated over.
+
         Returns
         -------
         time_progression
@@ -836,8 +855,9 @@ class Scene:
         if self.renderer.skip_animations and not override_skip_animations:
             times = [run_time]
         else:
-            step = 1 / config["frame_rate"]
-            times = np.arange(0, run_time, step)
+            times = self.get_frame_times(run_time)
+            if frame_range is not None:
+                times = times[frame_range[0] : frame_range[1]]
         time_progression = tqdm(
             times,
             desc=description,
@@ -848,6 +868,21 @@ class Scene:
         )
         return time_progression
 
+    def get_frame_times(self, run_time):
+        """Gets the times at which the frames of an animation are rendered.
+
+        Parameters
+        ----------
+        run_time : float
+            The ``run_time`` of the animation.
+
+        Returns
+        -------
+        np.ndarray
+            The time of each frame, starting at 0.
+        """
+        return np.arange(0, run_time, 1 / config["frame_rate"])
+
     def get_run_time(self, animations):
         """
         Gets the total run time for a list of animations.
@@ -957,7 +992,7 @@ class Scene:
             and self.animations[0].is_static_wait
         )
 
-    def play_internal(self, skip_rendering=False):
+    def play_internal(self, skip_rendering=False, frame_range=None):
         """
         This method is used to prep the animations for rendering,
         apply the arguments and parameters required to them,
@@ -965,16 +1000,19 @@ class Scene:
 
         Parameters
         ----------
-        args
-            Animation or mobject with mobject method and params
-        kwargs
-            named parameters affecting what was passed in ``args``,
-            e.g. ``run_time``, ``lag_ratio`` and so on.
+        skip_rendering : bool, optional
+            Whether the rendering should be skipped, by default False
+        frame_range : Tuple[int, int], optional
+            If given, only the frames with index in ``[start, end)`` are
+            rendered. The scene is first brought to the state it has at the
+            start of that range.
         """
         self.duration = self.get_run_time(self.animations)
         self.time_progression = self._get_animation_time_progression(
-            self.animations, self.duration
+            self.animations, self.duration, frame_range=frame_range
         )
+        if frame_range is not None:
+            self.fast_forward_to_frame(frame_range[0])
         for t in self.time_progression:
             self.update_to_time(t)
             if not skip_rendering and not self.skip_animation_preview:
@@ -992,6 +1030,46 @@ class Scene:
         # Closing the progress bar at the end of the play.
         self.time_progression.close()
 
+    def fast_forward_to_frame(self, frame_index):
+        """Brings the current animations to the state of a given frame, without
+        rendering anything.
+
+        When no mobject has updaters, the state of the scene only depends on the
+        current time and is reached directly through :meth:`.Animation.interpolate`
+        when the frame is rendered. Otherwise, every previous frame has to be
+        stepped through, as updaters may depend on the whole history of the scene.
+
+        Parameters
+        ----------
+        frame_index : int
+            The index of the frame to fast-forward to. The frame itself is left to
+            be updated when it is rendered.
+        """
+        times = self.get_frame_times(self.duration)[:frame_index]
+        if len(times) == 0:
+            return
+        if self.should_fast_forward_through_frames():
+            for t in times:
+                self.update_to_time(t)
+        self.renderer.time += len(times) / config["frame_rate"]
+
+    def should_fast_forward_through_frames(self):
+        """Whether the previous frames of the current animations have to be stepped
+        through to reach a given frame, see :meth:`fast_forward_to_frame`.
+
+        Returns
+        -------
+        bool
+            ``True`` if the scene or any mobject updated during the animations has
+            updaters.
+        """
+        if self.should_update_mobjects() or self.updaters:
+            return True
+        mobjects = list(self.mobjects)
+        for animation in self.animations:
+            mobjects.extend(animation.get_all_mobjects_to_update())
+        return any(mob.has_updaters for mob in mobjects)
+
     def interactive_embed(self):
         """
         Like embed(), but allows for screen interaction.
@@ -4,10 +4,12 @@ __all__ = ["SceneFileWriter"]
 
 import datetime
 import os
+import queue
 import shutil
 import subprocess
+import threading
 from pathlib import Path
-from time import sleep
+from time import perf_counter, sleep
 
 import numpy as np
 from PIL import Image
@@ -24,12 +26,187 @@ from ..utils.file_ops import (
     is_gif_format,
     is_png_format,
     is_webm_format,
-    modify_atime,
     write_to_movie,
 )
+from ..utils.partial_movie_cache import PartialMovieCache
 from ..utils.sounds import get_full_sound_file_path
 
 
+class _FrameWriterThread:
+    """Pipes frames to a stream from a background thread.
+
+    Frames are copied into a bounded pool of reusable buffers and queued, so
+    that the renderer can rasterize the next frame while the previous ones are
+    written. When all the buffers are in use, :meth:`write` blocks until the
+    stream has consumed one of them; the time spent blocked is recorded as
+    ``stall_time``.
+
+    A frame identical to the previous one is neither copied nor given a new
+    buffer: the thread writes the buffer of the previous frame again.
+
+    Parameters
+    ----------
+    stream
+        A binary stream, typically the stdin of the ffmpeg process.
+    queue_size
+        The number of frame buffers, i.e. how many frames the renderer can get
+        ahead of the stream.
+    """
+
+    # Queued instead of a buffer to write the previous frame again.
+    REPEAT_PREVIOUS_FRAME = "repeat"
+
+    def __init__(self, stream, queue_size):
+        self.stream = stream
+        self.queue_size = queue_size
+        self.free_buffers = queue.Queue()
+        self.pending_frames = queue.Queue()
+        self.num_buffers = 0
+        self.last_queued_buffer = None
+        self.error = None
+        self.frames_written = 0
+        self.duplicate_frames = 0
+        self.stall_time = 0
+        self.max_queue_depth = 0
+        self.total_queue_depth = 0
+        self.thread = threading.Thread(target=self._write_pending_frames, daemon=True)
+        self.thread.start()
+
+    def write(self, frame):
+        """Queue a copy of ``frame`` to be written to the stream.
+
+        Parameters
+        ----------
+        frame : np.ndarray
+            Pixel array of the frame. It can be reused by the caller as soon
+            as this method returns.
+        """
+        if self.last_queued_buffer is not None and _same_pixels(
+            frame, self.last_queued_buffer
+        ):
+            self.duplicate_frames += 1
+            item = self.REPEAT_PREVIOUS_FRAME
+        else:
+            item = self._get_free_buffer(frame.shape, frame.dtype)
+            np.copyto(item, frame)
+            self.last_queued_buffer = item
+        self._queue(item)
+
+    def write_from(self, read_into, shape, dtype):
+        """Queue a frame read directly into one of the buffers, instead of
+        being copied from a pixel array.
+
+        Parameters
+        ----------
+        read_into : Callable[[np.ndarray], None]
+            A function writing the pixels of the frame into the given buffer.
+        shape : Tuple[int, ...]
+            The shape of the pixel array of the frame.
+        dtype : np.dtype
+            The data type of the pixel array of the frame.
+        """
+        buffer = self._get_free_buffer(shape, dtype)
+        read_into(buffer)
+        if self.last_queued_buffer is not None and _same_pixels(
+            buffer, self.last_queued_buffer
+        ):
+            self.free_buffers.put(buffer)
+            self.duplicate_frames += 1
+            item = self.REPEAT_PREVIOUS_FRAME
+        else:
+            item = self.last_queued_buffer = buffer
+        self._queue(item)
+
+    def _queue(self, item):
+        queue_depth = self.pending_frames.qsize() + 1
+        self.max_queue_depth = max(self.max_queue_depth, queue_depth)
+        self.total_queue_depth += queue_depth
+        self.frames_written += 1
+        self.pending_frames.put(item)
+
+    def close(self):
+        """Wait for all the queued frames to be written and stop the thread.
+
+        Raises
+        ------
+        :class:`Exception`
+            The error raised by the stream while writing a frame, if any.
+        """
+        self.pending_frames.put(None)
+        self.thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def get_stats(self):
+        """Get metrics about the queue usage.
+
+        Returns
+        -------
+        :class:`dict`
+            The number of frames written and how many of them were duplicates
+            of the previous frame, the average and max queue depth, and the
+            time (in seconds) the renderer spent waiting for a free buffer.
+        """
+        return {
+            "frames": self.frames_written,
+            "duplicate_frames": self.duplicate_frames,
+            "average_queue_depth": self.total_queue_depth / max(1, self.frames_written),
+            "max_queue_depth": self.max_queue_depth,
+            "stall_time": self.stall_time,
+        }
+
+    def _get_free_buffer(self, shape, dtype):
+        while True:
+            try:
+                buffer = self.free_buffers.get_nowait()
+            except queue.Empty:
+                # One more buffer than the queue size, as the thread keeps the
+                # last written frame to be able to repeat it.
+                if self.num_buffers <= self.queue_size:
+                    self.num_buffers += 1
+                    return np.empty(shape, dtype=dtype)
+                start = perf_counter()
+                buffer = self.free_buffers.get()
+                self.stall_time += perf_counter() - start
+            if buffer.shape == shape and buffer.dtype == dtype:
+                return buffer
+            # The frame size changed, drop the outdated buffer.
+            self.num_buffers -= 1
+
+    def _write_pending_frames(self):
+        last_buffer = None
+        while True:
+            item = self.pending_frames.get()
+            if item is None:
+                return
+            if item is self.REPEAT_PREVIOUS_FRAME:
+                buffer = last_buffer
+            else:
+                buffer = item
+                # The previous buffer cannot be repeated anymore, recycle it.
+                if last_buffer is not None:
+                    self.free_buffers.put(last_buffer)
+                last_buffer = buffer
+            if self.error is None:
+                try:
+                    self.stream.write(memoryview(buffer).cast("B"))
+                except Exception as e:
+                    # Keep on consuming the queue so that the renderer never
+                    # waits forever, the error is raised by close().
+                    self.error = e
+
+
+def _same_pixels(frame, other):
+    """Whether two pixel arrays are identical, comparing them by 8 bytes words
+    when possible, which is several times faster than byte by byte."""
+    if frame.shape != other.shape or frame.dtype != other.dtype:
+        return False
+    if frame.flags.c_contiguous and frame.nbytes % 8 == 0:
+        frame = frame.reshape(-1).view(np.uint64)
+        other = other.reshape(-1).view(np.uint64)
+    return np.array_equal(frame, other)
+
+
 class SceneFileWriter(object):
     """
     SceneFileWriter is the object that actually writes the animations
@@ -51,10 +228,14 @@ class SceneFileWriter(object):
     def __init__(self, renderer, scene_name, **kwargs):
         self.renderer = renderer
         self.stream_lock = False
+        self.frame_writer = None
+        self.readback_buffer = None
+        self.frames_repeated_by_ffmpeg = False
         self.init_output_directories(scene_name)
         self.init_audio()
         self.frame_count = 0
         self.partial_movie_files = []
+        self.partial_movie_shards = {}
 
     def init_output_directories(self, scene_name):
         """Initialise output directories.
@@ -111,6 +292,14 @@ class SceneFileWriter(object):
                     module_name=module_name,
                 )
             )
+            self.partial_movie_cache = PartialMovieCache(
+                self.partial_movie_directory, config["movie_file_extension"]
+            )
+            self.partial_movie_file_list = os.path.join(
+                self.partial_movie_directory,
+                f"{scene_name}_partial_movie_file_list.txt",
+            )
+            self.scene_name = scene_name
 
     def add_partial_movie_file(self, hash_animation):
         """Adds a new partial movie file path to scene.partial_movie_files from an hash. This method will compute the path from the hash.
@@ -128,12 +317,47 @@ class SceneFileWriter(object):
         if hash_animation is None:
             self.partial_movie_files.append(None)
             return
-        new_partial_movie_file = os.path.join(
-            self.partial_movie_directory,
-            f"{hash_animation}{config['movie_file_extension']}",
-        )
+        new_partial_movie_file = self.partial_movie_cache.get_path(hash_animation)
         self.partial_movie_files.append(new_partial_movie_file)
 
+    def add_partial_movie_shards(self, num_shards):
+        """Splits the partial movie file of the current animation into several
+        shard files, rendered separately and stitched together by :meth:`finish`.
+
+        Parameters
+        ----------
+        num_shards : int
+            The number of contiguous frame ranges the animation is split into.
+
+        Returns
+        -------
+        List[str]
+            The paths of the shard files, in playing order.
+        """
+        partial_movie_file = self.partial_movie_files[self.renderer.num_plays]
+        root, extension = os.path.splitext(partial_movie_file)
+        shard_files = [f"{root}_shard{i:03}{extension}" for i in range(num_shards)]
+        self.partial_movie_shards[partial_movie_file] = shard_files
+        return shard_files
+
+    def combine_partial_movie_shards(self):
+        """Stitches the shard files of each sharded animation into the partial
+        movie file of that animation, and removes the shard files.
+        """
+        for partial_movie_file, shard_files in self.partial_movie_shards.items():
+            file_list = f"{os.path.splitext(partial_movie_file)[0]}_shards.txt"
+            self.write_concat_file_list(file_list, shard_files)
+            commands = self.get_concat_command(file_list)
+            commands += ["-an", "-c", "copy", partial_movie_file]
+            subprocess.run(commands, check=True)
+            for file_path in [file_list, *shard_files]:
+                os.remove(file_path)
+            logger.debug(
+                f"Stitched {len(shard_files)} shards into %(path)s",
+                {"path": f"'{partial_movie_file}'"},
+            )
+        self.partial_movie_shards = {}
+
     def get_resolution_directory(self):
         """Get the name of the resolution directory directly containing
         the video file.
@@ -243,7 +467,7 @@ class SceneFileWriter(object):
         self.add_audio_segment(new_segment, time, **kwargs)
 
     # Writers
-    def begin_animation(self, allow_write=False, file_path=None):
+    def begin_animation(self, allow_write=False, file_path=None, static_frames=None):
         """
         Used internally by manim to stream the animation to FFMPEG for
         displaying or writing to a file.
@@ -252,9 +476,15 @@ class SceneFileWriter(object):
         ----------
         allow_write : bool, optional
             Whether or not to write to a video file.
+        file_path : str, optional
+            The movie file to write to, instead of the partial movie file of
+            the current animation.
+        static_frames : int, optional
+            If the animation consists of a single frame shown this many times,
+            the frame is only piped once and repeated by FFMPEG.
         """
         if write_to_movie() and allow_write:
-            self.open_movie_pipe(file_path=file_path)
+            self.open_movie_pipe(file_path=file_path, static_frames=static_frames)
 
     def end_animation(self, allow_write=False):
         """
@@ -269,7 +499,7 @@ class SceneFileWriter(object):
         if write_to_movie() and allow_write:
             self.close_movie_pipe()
 
-    def write_frame(self, frame_or_renderer):
+    def write_frame(self, frame_or_renderer, num_frames=1):
         """
         Used internally by Manim to write a frame to
         the FFMPEG input buffer.
@@ -278,22 +508,57 @@ class SceneFileWriter(object):
         ----------
         frame : np.array
             Pixel array of the frame.
+        num_frames : int, optional
+            The number of times the frame is shown.
         """
         if config.renderer == "opengl":
             renderer = frame_or_renderer
-            self.writing_process.stdin.write(
-                renderer.get_raw_frame_buffer_object_data()
-            )
+            # The pixels are read asynchronously, and piped once the next frame
+            # is rendered, so that the renderer doesn't wait for the GPU.
+            renderer.begin_frame_readback()
+            if len(renderer.pending_pixel_buffers) > 1:
+                self.pipe_frame_readback(renderer)
         else:
             frame = frame_or_renderer
             if write_to_movie():
-                self.writing_process.stdin.write(frame.tobytes())
+                # When the frame is repeated by FFMPEG, it only has to be piped once.
+                num_piped_frames = 1 if self.frames_repeated_by_ffmpeg else num_frames
+                if self.frame_writer is not None:
+                    for _ in range(num_piped_frames):
+                        self.frame_writer.write(frame)
+                else:
+                    frame_bytes = frame.tobytes()
+                    for _ in range(num_piped_frames):
+                        self.writing_process.stdin.write(frame_bytes)
             if is_png_format() and not config["dry_run"]:
                 target_dir, extension = os.path.splitext(self.image_file_path)
-                Image.fromarray(frame).save(
-                    f"{target_dir}{self.frame_count}{extension}"
-                )
-                self.frame_count += 1
+                image = Image.fromarray(frame)
+                for _ in range(num_frames):
+                    image.save(f"{target_dir}{self.frame_count}{extension}")
+                    self.frame_count += 1
+
+    def pipe_frame_readback(self, renderer):
+        """Pipes the oldest frame read by the OpenGL renderer to FFMPEG.
+
+        The pixels are read straight into a buffer of the frame writer thread,
+        or into a reused buffer. They are flipped vertically by FFMPEG.
+
+        Parameters
+        ----------
+        renderer : :class:`~.OpenGLRenderer`
+            The renderer which read the frame.
+        """
+        width, height = renderer.get_pixel_shape()
+        shape = (height, width, 4)
+        if self.frame_writer is not None:
+            self.frame_writer.write_from(
+                renderer.end_frame_readback, shape, np.dtype(np.uint8)
+            )
+            return
+        if self.readback_buffer is None or self.readback_buffer.shape != shape:
+            self.readback_buffer = np.empty(shape, dtype=np.uint8)
+        renderer.end_frame_readback(self.readback_buffer)
+        self.writing_process.stdin.write(memoryview(self.readback_buffer).cast("B"))
 
     def save_final_image(self, image):
         """
@@ -344,6 +609,8 @@ class SceneFileWriter(object):
         if write_to_movie():
             if hasattr(self, "writing_process"):
                 self.writing_process.terminate()
+            if self.partial_movie_shards:
+                self.combine_partial_movie_shards()
             self.combine_movie_files(partial_movie_files=partial_movie_files)
             if config["flush_cache"]:
                 self.flush_cache_directory()
@@ -353,11 +620,20 @@ class SceneFileWriter(object):
             target_dir, _ = os.path.splitext(self.image_file_path)
             logger.info("\n%i images ready at %s\n", self.frame_count, target_dir)
 
-    def open_movie_pipe(self, file_path=None):
+    def open_movie_pipe(self, file_path=None, static_frames=None):
         """
         Used internally by Manim to initialise
         FFMPEG and begin writing to FFMPEG's input
         buffer.
+
+        Parameters
+        ----------
+        file_path : str, optional
+            The movie file to write to, instead of the partial movie file of
+            the current animation.
+        static_frames : int, optional
+            If given, FFMPEG repeats the first frame it receives this many
+            times, so that a static frame only has to be piped once.
         """
         if file_path is None:
             file_path = self.partial_movie_files[self.renderer.num_plays]
@@ -391,8 +667,14 @@ class SceneFileWriter(object):
             "-metadata",
             f"comment=Rendered with Manim Community v{__version__}",
         ]
+        filters = []
         if config.renderer == "opengl":
-            command += ["-vf", "vflip"]
+            filters.append("vflip")
+        self.frames_repeated_by_ffmpeg = bool(static_frames and static_frames > 1)
+        if self.frames_repeated_by_ffmpeg:
+            filters.append(f"loop=loop={static_frames - 1}:size=1:start=0")
+        if filters:
+            command += ["-vf", ",".join(filters)]
         if is_webm_format():
             command += ["-vcodec", "libvpx-vp9", "-auto-alt-ref", "0"]
         # .mov format
@@ -402,13 +684,37 @@ class SceneFileWriter(object):
             command += ["-vcodec", "libx264", "-pix_fmt", "yuv420p"]
         command += [file_path]
         self.writing_process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        if config["frame_queue_size"]:
+            self.frame_writer = _FrameWriterThread(
+                self.writing_process.stdin, config["frame_queue_size"]
+            )
 
     def close_movie_pipe(self):
         """
         Used internally by Manim to gracefully stop writing to FFMPEG's input buffer
         """
+        if config.renderer == "opengl":
+            while self.renderer.pending_pixel_buffers:
+                self.pipe_frame_readback(self.renderer)
+        if self.frame_writer is not None:
+            frame_writer, self.frame_writer = self.frame_writer, None
+            frame_writer.close()
+            logger.debug(
+                f"Animation {self.renderer.num_plays} : Wrote %(frames)d frames "
+                "(%(duplicate_frames)d duplicates), "
+                "average queue depth %(average_queue_depth).2f, "
+                "max queue depth %(max_queue_depth)d, "
+                "renderer stalled for %(stall_time).3fs",
+                frame_writer.get_stats(),
+            )
         self.writing_process.stdin.close()
         self.writing_process.wait()
+        if self.partial_movie_file_path in self.partial_movie_files:
+            # Index the file right away, so that it is cached for the next play
+            # calls. Shard files are indexed once combined.
+            self.partial_movie_cache.record_use(
+                [self.partial_movie_file_path], self.scene_name
+            )
 
         logger.info(
             f"Animation {self.renderer.num_plays} : Partial movie file written in %(path)s",
@@ -416,7 +722,8 @@ class SceneFileWriter(object):
         )
 
     def is_already_cached(self, hash_invocation):
-        """Will check if a file named with `hash_invocation` exists.
+        """Will check if the partial movie file of `hash_invocation` is cached,
+        see :class:`~.PartialMovieCache`.
 
         Parameters
         ----------
@@ -430,11 +737,54 @@ class SceneFileWriter(object):
         """
         if not hasattr(self, "partial_movie_directory") or not write_to_movie():
             return False
-        path = os.path.join(
-            self.partial_movie_directory,
-            f"{hash_invocation}{config['movie_file_extension']}",
-        )
-        return os.path.exists(path)
+        return hash_invocation in self.partial_movie_cache
+
+    def write_concat_file_list(self, file_list, movie_files):
+        """Writes the list of files to be concatenated by FFMPEG's concat demuxer.
+
+        Parameters
+        ----------
+        file_list : str
+            The path of the list to write.
+        movie_files : List[str]
+            The movie files to concatenate, in order.
+        """
+        with open(file_list, "w") as fp:
+            fp.write("# This file is used internally by FFMPEG.\n")
+            for pf_path in movie_files:
+                if os.name == "nt":
+                    pf_path = pf_path.replace("\\", "/")
+                fp.write(f"file 'file:{pf_path}'\n")
+
+    def get_concat_command(self, file_list):
+        """Gets the FFMPEG command concatenating the files listed in ``file_list``.
+        The output options and output file have to be appended to it.
+
+        Parameters
+        ----------
+        file_list : str
+            The path of a list written by :meth:`write_concat_file_list`.
+
+        Returns
+        -------
+        List[str]
+            The command, as a list of arguments.
+        """
+        return [
+            FFMPEG_BIN,
+            "-y",  # overwrite output file if it exists
+            "-f",
+            "concat",
+            "-safe",
+            "0",
+            "-i",
+            file_list,
+            "-loglevel",
+            config["ffmpeg_loglevel"].lower(),
+            "-metadata",
+            f"comment=Rendered with Manim Community v{__version__}",
+            "-nostdin",
+        ]
 
     def combine_movie_files(self, partial_movie_files=None):
         """
@@ -456,35 +806,14 @@ class SceneFileWriter(object):
 
         # Write a file partial_file_list.txt containing all partial movie
         # files. This is used by FFMPEG.
-        file_list = os.path.join(
-            self.partial_movie_directory, "partial_movie_file_list.txt"
-        )
+        file_list = self.partial_movie_file_list
         logger.debug(
             f"Partial movie files to combine ({len(partial_movie_files)} files): %(p)s",
             {"p": partial_movie_files[:5]},
         )
-        with open(file_list, "w") as fp:
-            fp.write("# This file is used internally by FFMPEG.\n")
-            for pf_path in partial_movie_files:
-                if os.name == "nt":
-                    pf_path = pf_path.replace("\\", "/")
-                fp.write(f"file 'file:{pf_path}'\n")
+        self.write_concat_file_list(file_list, partial_movie_files)
         movie_file_path = self.movie_file_path
-        commands = [
-            FFMPEG_BIN,
-            "-y",  # overwrite output file if it exists
-            "-f",
-            "concat",
-            "-safe",
-            "0",
-            "-i",
-            file_list,
-            "-loglevel",
-            config["ffmpeg_loglevel"].lower(),
-            "-metadata",
-            f"comment=Rendered with Manim Community v{__version__}",
-            "-nostdin",
-        ]
+        commands = self.get_concat_command(file_list)
 
         if write_to_movie() and not is_gif_format():
             commands += ["-c", "copy", movie_file_path]
@@ -550,44 +879,29 @@ class SceneFileWriter(object):
             self.gif_file_path if is_gif_format() else movie_file_path
         )
         if write_to_movie():
-            for file_path in partial_movie_files:
-                # We have to modify the accessed time so if we have to clean the cache we remove the one used the longest.
-                modify_atime(file_path)
+            # Mark the files as used, so that cleaning the cache removes the ones used the longest ago.
+            self.partial_movie_cache.record_use(partial_movie_files, self.scene_name)
 
     def clean_cache(self):
-        """Will clean the cache by removing the partial_movie_files used by manim the longest ago."""
-        cached_partial_movies = [
-            os.path.join(self.partial_movie_directory, file_name)
-            for file_name in os.listdir(self.partial_movie_directory)
-            if file_name != "partial_movie_file_list.txt"
-        ]
-        if len(cached_partial_movies) > config["max_files_cached"]:
-            number_files_to_delete = (
-                len(cached_partial_movies) - config["max_files_cached"]
-            )
-            oldest_files_to_delete = sorted(
-                cached_partial_movies,
-                key=os.path.getatime,
-            )[:number_files_to_delete]
-            # oldest_file_path = min(cached_partial_movies, key=os.path.getatime)
-            for file_to_delete in oldest_files_to_delete:
-                os.remove(file_to_delete)
+        """Will clean the cache by removing the partial_movie_files used by manim the longest ago,
+        until there are at most ``max_files_cached`` files taking at most ``max_cache_size`` megabytes.
+        """
+        max_cache_size = config["max_cache_size"] * 1024**2
+        number_files_deleted, freed_bytes = self.partial_movie_cache.evict(
+            config["max_files_cached"], max_cache_size
+        )
+        if number_files_deleted:
             logger.info(
-                f"The partial movie directory is full (> {config['max_files_cached']} files). Therefore, manim has removed {number_files_to_delete} file(s) used by it the longest ago."
-                + "You can change this behaviour by changing max_files_cached in config."
+                f"The partial movie cache is full (> {config['max_files_cached']} files or > {config['max_cache_size']} MB). "
+                f"Therefore, manim has removed {number_files_deleted} file(s) ({freed_bytes / 1024**2:.1f} MB) used by it the longest ago. "
+                + "You can change this behaviour by changing max_files_cached and max_cache_size in config."
             )
 
     def flush_cache_directory(self):
         """Delete all the cached partial movie files"""
-        cached_partial_movies = [
-            os.path.join(self.partial_movie_directory, file_name)
-            for file_name in os.listdir(self.partial_movie_directory)
-            if file_name != "partial_movie_file_list.txt"
-        ]
-        for f in cached_partial_movies:
-            os.remove(f)
+        number_files_deleted = self.partial_movie_cache.flush()
         logger.info(
-            f"Cache flushed. {len(cached_partial_movies)} file(s) deleted in %(par_dir)s.",
+            f"Cache flushed. {number_files_deleted} file(s) deleted in %(par_dir)s.",
             {"par_dir": self.partial_movie_directory},
         )
 
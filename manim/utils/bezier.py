@@ -2,7 +2,9 @@
 
 __all__ = [
     "bezier",
+    "bezier_weights",
     "partial_bezier_points",
+    "get_bezier_split_matrices",
     "partial_quadratic_bezier_points",
     "interpolate",
     "integer_interpolate",
@@ -16,6 +18,7 @@ __all__ = [
 ]
 
 
+import functools
 import typing
 
 import numpy as np
@@ -51,12 +54,35 @@ def bezier(
     )
 
 
+def bezier_weights(n_points: int, alphas: typing.Iterable[float]) -> np.ndarray:
+    """Return the weights of the points defining a bezier curve at several
+    values of its parameter.
+
+    Parameters
+    ----------
+    n_points
+        The number of points defining the bezier curve.
+    alphas
+        The values of the parameter of the curve, between 0 and 1.
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape ``(len(alphas), n_points)``, whose product with the
+        points defining a bezier curve gives the points of the curve at each
+        of the ``alphas``.
+    """
+    alphas = np.asarray(alphas, dtype=float).reshape((-1, 1))
+    n = n_points - 1
+    k = np.arange(n_points)
+    coefficients = np.array([choose(n, i) for i in k])
+    return coefficients * (1 - alphas) ** (n - k) * alphas**k
+
+
 def partial_bezier_points(points: np.ndarray, a: float, b: float) -> np.ndarray:
     """Given an array of points which define bezier curve, and two numbers 0<=a<b<=1, return an array of the same size,
     which describes the portion of the original bezier curve on the interval [a, b].
 
-    This algorithm is pretty nifty, and pretty dense.
-
     Parameters
     ----------
     points : np.ndarray
@@ -74,9 +100,53 @@ def partial_bezier_points(points: np.ndarray, a: float, b: float) -> np.ndarray:
     if a == 1:
         return [points[-1]] * len(points)
 
-    a_to_1 = np.array([bezier(points[i:])(a) for i in range(len(points))])
+    # The points defining the portions of the curve on [a, 1] and on [0, b] are
+    # given by the steps of de Casteljau's algorithm.
+    points = np.asarray(points)
+    a_to_1 = np.empty(points.shape)
+    a_to_1[-1] = points[-1]
+    for i in range(len(points) - 2, -1, -1):
+        points = points[:-1] + a * (points[1:] - points[:-1])
+        a_to_1[i] = points[-1]
     end_prop = (b - a) / (1.0 - a)
-    return np.array([bezier(a_to_1[: i + 1])(end_prop) for i in range(len(points))])
+    result = np.empty(a_to_1.shape)
+    result[0] = a_to_1[0]
+    for i in range(1, len(result)):
+        a_to_1 = a_to_1[:-1] + end_prop * (a_to_1[1:] - a_to_1[:-1])
+        result[i] = a_to_1[0]
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def get_bezier_split_matrices(n_points: int, n_pieces: int) -> np.ndarray:
+    """Return the matrices splitting a bezier curve into pieces of equal
+    parameter length.
+
+    As :func:`partial_bezier_points` is linear in the points of the curve, the
+    ``k``-th piece of a curve defined by ``points`` is
+    ``matrices[k] @ points``, which is the result of
+    ``partial_bezier_points(points, k / n_pieces, (k + 1) / n_pieces)``. This
+    allows many curves to be split at once.
+
+    Parameters
+    ----------
+    n_points
+        The number of points defining each curve.
+    n_pieces
+        The number of pieces to split each curve into.
+
+    Returns
+    -------
+    np.ndarray
+        A read-only array of shape ``(n_pieces, n_points, n_points)``.
+    """
+    alphas = np.linspace(0, 1, n_pieces + 1)
+    identity = np.identity(n_points)
+    matrices = np.array(
+        [partial_bezier_points(identity, a1, a2) for a1, a2 in zip(alphas, alphas[1:])]
+    ).reshape((n_pieces, n_points, n_points))
+    matrices.setflags(write=False)
+    return matrices
 
 
 # Shortened version of partial_bezier_points just for quadratics,
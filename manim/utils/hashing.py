@@ -2,12 +2,15 @@
 
 import collections
 import copy
+import functools
+import hashlib
 import inspect
 import json
 import typing
+import weakref
 import zlib
 from time import perf_counter
-from types import FunctionType, MappingProxyType, MethodType, ModuleType
+from types import CodeType, FunctionType, MappingProxyType, MethodType, ModuleType
 from typing import Any
 
 import numpy as np
@@ -17,7 +20,19 @@ from .. import config, logger
 # Sometimes there are elements that are not suitable for hashing (too long or run-dependent)
 # This is used to filter them out.
 KEYS_TO_FILTER_OUT = set(
-    ["original_id", "background", "pixel_array", "pixel_array_to_cairo_context"]
+    [
+        "original_id",
+        "background",
+        "pixel_array",
+        "pixel_array_to_cairo_context",
+        "cairo_path_cache",
+        "dirty_region",
+        "_family_cache",
+        "_has_updaters_cache",
+        "_curve_lengths_cache",
+        "family_interpolation",
+        "def_map",
+    ]
 )
 
 
@@ -291,6 +306,270 @@ def get_json(obj):
     return json.dumps(obj, cls=_CustomEncoder)
 
 
+# Attribute values of these types are immutable, so an attribute holding one of them
+# can only change by being rebound. They are hashed once per object and cached.
+_LEAF_TYPES = frozenset([str, int, float, bool, complex, bytes, type(None)])
+
+# Digest of the bytecode, constants and names of the code objects hashed so far.
+_code_digests = weakref.WeakKeyDictionary()
+
+# Cached digests of the immutable attributes of objects (mostly mobjects).
+_attribute_digests = weakref.WeakKeyDictionary()
+
+
+class _AttributeDigest:
+    """Digest of the immutable attributes of an object, along with the keys of its
+    mutable attributes.
+
+    The digest is valid as long as the same attribute values are bound to the same
+    keys, which is checked by identity in :meth:`matches`. Mutable attributes
+    (arrays, lists, submobjects, updaters, ...) can change in place and are hashed
+    again on every play call.
+    """
+
+    __slots__ = ("size", "leaf_keys", "leaf_values", "volatile_keys", "digest")
+
+    def __init__(self, state: dict):
+        self.size = len(state)
+        self.leaf_keys = []
+        self.volatile_keys = []
+        for key, value in state.items():
+            if key in KEYS_TO_FILTER_OUT:
+                continue
+            if type(value) in _LEAF_TYPES:
+                self.leaf_keys.append(key)
+            else:
+                self.volatile_keys.append(key)
+        self.leaf_values = [state[key] for key in self.leaf_keys]
+        self.digest = hashlib.blake2b(
+            "".join(
+                f"{key}={type(value).__name__}:{value!r};"
+                for key, value in zip(self.leaf_keys, self.leaf_values)
+            ).encode(),
+            digest_size=16,
+        ).digest()
+
+    def matches(self, state: dict) -> bool:
+        if len(state) != self.size:
+            return False
+        try:
+            return all(
+                state[key] is value
+                for key, value in zip(self.leaf_keys, self.leaf_values)
+            ) and all(
+                type(state[key]) not in _LEAF_TYPES for key in self.volatile_keys
+            )
+        except KeyError:
+            return False
+
+
+class _StructuralHasher:
+    """Feeds the structure of arbitrary objects into a streaming hash.
+
+    Numpy arrays are fed through the buffer protocol, functions through their
+    bytecode and the values they reference, and other objects through their
+    ``__dict__``. Objects reached more than once during a hashing pass, including
+    circular references, are replaced by a reference to their first occurrence.
+
+    Parameters
+    ----------
+    ignored
+        Objects that are not hashed, e.g. the scene, only referenced.
+    """
+
+    def __init__(self, ignored: typing.Iterable[Any] = ()):
+        self._seen = {}
+        self._num_seen = 0
+        # Keeps the objects seen alive, so that their ids are not reused.
+        self._seen_objects = []
+        self.objects_hashed = 0
+        self.cached_objects = 0
+        for obj in ignored:
+            self._mark_as_seen(obj)
+
+    def hexdigest(self, obj: Any) -> str:
+        """Return the hexadecimal digest of ``obj``.
+
+        The objects seen are remembered across calls, so an object already hashed
+        by a previous call of the same hasher is only referenced.
+        """
+        h = hashlib.blake2b(digest_size=8)
+        self.update(h, obj)
+        return h.hexdigest()
+
+    def update(self, h, obj: Any) -> None:
+        """Feed ``obj`` into the hash object ``h``."""
+        obj_type = type(obj)
+        if obj_type in _LEAF_TYPES:
+            h.update(f"{obj_type.__name__}:{obj!r};".encode())
+        elif obj_type is tuple:
+            h.update(b"(")
+            for el in obj:
+                self.update(h, el)
+            h.update(b")")
+        elif self._feed_reference(h, obj):
+            return
+        elif isinstance(obj, np.ndarray):
+            self._update_array(h, obj)
+        elif isinstance(obj, (list, tuple)):
+            h.update(b"[")
+            for el in obj:
+                self.update(h, el)
+            h.update(b"]")
+        elif isinstance(obj, dict):
+            h.update(b"{")
+            for key, value in obj.items():
+                if key in KEYS_TO_FILTER_OUT:
+                    continue
+                self.update(h, key)
+                self.update(h, value)
+            h.update(b"}")
+        elif isinstance(obj, (set, frozenset)):
+            # The iteration order of sets depends on the hash seed of the process and
+            # on the ids of their elements, so the elements are hashed separately and
+            # the objects they contain are marked as seen in the order of the digests.
+            forks = sorted(
+                (self._fork_digest(el) for el in obj), key=lambda fork: fork[0]
+            )
+            h.update(b"<" + b"".join(digest for digest, _ in forks) + b">")
+            for _, fork in forks:
+                self._join(fork)
+        elif isinstance(obj, np.generic):
+            h.update(f"{obj.dtype.str}:".encode() + obj.tobytes())
+        elif isinstance(obj, FunctionType):
+            self._update_function(h, obj)
+        elif isinstance(obj, MethodType):
+            h.update(b"method:")
+            self.update(h, obj.__func__)
+            self.update(h, obj.__self__)
+        elif isinstance(obj, functools.partial):
+            h.update(b"partial:")
+            self.update(h, obj.func)
+            self.update(h, obj.args)
+            self.update(h, obj.keywords)
+        elif isinstance(obj, (type, ModuleType)):
+            h.update(f"{obj!r};".encode())
+        elif hasattr(obj, "__dict__"):
+            self._update_object(h, obj)
+        else:
+            h.update(f"{obj_type!r};".encode())
+
+    def _mark_as_seen(self, obj: Any) -> None:
+        self._seen[id(obj)] = self._num_seen
+        self._num_seen += 1
+        self._seen_objects.append(obj)
+
+    def _feed_reference(self, h, obj: Any) -> bool:
+        """Feed a reference to ``obj`` if it has already been hashed, otherwise
+        mark it as seen."""
+        index = self._seen.get(id(obj))
+        if index is None:
+            self._mark_as_seen(obj)
+            return False
+        h.update(f"ref:{index};".encode())
+        return True
+
+    def _fork_digest(self, obj: Any) -> typing.Tuple[bytes, "_StructuralHasher"]:
+        """Digest of ``obj``, computed by a hasher referencing the objects seen so
+        far, without marking the objects it hashes as seen.
+
+        Returns
+        -------
+        Tuple[bytes, _StructuralHasher]
+            The digest, and the hasher holding the objects seen while hashing ``obj``,
+            to be passed to :meth:`_join`.
+        """
+        fork = _StructuralHasher()
+        fork._seen = collections.ChainMap({}, self._seen)
+        fork._num_seen = self._num_seen
+        h = hashlib.blake2b(digest_size=8)
+        fork.update(h, obj)
+        return h.digest(), fork
+
+    def _join(self, fork: "_StructuralHasher") -> None:
+        """Mark the objects seen by a hasher returned by :meth:`_fork_digest` as
+        seen."""
+        for obj in fork._seen_objects:
+            if id(obj) not in self._seen:
+                self._mark_as_seen(obj)
+        self.objects_hashed += fork.objects_hashed
+        self.cached_objects += fork.cached_objects
+
+    def _update_array(self, h, array: np.ndarray) -> None:
+        h.update(f"array:{array.dtype.str}{array.shape};".encode())
+        if array.dtype.hasobject:
+            for el in array.flat:
+                self.update(h, el)
+        else:
+            h.update(np.ascontiguousarray(array))
+
+    def _update_function(self, h, function: FunctionType) -> None:
+        code = function.__code__
+        code_digest = _code_digests.get(code)
+        if code_digest is None:
+            code_digest = _code_digests[code] = _get_code_digest(code)
+        h.update(code_digest)
+        if function.__closure__ is not None:
+            for name, cell in zip(code.co_freevars, function.__closure__):
+                h.update(f"{name}=".encode())
+                try:
+                    self.update(h, cell.cell_contents)
+                except ValueError:
+                    # The cell has not been filled yet.
+                    h.update(b"empty;")
+        if function.__defaults__ is not None:
+            self.update(h, function.__defaults__)
+        referenced_globals = function.__globals__
+        for name in code.co_names:
+            if name in referenced_globals:
+                value = referenced_globals[name]
+                if not isinstance(value, ModuleType):
+                    h.update(f"{name}=".encode())
+                    self.update(h, value)
+
+    def _update_object(self, h, obj: Any) -> None:
+        state = obj.__dict__
+        if isinstance(state, MappingProxyType):
+            h.update(b"MappingProxy;")
+            return
+        self.objects_hashed += 1
+        try:
+            attributes = _attribute_digests.get(obj)
+        except TypeError:
+            # Unhashable objects cannot be cached.
+            attributes = None
+        if attributes is not None and attributes.matches(state):
+            self.cached_objects += 1
+        else:
+            attributes = _AttributeDigest(state)
+            try:
+                _attribute_digests[obj] = attributes
+            except TypeError:
+                pass
+        h.update(f"{type(obj).__qualname__}:".encode())
+        h.update(attributes.digest)
+        for key in attributes.volatile_keys:
+            h.update(f"{key}=".encode())
+            self.update(h, state[key])
+
+
+def _get_code_digest(code: CodeType) -> bytes:
+    """Digest of the bytecode of ``code``, the constants and names it uses.
+
+    Unlike the source code, this does not depend on where the function is defined
+    and is available for functions defined in doctests or interactive sessions.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(code.co_code)
+    h.update(repr((code.co_names, code.co_varnames, code.co_freevars)).encode())
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            h.update(_get_code_digest(const))
+        else:
+            h.update(f"{const!r};".encode())
+    return h.digest()
+
+
 def get_hash_from_play_call(
     scene_object, camera_object, animations_list, current_mobjects_list
 ) -> str:
@@ -317,18 +596,19 @@ def get_hash_from_play_call(
     """
     logger.debug("Hashing ...")
     t_start = perf_counter()
-    _Memoizer.mark_as_processed(scene_object)
-    camera_json = get_json(camera_object)
-    animations_list_json = [get_json(x) for x in sorted(animations_list, key=str)]
-    current_mobjects_list_json = [get_json(x) for x in current_mobjects_list]
-    hash_camera, hash_animations, hash_current_mobjects = [
-        zlib.crc32(repr(json_val).encode())
-        for json_val in [camera_json, animations_list_json, current_mobjects_list_json]
-    ]
+    hasher = _StructuralHasher(ignored=[scene_object])
+    hash_camera = hasher.hexdigest(camera_object)
+    hash_animations = hasher.hexdigest(sorted(animations_list, key=str))
+    hash_current_mobjects = hasher.hexdigest(list(current_mobjects_list))
     hash_complete = f"{hash_camera}_{hash_animations}_{hash_current_mobjects}"
     t_end = perf_counter()
-    logger.debug("Hashing done in %(time)s s.", {"time": str(t_end - t_start)[:8]})
-    # End of the hashing for the animation, reset all the memoize.
-    _Memoizer.reset_already_processed()
+    logger.debug(
+        "Hashing done in %(time)s s (%(objects)s objects, %(cached)s with cached attributes).",
+        {
+            "time": str(t_end - t_start)[:8],
+            "objects": hasher.objects_hashed,
+            "cached": hasher.cached_objects,
+        },
+    )
     logger.debug("Hash generated :  %(h)s", {"h": hash_complete})
     return hash_complete
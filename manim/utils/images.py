@@ -1,8 +1,16 @@
 """Image manipulation utilities."""
 
-__all__ = ["get_full_raster_image_path", "drag_pixels", "invert_image"]
+__all__ = [
+    "get_full_raster_image_path",
+    "drag_pixels",
+    "invert_image",
+    "alpha_composite",
+]
 
 
+import functools
+from typing import Tuple
+
 import numpy as np
 from PIL import Image
 
@@ -31,3 +39,69 @@ def invert_image(image):
     arr = np.array(image)
     arr = (255 * np.ones(arr.shape)).astype(arr.dtype) - arr
     return Image.fromarray(arr)
+
+
+def alpha_composite(
+    background: np.ndarray, foreground: np.ndarray, offset: Tuple[int, int] = (0, 0)
+) -> None:
+    """Composite an RGBA array over a part of another one, in place.
+
+    The result is identical, pixel for pixel, to
+    :meth:`PIL.Image.Image.alpha_composite`, whose integer arithmetic is
+    reproduced here. Only the part of ``background`` covered by ``foreground``
+    is read and written, so that small images can be composited over a large
+    frame without converting the frame to an image.
+
+    Parameters
+    ----------
+    background
+        The RGBA array to modify, of shape ``(height, width, 4)``.
+    foreground
+        The RGBA array to composite over ``background``.
+    offset
+        The ``(x, y)`` position of the upper left corner of ``foreground`` in
+        ``background``. The parts of ``foreground`` lying outside of
+        ``background`` are ignored.
+    """
+    x, y = (int(c) for c in offset)
+    height, width = foreground.shape[:2]
+    x0, y0 = max(x, 0), max(y, 0)
+    x1 = min(x + width, background.shape[1])
+    y1 = min(y + height, background.shape[0])
+    if x0 >= x1 or y0 >= y1:
+        return
+    dst = background[y0:y1, x0:x1]
+    src = foreground[y0 - y : y1 - y, x0 - x : x1 - x]
+    src_alpha = src[..., 3]
+    if not src_alpha.any():
+        return
+    coef_table, alpha_table = _get_alpha_composite_tables()
+    dst_alpha = dst[..., 3]
+    coef1 = coef_table[src_alpha, dst_alpha][..., None]
+    # A fully transparent foreground pixel has coef1 = 0, which leaves the
+    # background pixel unchanged.
+    tmp = src[..., :3] * coef1
+    tmp += dst[..., :3] * ((255 << _PRECISION_BITS) - coef1)
+    tmp += 0x80 << _PRECISION_BITS
+    tmp += tmp >> 8
+    tmp >>= 8 + _PRECISION_BITS
+    dst[..., 3] = alpha_table[src_alpha, dst_alpha]
+    dst[..., :3] = tmp
+
+
+# Pillow's alpha compositing uses fixed point arithmetic, with 7 extra bits of
+# precision. A value v is divided by 255, rounding, as ((v >> 8) + v) >> 8.
+_PRECISION_BITS = 7
+
+
+@functools.lru_cache(maxsize=None)
+def _get_alpha_composite_tables() -> Tuple[np.ndarray, np.ndarray]:
+    """The coefficient of the foreground color, and the resulting alpha, of
+    the alpha compositing of two pixels, indexed by their alpha values."""
+    src_alpha = np.arange(256, dtype=np.uint32)[:, None]
+    dst_alpha = np.arange(256, dtype=np.uint32)[None, :]
+    out_alpha_255 = src_alpha * 255 + dst_alpha * (255 - src_alpha)
+    coef = (src_alpha * (255 * 255 << _PRECISION_BITS)) // np.maximum(out_alpha_255, 1)
+    out_alpha_255 += 0x80
+    alpha = (((out_alpha_255 >> 8) + out_alpha_255) >> 8).astype(np.uint8)
+    return coef, alpha
@@ -0,0 +1,112 @@
+"""Utilities to run parts of a render in worker processes."""
+
+__all__ = ["ForkedWorkerPool", "fork_is_available", "get_worker_count"]
+
+
+import multiprocessing
+import multiprocessing.connection
+import os
+import typing
+
+from .. import config, logger
+
+
+def fork_is_available() -> bool:
+    """Whether worker processes can be started with the ``fork`` start method.
+
+    Worker processes inherit the whole state of the scene (mobjects, animations,
+    updater closures) from the parent at the moment they are forked, so nothing
+    has to be pickled. Platforms without ``fork`` (e.g. Windows) render
+    sequentially instead.
+
+    Returns
+    -------
+    :class:`bool`
+        ``True`` if ``fork`` is a supported start method.
+    """
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def get_worker_count() -> int:
+    """Get the number of worker processes to use, as set by ``config.render_workers``.
+
+    Returns
+    -------
+    :class:`int`
+        The number of workers. A value of ``0`` in the config means one worker
+        per available core.
+    """
+    workers = config["render_workers"]
+    if not workers:
+        workers = os.cpu_count() or 1
+    return workers
+
+
+class ForkedWorkerPool:
+    """A bounded pool of forked worker processes.
+
+    Each submitted job is run in a freshly forked process, so that it sees a
+    snapshot of the parent process as it was at submission time. At most
+    ``max_workers`` jobs run simultaneously; submitting a job while the pool
+    is full blocks until one of the running jobs is done.
+
+    Parameters
+    ----------
+    max_workers
+        The maximum number of jobs running at the same time.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max(1, max_workers)
+        self._context = multiprocessing.get_context("fork")
+        self._running = []
+        self._failed = []
+
+    def submit(self, job: typing.Callable[[], None], description: str = "") -> None:
+        """Run ``job`` in a new worker process.
+
+        Parameters
+        ----------
+        job
+            The function to call in the worker process. It is not pickled.
+        description
+            A description of the job, used when reporting failures.
+        """
+        while len(self._running) >= self.max_workers:
+            self._wait_for_one()
+        process = self._context.Process(target=job, name=description, daemon=False)
+        process.start()
+        self._running.append(process)
+        logger.debug(f"Started worker process {process.pid} for {description}.")
+
+    def join(self) -> None:
+        """Wait for all the submitted jobs to be done.
+
+        Raises
+        ------
+        :class:`RuntimeError`
+            If any of the jobs exited with a non-zero exit code.
+        """
+        while self._running:
+            self._wait_for_one()
+        if self._failed:
+            failed, self._failed = self._failed, []
+            raise RuntimeError(
+                f"{len(failed)} worker process(es) failed: " + ", ".join(failed)
+            )
+
+    def _wait_for_one(self) -> None:
+        sentinels = [process.sentinel for process in self._running]
+        multiprocessing.connection.wait(sentinels)
+        still_running = []
+        for process in self._running:
+            if process.is_alive():
+                still_running.append(process)
+                continue
+            process.join()
+            if process.exitcode != 0:
+                self._failed.append(process.name)
+                logger.error(
+                    f"Worker process for {process.name} exited with code {process.exitcode}."
+                )
+        self._running = still_running
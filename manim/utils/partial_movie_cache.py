@@ -0,0 +1,194 @@
+"""Index of the partial movie files cached by manim.
+
+Partial movie files are named after the hash of the play call that produced
+them, so that a directory of partial movie files can be shared by several
+scenes, and even several projects, rendering identical animations. Instead of
+listing the directory and checking the access time of every file, the cache
+keeps an SQLite index next to the files, recording for each partial movie file
+its hash, size, last use and the scene that produced it.
+"""
+
+__all__ = ["PartialMovieCache"]
+
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Tuple
+
+from .. import logger
+
+# Extensions of the partial movie files, see ManimConfig.movie_file_extension.
+MOVIE_FILE_EXTENSIONS = (".mp4", ".mov", ".webm")
+
+
+class PartialMovieCache:
+    """The partial movie files of a cache directory, and their index.
+
+    The index is an SQLite database, so that several manim processes can use the
+    same cache directory at the same time. It is only opened for the duration of
+    each operation, which makes a cache safe to use from forked processes.
+
+    Parameters
+    ----------
+    directory
+        The directory containing the partial movie files.
+    extension
+        The extension of the partial movie files, including the dot.
+    """
+
+    INDEX_FILE_NAME = "partial_movie_index.sqlite"
+
+    def __init__(self, directory: str, extension: str):
+        self.directory = directory
+        self.extension = extension
+        self.index_path = os.path.join(directory, self.INDEX_FILE_NAME)
+
+    @contextmanager
+    def _open_index(self) -> Iterator[sqlite3.Connection]:
+        """Open the index for a single transaction, creating it if needed."""
+        new_index = not os.path.exists(self.index_path)
+        connection = sqlite3.connect(self.index_path, timeout=60)
+        try:
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS partial_movies ("
+                    "hash TEXT NOT NULL, "
+                    "extension TEXT NOT NULL, "
+                    "size INTEGER NOT NULL, "
+                    "last_used REAL NOT NULL, "
+                    "scene TEXT, "
+                    "PRIMARY KEY (hash, extension))"
+                )
+                if new_index:
+                    self._index_existing_files(connection)
+                yield connection
+        finally:
+            connection.close()
+
+    def _index_existing_files(self, connection: sqlite3.Connection) -> None:
+        """Index the partial movie files written before the index existed."""
+        rows = []
+        for entry in os.scandir(self.directory):
+            hash_invocation, extension = os.path.splitext(entry.name)
+            if (
+                extension not in MOVIE_FILE_EXTENSIONS
+                or "_shard" in hash_invocation
+                or not entry.is_file()
+            ):
+                continue
+            stat = entry.stat()
+            rows.append((hash_invocation, extension, stat.st_size, stat.st_atime))
+        connection.executemany(
+            "INSERT OR IGNORE INTO partial_movies VALUES (?, ?, ?, ?, NULL)",
+            rows,
+        )
+        if rows:
+            logger.debug(
+                f"Indexed {len(rows)} existing partial movie file(s) in %(dir)s",
+                {"dir": self.directory},
+            )
+
+    def get_path(self, hash_invocation: str) -> str:
+        """The path of the partial movie file of a play call."""
+        return os.path.join(self.directory, f"{hash_invocation}{self.extension}")
+
+    def __contains__(self, hash_invocation: str) -> bool:
+        """Whether the partial movie file of a play call is cached.
+
+        The file itself is looked up rather than the index: another process may
+        have evicted it, and files written by a worker process or by a version
+        of manim without index may not be indexed yet.
+        """
+        return os.path.exists(self.get_path(hash_invocation))
+
+    def record_use(self, file_paths: Iterable[str], scene_name: str) -> None:
+        """Index the partial movie files used by a scene, marking them as the
+        most recently used.
+
+        Parameters
+        ----------
+        file_paths
+            The partial movie files of the scene.
+        scene_name
+            The name of the scene, recorded for the files it produced.
+        """
+        now = time.time()
+        rows = []
+        for file_path in file_paths:
+            try:
+                size = os.path.getsize(file_path)
+            except OSError:
+                continue
+            hash_invocation, extension = os.path.splitext(os.path.basename(file_path))
+            rows.append((hash_invocation, extension, size, now, scene_name))
+        with self._open_index() as connection:
+            # Files reused from the cache keep the scene that produced them.
+            connection.executemany(
+                "INSERT INTO partial_movies VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(hash, extension) DO UPDATE SET "
+                "size = excluded.size, last_used = excluded.last_used",
+                rows,
+            )
+
+    def get_usage(self) -> Tuple[int, int]:
+        """The number of partial movie files indexed, and their total size in
+        bytes."""
+        with self._open_index() as connection:
+            return connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM partial_movies"
+            ).fetchone()
+
+    def evict(self, max_files: float, max_size: float) -> Tuple[int, int]:
+        """Remove the least recently used partial movie files until the cache
+        holds at most ``max_files`` files of ``max_size`` bytes in total.
+
+        Returns
+        -------
+        Tuple[int, int]
+            The number of files removed and the number of bytes freed.
+        """
+        evicted = []
+        freed = 0
+        with self._open_index() as connection:
+            count, size = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM partial_movies"
+            ).fetchone()
+            if count <= max_files and size <= max_size:
+                return 0, 0
+            for hash_invocation, extension, file_size in connection.execute(
+                "SELECT hash, extension, size FROM partial_movies ORDER BY last_used"
+            ).fetchall():
+                if count - len(evicted) <= max_files and size - freed <= max_size:
+                    break
+                evicted.append((hash_invocation, extension))
+                freed += file_size
+            connection.executemany(
+                "DELETE FROM partial_movies WHERE hash = ? AND extension = ?",
+                evicted,
+            )
+        self._remove_files(evicted)
+        return len(evicted), freed
+
+    def flush(self) -> int:
+        """Remove all the partial movie files of the cache.
+
+        Returns
+        -------
+        int
+            The number of files removed.
+        """
+        with self._open_index() as connection:
+            files = connection.execute(
+                "SELECT hash, extension FROM partial_movies"
+            ).fetchall()
+            connection.execute("DELETE FROM partial_movies")
+        self._remove_files(files)
+        return len(files)
+
+    def _remove_files(self, files: Iterable[Tuple[str, str]]) -> None:
+        for hash_invocation, extension in files:
+            try:
+                os.remove(os.path.join(self.directory, hash_invocation + extension))
+            except FileNotFoundError:
+                pass
@@ -33,6 +33,7 @@ __all__ = [
 
 import itertools as it
 import math
+from collections import OrderedDict
 from functools import reduce
 from typing import List, Optional, Sequence, Tuple, Union
 
@@ -662,10 +663,27 @@ def cross2d(a, b):
         return a[0] * b[1] - b[0] * a[1]
 
 
-def earclip_triangulation(verts: np.ndarray, ring_ends: list) -> list:
-    """Returns a list of indices giving a triangulation
+# The maximum number of ring layouts whose triangulation is kept in memory.
+EARCLIP_CACHE_SIZE = 1024
+
+# The affine references and triangulations of the most recently triangulated
+# polygons, by number of vertices and ends of rings. Animating a filled
+# mobject triangulates it again on each frame, although moving, rotating or
+# scaling it doesn't change its triangulation, and a text has the same
+# outlines for each occurrence of a character.
+_earclip_triangulations: "OrderedDict[Tuple[int, bytes], Tuple[Tuple[np.ndarray, np.ndarray], np.ndarray]]" = (
+    OrderedDict()
+)
+
+
+def earclip_triangulation(verts: np.ndarray, ring_ends: list) -> np.ndarray:
+    """Returns the indices giving a triangulation
     of a polygon, potentially with holes.
 
+    The triangulation of the most recently triangulated polygons is kept,
+    and reused for polygons with the same rings which are an affine image
+    of them, e.g. moved, rotated or scaled copies.
+
     Parameters
     ----------
     verts
@@ -676,40 +694,95 @@ def earclip_triangulation(verts: np.ndarray, ring_ends: list) -> list:
 
     Returns
     -------
-    list
-        A list of indices giving a triangulation of a polygon.
+    np.ndarray
+        An array of indices giving a triangulation of a polygon.
     """
+    verts = np.asarray(verts)
+    ring_ends = np.asarray(ring_ends, dtype=np.int64)
+    key = (len(verts), ring_ends.tobytes())
+    cached = _earclip_triangulations.get(key)
+    if cached is not None:
+        _earclip_triangulations.move_to_end(key)
+        reference, cached_indices = cached
+        if _is_affine_image(verts[:, :2], reference):
+            return cached_indices.copy()
+
+    indices = _connect_rings(verts, ring_ends)
+    meta_indices = earcut(verts[indices, :2], [len(indices)])
+    tri_indices = indices[meta_indices.astype(int)]
+    reference = _get_affine_reference(verts[:, :2])
+    if reference is not None:
+        _earclip_triangulations[key] = (reference, tri_indices.copy())
+        if len(_earclip_triangulations) > EARCLIP_CACHE_SIZE:
+            _earclip_triangulations.popitem(last=False)
+    return tri_indices
+
+
+def _get_affine_reference(
+    points: np.ndarray,
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """The offsets of two dimensional points from their center, along with their
+    pseudo-inverse, to be compared with other points by
+    :func:`_is_affine_image`, or ``None`` if the points are aligned."""
+    if len(points) < 3:
+        return None
+    offsets = points - points.mean(0)
+    if not np.isfinite(offsets).all():
+        return None
+    u, s, vh = np.linalg.svd(offsets, full_matrices=False)
+    if len(s) < 2 or s[1] <= 1e-12 * s[0]:
+        return None
+    return offsets, (vh.T / s) @ u.T
+
+
+def _is_affine_image(
+    points: np.ndarray, reference: Tuple[np.ndarray, np.ndarray]
+) -> bool:
+    """Whether two dimensional points are the image of reference points by an
+    affine map preserving orientation, so that any triangulation of the
+    reference points is also a triangulation of the points."""
+    reference_offsets, reference_inverse = reference
+    offsets = points - points.mean(0)
+    # The linear part of the map, by least squares.
+    matrix = reference_inverse @ offsets
+    if not np.linalg.det(matrix) > 0:
+        return False
+    error = np.abs(reference_offsets @ matrix - offsets).max()
+    return error <= 1e-9 * max(np.abs(offsets).max(), 1e-3)
+
+
+def _connect_rings(verts: np.ndarray, ring_ends: np.ndarray) -> np.ndarray:
+    """The indices of the vertices walking around the polygon with holes, once
+    its rings are connected to each other."""
     # First, connect all the rings so that the polygon
     # with holes is instead treated as a (very convex)
     # polygon with one edge.  Do this by drawing connections
     # between rings close to each other
-    rings = [list(range(e0, e1)) for e0, e1 in zip([0, *ring_ends], ring_ends)]
-    attached_rings = rings[:1]
-    detached_rings = rings[1:]
+    if len(ring_ends) <= 1:
+        return np.arange(len(verts))
+    ring_starts = np.concatenate(([0], ring_ends[:-1]))
+    ring_of_vertex = np.repeat(np.arange(len(ring_ends)), ring_ends - ring_starts)
+    # The vertices of the attached rings, in the order the rings were attached,
+    # and of the detached rings, excluding the vertices already used to draw
+    # some connection.
+    i_range = np.arange(ring_ends[0])
+    j_range = np.arange(ring_ends[0], ring_ends[-1])
     loop_connections = {}
 
-    while detached_rings:
-        i_range, j_range = [
-            list(
-                filter(
-                    # Ignore indices that are already being
-                    # used to draw some connection
-                    lambda i: i not in loop_connections,
-                    it.chain(*ring_group),
-                )
-            )
-            for ring_group in (attached_rings, detached_rings)
-        ]
+    def closest(candidates, point):
+        offsets = verts[candidates] - point
+        return int(candidates[np.argmin(np.einsum("ij,ij->i", offsets, offsets))])
 
+    while len(j_range):
         # Closest point on the attached rings to an estimated midpoint
         # of the detached rings
         tmp_j_vert = midpoint(verts[j_range[0]], verts[j_range[len(j_range) // 2]])
-        i = min(i_range, key=lambda i: norm_squared(verts[i] - tmp_j_vert))
+        i = closest(i_range, tmp_j_vert)
         # Closest point of the detached rings to the aforementioned
         # point of the attached rings
-        j = min(j_range, key=lambda j: norm_squared(verts[i] - verts[j]))
+        j = closest(j_range, verts[i])
         # Recalculate i based on new j
-        i = min(i_range, key=lambda i: norm_squared(verts[i] - verts[j]))
+        i = closest(i_range, verts[j])
 
         # Remember to connect the polygon at these points
         loop_connections[i] = j
@@ -717,23 +790,25 @@ def earclip_triangulation(verts: np.ndarray, ring_ends: list) -> list:
 
         # Move the ring which j belongs to from the
         # attached list to the detached list
-        new_ring = next(filter(lambda ring: ring[0] <= j < ring[-1], detached_rings))
-        detached_rings.remove(new_ring)
-        attached_rings.append(new_ring)
+        new_ring = ring_of_vertex[j]
+        i_range = np.concatenate(
+            (
+                i_range[i_range != i],
+                np.arange(ring_starts[new_ring], j),
+                np.arange(j + 1, ring_ends[new_ring]),
+            )
+        )
+        j_range = j_range[ring_of_vertex[j_range] != new_ring]
 
     # Setup linked list
-    after = []
-    end0 = 0
-    for end1 in ring_ends:
-        after.extend(range(end0 + 1, end1))
-        after.append(end0)
-        end0 = end1
+    after = np.arange(1, len(verts) + 1)
+    after[ring_ends - 1] = ring_starts
+    after = after.tolist()
 
     # Find an ordering of indices walking around the polygon
     indices = []
     i = 0
     for _ in range(len(verts) + len(ring_ends) - 1):
-        # starting = False
         if i in loop_connections:
             j = loop_connections[i]
             indices.extend([i, j])
@@ -743,9 +818,7 @@ def earclip_triangulation(verts: np.ndarray, ring_ends: list) -> list:
             i = after[i]
         if i == 0:
             break
-
-    meta_indices = earcut(verts[indices, :2], [len(indices)])
-    return [indices[mi] for mi in meta_indices]
+    return np.array(indices)
 
 
 def cartesian_to_spherical(vec):
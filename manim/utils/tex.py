@@ -210,6 +210,49 @@ class TexTemplate:
         begin, end = self._texcode_for_environment(environment)
         return self.body.replace(self.placeholder_text, f"{begin}\n{expression}\n{end}")
 
+    def get_texcode_for_expressions_on_pages(self, expressions, environment=None):
+        r"""Inserts several expressions into TeX template, each on its own page, so
+        that they can be typeset by a single compilation.
+
+        The pages are created with the ``multi`` option of the ``standalone``
+        document class, so this is only supported by templates using this class,
+        like the default template.
+
+        Parameters
+        ----------
+        expressions : List[:class:`str`]
+            The strings containing the expressions to be typeset.
+        environment : Optional[:class:`str`], optional
+            The string containing the environment in which each expression should be typeset, e.g. ``align*``
+
+        Returns
+        -------
+        Optional[:class:`str`]
+            LaTeX code based on current template, with a page for each expression, or ``None``
+            if the template does not use the ``standalone`` document class.
+        """
+        match = re.fullmatch(
+            r"\\documentclass(?:\[(.*)\])?\{standalone\}", self.documentclass.strip()
+        )
+        if match is None or self.documentclass not in self.body:
+            return None
+        options = [match[1]] if match[1] else []
+        documentclass = r"\documentclass[%s]{standalone}" % ",".join(
+            options + ["multi=manimpage"]
+        )
+        if environment is not None:
+            begin, end = self._texcode_for_environment(environment)
+            expressions = [
+                f"{begin}\n{expression}\n{end}" for expression in expressions
+            ]
+        pages = "\n".join(
+            f"\\begin{{manimpage}}\n{expression}\n\\end{{manimpage}}"
+            for expression in expressions
+        )
+        return self.body.replace(self.documentclass, documentclass, 1).replace(
+            self.placeholder_text, pages
+        )
+
     def copy(self) -> "TexTemplate":
         return copy.deepcopy(self)
 
@@ -10,6 +10,7 @@ import hashlib
 import os
 import re
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .. import config, logger
@@ -43,12 +44,160 @@ def tex_to_svg_file(expression, environment=None, tex_template=None):
     if tex_template is None:
         tex_template = config["tex_template"]
     tex_file = generate_tex_file(expression, environment, tex_template)
+    return tex_file_to_svg_file(tex_file, tex_template)
+
+
+def tex_file_to_svg_file(tex_file, tex_template):
+    """Compiles a TeX file generated by :func:`generate_tex_file`, unless it has
+    already been converted to SVG.
+
+    Parameters
+    ----------
+    tex_file : :class:`str`
+        File name of TeX file to be typeset.
+    tex_template : :class:`~.TexTemplate`
+        Template class used to generate the TeX file.
+
+    Returns
+    -------
+    :class:`str`
+        Path to generated SVG file.
+    """
+    svg_file = Path(tex_file).with_suffix(".svg").as_posix()
+    if os.path.exists(svg_file):
+        return svg_file
     dvi_file = compile_tex(
         tex_file, tex_template.tex_compiler, tex_template.output_format
     )
     return convert_to_svg(dvi_file, tex_template.output_format)
 
 
+def tex_to_svg_files(expressions, environment=None, tex_template=None):
+    """Takes several tex expressions and returns the svg versions of the compiled
+    tex, compiling all the expressions that were not compiled yet at once.
+
+    Starting the TeX compiler takes much longer than typesetting an expression,
+    so the expressions are typeset as the pages of a single document, which is
+    then split into an SVG file per page. Templates which do not support this,
+    and documents which fail to compile, fall back to compiling each
+    expression by itself.
+
+    Parameters
+    ----------
+    expressions : Iterable[:class:`str`]
+        Strings containing the TeX expressions to be rendered, e.g. ``\\sqrt{2}`` or ``foo``
+    environment : Optional[:class:`str`], optional
+        The string containing the environment in which the expressions should be typeset, e.g. ``align*``
+    tex_template : Optional[:class:`~.TexTemplate`], optional
+        Template class used to typesetting. If not set, use default template set via `config["tex_template"]`
+
+    Returns
+    -------
+    List[:class:`str`]
+        Paths to generated SVG files, in the order of the expressions.
+    """
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    expressions = list(expressions)
+    tex_files = [
+        generate_tex_file(expression, environment, tex_template)
+        for expression in expressions
+    ]
+    pending = {
+        tex_file: expression
+        for tex_file, expression in zip(tex_files, expressions)
+        if not Path(tex_file).with_suffix(".svg").exists()
+    }
+    if len(pending) > 1:
+        compile_tex_pages(
+            list(pending), list(pending.values()), environment, tex_template
+        )
+    return [tex_file_to_svg_file(tex_file, tex_template) for tex_file in tex_files]
+
+
+def tex_to_svg_files_in_parallel(batches, max_workers=None):
+    """Calls :func:`tex_to_svg_files` for several batches of expressions at
+    once, e.g. for expressions using different templates, which can't be
+    compiled as a single document.
+
+    Parameters
+    ----------
+    batches : Iterable[Tuple[Iterable[:class:`str`], Optional[:class:`str`], Optional[:class:`~.TexTemplate`]]]
+        The expressions, environment and template of each batch.
+    max_workers : Optional[:class:`int`], optional
+        The maximum number of batches compiled at the same time. Defaults to the number of processors.
+
+    Returns
+    -------
+    List[List[:class:`str`]]
+        Paths to generated SVG files of each batch.
+    """
+    # The compilation happens in subprocesses, so threads are enough.
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        futures = [executor.submit(tex_to_svg_files, *batch) for batch in batches]
+        return [future.result() for future in futures]
+
+
+def compile_tex_pages(tex_files, expressions, environment, tex_template):
+    """Typesets several expressions as the pages of a single document, and
+    converts each page to the SVG file of its expression.
+
+    Parameters
+    ----------
+    tex_files : List[:class:`str`]
+        The TeX files generated for the expressions by :func:`generate_tex_file`.
+    expressions : List[:class:`str`]
+        The expressions.
+    environment : Optional[:class:`str`]
+        The environment in which the expressions should be typeset.
+    tex_template : :class:`~.TexTemplate`
+        Template class used to typesetting.
+
+    Returns
+    -------
+    :class:`bool`
+        Whether an SVG file was generated for each expression.
+    """
+    output = tex_template.get_texcode_for_expressions_on_pages(expressions, environment)
+    if output is None:
+        return False
+    tex_dir = Path(config.get_dir("tex_dir")).as_posix()
+    document = Path(tex_dir, f"pages_{tex_hash(output)}.tex").as_posix()
+    with open(document, "w", encoding="utf-8") as outfile:
+        outfile.write(output)
+    output_format = tex_template.output_format
+    command = tex_compilation_command(
+        tex_template.tex_compiler, output_format, document, tex_dir
+    )
+    logger.info(f"Compiling {len(expressions)} TeX expressions in {document}")
+    if os.system(command) != 0:
+        logger.debug(f"Compilation of {document} failed, compiling each expression")
+        return False
+    dvi_file = Path(document).with_suffix(output_format).as_posix()
+    # dvisvgm replaces %p with the page number.
+    page_prefix = Path(document).with_suffix("").as_posix() + "-"
+    os.system(dvisvgm_command(dvi_file, output_format, "1-", f"{page_prefix}%p.svg"))
+
+    def page_file(page):
+        # Page numbers may be padded with zeros to the number of digits of the
+        # number of pages.
+        for name in (f"{page}", f"{page:0{len(str(len(tex_files)))}d}"):
+            if os.path.exists(f"{page_prefix}{name}.svg"):
+                return f"{page_prefix}{name}.svg"
+        return None
+
+    page_files = [page_file(page) for page in range(1, len(tex_files) + 2)]
+    if None in page_files[:-1] or page_files[-1] is not None:
+        logger.debug(f"Unexpected pages in {dvi_file}, compiling each expression")
+        for file in page_files:
+            if file is not None:
+                os.remove(file)
+        return False
+    for file, tex_file in zip(page_files, tex_files):
+        os.replace(file, Path(tex_file).with_suffix(".svg"))
+    return True
+
+
 def generate_tex_file(expression, environment=None, tex_template=None):
     """Takes a tex expression (and an optional tex environment),
     and returns a fully formed tex file ready for compilation.
@@ -260,18 +409,7 @@ def convert_to_svg(dvi_file, extension, page=1):
     result = Path(result).as_posix()
     dvi_file = Path(dvi_file).as_posix()
     if not os.path.exists(result):
-        commands = [
-            "dvisvgm",
-            "--pdf" if extension == ".pdf" else "",
-            "-p " + str(page),
-            f'"{dvi_file}"',
-            "-n",
-            "-v 0",
-            "-o " + f'"{result}"',
-            ">",
-            os.devnull,
-        ]
-        os.system(" ".join(commands))
+        os.system(dvisvgm_command(dvi_file, extension, page, result))
 
     # if the file does not exist now, this means conversion failed
     if not os.path.exists(result):
@@ -283,3 +421,37 @@ def convert_to_svg(dvi_file, extension, page=1):
         )
 
     return result
+
+
+def dvisvgm_command(dvi_file, extension, pages, output):
+    """Prepares the dvisvgm command converting pages of a .dvi, .xdv, or .pdf
+    file into svg.
+
+    Parameters
+    ----------
+    dvi_file : :class:`str`
+        File name of the input file to be converted.
+    extension : :class:`str`
+        String containing the file extension and thus indicating the file type, e.g. ``.dvi`` or ``.pdf``
+    pages : Union[:class:`int`, :class:`str`]
+        Page or range of pages to be converted, e.g. ``1`` or ``"1-"``.
+    output : :class:`str`
+        File name of the generated SVG file, in which dvisvgm replaces ``%p`` with the page number.
+
+    Returns
+    -------
+    :class:`str`
+        Conversion command according to given parameters
+    """
+    commands = [
+        "dvisvgm",
+        "--pdf" if extension == ".pdf" else "",
+        "-p " + str(pages),
+        f'"{dvi_file}"',
+        "-n",
+        "-v 0",
+        "-o " + f'"{output}"',
+        ">",
+        os.devnull,
+    ]
+    return " ".join(commands)
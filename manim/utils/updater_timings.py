@@ -0,0 +1,70 @@
+"""Timing of the updaters of mobjects, enabled by ``config.profile_updaters``."""
+
+__all__ = ["time_updater_call", "log_updater_timings"]
+
+
+import os
+import time
+import typing
+
+from .. import logger
+
+# For each updater called since the timings were last logged: the updater, its
+# number of calls and their total duration in seconds. Updaters are indexed by
+# their code, so that the updaters created by the same function or lambda
+# expression for different mobjects are timed together.
+_updater_timings: typing.Dict[typing.Any, typing.List] = {}
+
+
+def time_updater_call(updater: typing.Callable, *args) -> None:
+    """Call an updater, and add the duration of the call to its timings."""
+    start = time.perf_counter()
+    updater(*args)
+    duration = time.perf_counter() - start
+    function = getattr(updater, "__func__", updater)
+    # Callables without code are indexed by their id, which can't be reused
+    # while the updater is referenced here.
+    key = getattr(function, "__code__", None) or id(updater)
+    timing = _updater_timings.get(key)
+    if timing is None:
+        _updater_timings[key] = [updater, 1, duration]
+    else:
+        timing[1] += 1
+        timing[2] += duration
+
+
+def get_updater_description(updater: typing.Callable) -> str:
+    """The name of an updater, and where it is defined if that is known."""
+    function = getattr(updater, "__func__", updater)
+    name = getattr(function, "__qualname__", type(updater).__qualname__)
+    code = getattr(function, "__code__", None)
+    if code is None:
+        return name
+    return f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def log_updater_timings(scene_name: str, max_updaters: int = 10) -> None:
+    """Log the updaters which took the most time since the last call, and
+    reset the timings.
+
+    The duration of an updater includes the time spent in the updaters it
+    calls itself, e.g. through :meth:`~.Mobject.update`.
+
+    Parameters
+    ----------
+    scene_name
+        The name of the scene whose updaters were timed.
+    max_updaters
+        The maximum number of updaters to list.
+    """
+    timings = sorted(_updater_timings.values(), key=lambda t: t[2], reverse=True)
+    _updater_timings.clear()
+    if not timings:
+        return
+    lines = [f"Slowest updaters of {scene_name}:"]
+    for updater, calls, duration in timings[:max_updaters]:
+        lines.append(
+            f"{1000 * duration:.1f} ms, {calls} calls: "
+            f"{get_updater_description(updater)}"
+        )
+    logger.info("\n".join(lines))
@@ -0,0 +1,69 @@
+import numpy as np
+from PIL import Image
+
+from manim import LEFT, RIGHT, Camera, Dot, Square
+from manim.utils.images import alpha_composite
+
+
+def test_dirty_regions_match_full_redraw():
+    camera = Camera()
+    reference_camera = Camera(use_dirty_regions=False)
+    background = np.array(camera.pixel_array)
+    background[: background.shape[0] // 2] = 255
+    dot = Dot()
+    square = Square().shift(3 * LEFT)
+    for _ in range(5):
+        dot.shift(0.5 * RIGHT)
+        square.rotate(0.3).set_stroke(width=20)
+        camera.capture_mobjects_over_background([dot, square], background)
+        reference_camera.capture_mobjects_over_background([dot, square], background)
+        np.testing.assert_array_equal(camera.pixel_array, reference_camera.pixel_array)
+    assert camera.dirty_region is not None
+
+
+def test_pixel_bounding_box():
+    camera = Camera()
+    dot = Dot()
+    x0, y0, x1, y1 = camera.get_pixel_bounding_box([dot])
+    assert 0 < x0 < camera.pixel_width / 2 < x1 < camera.pixel_width
+    assert 0 < y0 < camera.pixel_height / 2 < y1 < camera.pixel_height
+    assert camera.get_pixel_bounding_box([dot.shift(100 * RIGHT)]) is None
+
+
+def test_overlay_rgba_array_matches_pil():
+    camera = Camera(pixel_width=64, pixel_height=36)
+    rng = np.random.default_rng(0)
+    pixel_array = rng.integers(0, 256, (36, 64, 4), dtype=np.uint8)
+    new_array = np.zeros_like(pixel_array)
+    new_array[5:20, 10:50] = rng.integers(0, 256, (15, 40, 4), dtype=np.uint8)
+    expected = np.array(
+        Image.alpha_composite(
+            Image.fromarray(pixel_array, mode="RGBA"),
+            Image.fromarray(new_array, mode="RGBA"),
+        )
+    )
+    camera.overlay_rgba_array(pixel_array, new_array)
+    np.testing.assert_array_equal(pixel_array, expected)
+
+
+def test_alpha_composite_clips_to_background():
+    background = np.zeros((10, 10, 4), dtype=np.uint8)
+    foreground = np.full((4, 4, 4), 255, dtype=np.uint8)
+    alpha_composite(background, foreground, offset=(-2, 8))
+    assert background.sum() == 2 * 2 * 4 * 255
+    assert (background[8:, :2] == 255).all()
+
+
+def test_cairo_path_cache_is_invalidated_by_point_changes():
+    camera = Camera()
+    reference_camera = Camera()
+    square = Square(fill_opacity=1)
+    camera.capture_mobjects([square])
+    assert square in camera.cairo_path_cache
+    for _ in range(2):
+        # Points modified in place, as in Mobject.shift
+        square.points += 0.5 * RIGHT
+        camera.capture_mobjects([square])
+        reference_camera.cairo_path_cache.clear()
+        reference_camera.capture_mobjects([square])
+        np.testing.assert_array_equal(camera.pixel_array, reference_camera.pixel_array)
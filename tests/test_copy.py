@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from manim import BraceLabel, Mobject, config
+from manim import Arrow, BraceLabel, Mobject, VGroup, config
 
 
 def test_mobject_copy():
@@ -16,6 +16,27 @@ def test_mobject_copy():
         assert orig.submobjects[i] is not copy.submobjects[i]
 
 
+def test_mobject_shallow_copy():
+    """Test that a shallow copy copies the structure of the mobject."""
+    orig = VGroup(Arrow(), Arrow())
+    orig.label = orig[1]
+    copy = orig.copy(shallow=True)
+
+    assert copy.submobjects is not orig.submobjects
+    for orig_arrow, copy_arrow in zip(orig, copy):
+        assert copy_arrow is not orig_arrow
+        assert copy_arrow.tip is not orig_arrow.tip
+        assert copy_arrow.tip is copy_arrow.submobjects[0]
+        assert copy_arrow.points is not orig_arrow.points
+        assert copy_arrow.fill_rgbas is not orig_arrow.fill_rgbas
+    assert copy.label is copy[1]
+
+    start = orig[0].get_start()
+    copy.shift([1, 0, 0])
+    assert (orig[0].get_start() == start).all()
+    assert copy[0].get_start()[0] == start[0] + 1
+
+
 def test_bracelabel_copy(tmp_path):
     """Test that a copy is a deepcopy."""
     # For this test to work, we need to tweak some folders temporarily
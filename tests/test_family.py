@@ -1,6 +1,6 @@
 import numpy as np
 
-from manim import RIGHT, Circle, Mobject
+from manim import DL, RIGHT, UP, Circle, Mobject, Square, VGroup
 
 
 def test_family():
@@ -80,3 +80,37 @@ def test_shift_family():
 
     for m in family:
         assert np.allclose(positions_before[m] + RIGHT, positions_after[m])
+
+
+def test_family_is_updated_when_submobjects_change():
+    """Check that cached families follow any change to the submobjects."""
+    child, grandchild, other = Mobject(), Mobject(), Mobject()
+    child.add(grandchild)
+    mob = Mobject().add(child)
+    assert mob.get_family() == [mob, child, grandchild]
+
+    child.submobjects.append(other)
+    assert mob.get_family() == [mob, child, grandchild, other]
+    child.submobjects[0] = other
+    assert mob.get_family() == [mob, child, other]
+    child.submobjects = []
+    assert mob.get_family() == [mob, child]
+    mob.remove(child)
+    assert mob.get_family() == [mob]
+
+    # Modifying the returned list does not modify the cached family
+    mob.get_family().append(other)
+    assert mob.get_family() == [mob]
+    # Copies don't share the family of the original
+    mob.add(child)
+    copy = mob.copy()
+    assert copy.get_family()[0] is copy
+    assert child not in copy.get_family()
+
+
+def test_critical_points_of_family():
+    group = VGroup(Square(), Circle().shift(3 * RIGHT))
+    np.testing.assert_allclose(group.get_center(), [1.5, 0, 0])
+    np.testing.assert_allclose(group.get_critical_point(DL), [-1, -1, 0])
+    np.testing.assert_allclose(group.get_top(), [1.5, 1, 0])
+    np.testing.assert_allclose(group.get_corner(UP + RIGHT), [4, 1, 0])
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from manim import *
+
+pytest.importorskip("grpc")
+
+from manim.grpc.impl.frame_server_impl import MobjectSerializer, serialize_mobject
+
+
+def test_serialize_mobject_packs_points():
+    square = Square().copy()
+    mob_proto = serialize_mobject(square)
+    points = np.frombuffer(
+        mob_proto.vectorized_mobject_data.packed_points, dtype="<f4"
+    ).reshape(-1, 3)
+    np.testing.assert_allclose(points, square.points, atol=1e-6)
+    assert not mob_proto.vectorized_mobject_data.points
+
+
+def test_only_changed_mobjects_are_serialized():
+    serializer = MobjectSerializer()
+    square, circle = Square().copy(), Circle().copy()
+    added, updated = serializer.serialize_changes([square, circle])
+    assert [mob_proto.id for mob_proto in added] == [
+        square.original_id,
+        circle.original_id,
+    ]
+    assert all(mob_proto.vectorized_mobject_data.needs_redraw for mob_proto in added)
+    assert not updated
+    assert serializer.serialize_changes([square, circle]) == ([], [])
+
+    square.shift(RIGHT)
+    circle.set_fill(RED, 1)
+    added, updated = serializer.serialize_changes([square, circle])
+    assert not added
+    assert [
+        (mob_proto.id, mob_proto.vectorized_mobject_data.needs_redraw)
+        for mob_proto in updated
+    ] == [(square.original_id, True), (circle.original_id, False)]
+
+    assert serializer.remove_missing([square]) == [circle.original_id]
+    # Mobjects animated by the frontend are sent again.
+    serializer.forget([square])
+    added, updated = serializer.serialize_changes([square])
+    assert [mob_proto.id for mob_proto in updated] == [square.original_id]
@@ -47,7 +47,7 @@ class DummySceneFileWriter(SceneFileWriter):
     def add_partial_movie_file(self, hash_animation):
         pass
 
-    def begin_animation(self, allow_write=True):
+    def begin_animation(self, allow_write=True, **kwargs):
         pass
 
     def end_animation(self, allow_write):
@@ -59,14 +59,15 @@ class DummySceneFileWriter(SceneFileWriter):
     def clean_cache(self):
         pass
 
-    def write_frame(self, frame_or_renderer):
-        self.i += 1
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        self.i += num_frames
 
 
 def _make_scene_file_writer_class(tester: _FramesTester) -> Type[SceneFileWriter]:
     class TestSceneFileWriter(DummySceneFileWriter):
-        def write_frame(self, frame_or_renderer):
-            tester.check_frame(self.i, frame_or_renderer)
-            super().write_frame(frame_or_renderer)
+        def write_frame(self, frame_or_renderer, num_frames=1):
+            for i in range(num_frames):
+                tester.check_frame(self.i + i, frame_or_renderer)
+            super().write_frame(frame_or_renderer, num_frames)
 
     return TestSceneFileWriter
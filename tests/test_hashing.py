@@ -1,10 +1,11 @@
 import json
+import weakref
 from zlib import crc32
 
 import pytest
 
 import manim.utils.hashing as hashing
-from manim import Square
+from manim import RIGHT, Square
 
 ALREADY_PROCESSED_PLACEHOLDER = hashing._Memoizer.ALREADY_PROCESSED_PLACEHOLDER
 
@@ -157,3 +158,99 @@ def test_hash_consistency():
     assert_two_objects_produce_same_hash(Square(), Square())
     s = Square()
     assert_two_objects_produce_same_hash(s, s.copy())
+
+
+def test_structural_hash_consistency():
+    def digest(obj):
+        return hashing._StructuralHasher().hexdigest(obj)
+
+    s = Square()
+    assert digest(Square()) == digest(s)
+    assert digest(s) == digest(s.copy())
+    s.shift(2 * RIGHT)
+    assert digest(s) != digest(Square())
+
+
+def test_structural_hash_with_function_and_external_val():
+    external = 2
+
+    def test(uhu):
+        uhu += external
+        return uhu
+
+    hash1 = hashing._StructuralHasher().hexdigest(test)
+    external = 3
+    hash2 = hashing._StructuralHasher().hexdigest(test)
+    assert hash1 != hash2
+
+
+def test_structural_hash_with_circular_references():
+    class T:
+        def __init__(self) -> None:
+            self.a = None
+
+    o = T()
+    o.a = o
+    assert hashing._StructuralHasher().hexdigest(o)
+
+
+def test_structural_hash_of_sets_does_not_depend_on_their_order():
+    # The iteration order of a set follows the hashes of its elements.
+    set_hashes = {}
+
+    class T:
+        def __init__(self, name):
+            self.name = name
+            self.child = Square()
+
+        def __hash__(self):
+            return set_hashes[self.name]
+
+    def digest():
+        a, b = T("a"), T("b")
+        return hashing._StructuralHasher().hexdigest([{a, b}, a.child, b])
+
+    set_hashes.update(a=0, b=1)
+    hash1 = digest()
+    set_hashes.update(a=1, b=0)
+    assert digest() == hash1
+
+
+def test_structural_hash_of_set_with_circular_references():
+    class T:
+        def __init__(self) -> None:
+            self.a = set()
+
+    o = T()
+    o.a.add(o)
+    o.a.add(T())
+    assert hashing._StructuralHasher().hexdigest(o)
+
+
+def test_structural_hash_does_not_keep_code_alive():
+    # The code of a nested function would be kept alive by the code of this test.
+    namespace = {}
+    exec("def test():\n    return 1", namespace)
+    test = namespace.pop("test")
+    hashing._StructuralHasher().hexdigest(test)
+    assert test.__code__ in hashing._code_digests
+    code = weakref.ref(test.__code__)
+    del test
+    assert code() is None
+
+
+def test_structural_hash_cached_attributes_are_invalidated():
+    s = Square()
+    hash1 = hashing._StructuralHasher().hexdigest(s)
+    digest = hashing._attribute_digests[s]
+    assert hashing._StructuralHasher().hexdigest(s) == hash1
+    # The digest of the attributes of the square is reused.
+    assert hashing._attribute_digests[s] is digest
+
+    s.stroke_width = 10
+    assert not digest.matches(s.__dict__)
+    hash2 = hashing._StructuralHasher().hexdigest(s)
+    assert hash2 != hash1
+    assert hashing._attribute_digests[s] is not digest
+    s.points[0] += 1
+    assert hashing._StructuralHasher().hexdigest(s) != hash2
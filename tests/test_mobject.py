@@ -47,3 +47,24 @@ def test_mobject_remove():
     assert len(obj.submobjects) == 10
 
     assert obj.remove(Mobject()) is obj
+
+
+def test_mobject_update_skips_families_without_updaters():
+    """Test that updaters are called with dt only when they take it, and that
+    adding an updater anywhere in a family is taken into account."""
+    calls = []
+    parent, child, grandchild = Mobject(), Mobject(), Mobject()
+    parent.add(child.add(grandchild))
+    parent.update(1)
+    assert not parent.has_updaters
+
+    grandchild.add_updater(lambda m, dt: calls.append(dt))
+    child.updaters.append(lambda m: calls.append(m))
+    assert parent.has_updaters
+    parent.update(0.5)
+    assert calls == [child, 0.5]
+
+    child.clear_updaters()
+    assert not parent.has_updaters
+    parent.update(0.5)
+    assert calls == [child, 0.5]
@@ -0,0 +1,72 @@
+import time
+
+import numpy as np
+import pytest
+
+from manim import *
+from manim.opengl import *
+
+
+@pytest.fixture
+def renderer(monkeypatch):
+    pyglet = pytest.importorskip("pyglet")
+    # Render without a display, so that the tests also run on CI servers.
+    monkeypatch.setitem(pyglet.options, "headless", True)
+    try:
+        from manim.renderer.opengl_renderer import OpenGLRenderer
+    except Exception:
+        pytest.skip("No display available")
+    with tempconfig(
+        {
+            "renderer": "opengl",
+            "write_to_movie": False,
+            "disable_caching": True,
+            "preview": False,
+            "pixel_width": 160,
+            "pixel_height": 90,
+        }
+    ):
+        renderer = OpenGLRenderer()
+        try:
+            Scene(renderer=renderer)
+        except Exception:
+            pytest.skip("No OpenGL context available")
+        renderer.animation_start_time = time.time()
+        yield renderer
+
+
+def test_consecutive_mobjects_are_drawn_together(renderer):
+    from manim.renderer.shader import get_vertex_array_cache
+
+    scene = renderer.scene
+    dots = [OpenGLDot(point=x * RIGHT) for x in range(-3, 4)]
+    scene.add(*dots)
+    renderer.update_frame(scene)
+    assert get_vertex_array_cache(renderer.context).last_frame_draw_calls == 1
+
+    # The mobjects are still drawn in order.
+    scene.add(OpenGLSquare(), OpenGLDot())
+    renderer.update_frame(scene)
+    assert get_vertex_array_cache(renderer.context).last_frame_draw_calls == 3
+
+
+def test_frames_are_read_back_asynchronously(renderer):
+    scene = renderer.scene
+    scene.add(OpenGLSquare().set_fill(RED, 1))
+    renderer.update_frame(scene)
+    first_frame = renderer.get_raw_frame_buffer_object_data()
+    renderer.begin_frame_readback()
+
+    scene.add(OpenGLCircle().set_fill(BLUE, 1))
+    renderer.update_frame(scene)
+    second_frame = renderer.get_raw_frame_buffer_object_data()
+    renderer.begin_frame_readback()
+    assert first_frame != second_frame
+
+    pixel_width, pixel_height = renderer.get_pixel_shape()
+    out = np.empty((pixel_height, pixel_width, 4), dtype=np.uint8)
+    renderer.end_frame_readback(out)
+    assert out.tobytes() == first_frame
+    renderer.end_frame_readback(out)
+    assert out.tobytes() == second_frame
+    assert not renderer.pending_pixel_buffers
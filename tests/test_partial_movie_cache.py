@@ -0,0 +1,53 @@
+import os
+
+from manim.utils.partial_movie_cache import PartialMovieCache
+
+
+def write_partial_movie(cache, hash_invocation, size):
+    path = cache.get_path(hash_invocation)
+    with open(path, "wb") as f:
+        f.write(b"0" * size)
+    return path
+
+
+def test_existing_files_are_indexed(tmp_path):
+    (tmp_path / "old.mp4").write_bytes(b"0" * 10)
+    (tmp_path / "partial_movie_file_list.txt").write_text("")
+    cache = PartialMovieCache(str(tmp_path), ".mp4")
+    assert "old" in cache
+    assert "missing" not in cache
+    assert cache.get_usage() == (1, 10)
+
+
+def test_files_missing_from_the_index_are_cached(tmp_path):
+    cache = PartialMovieCache(str(tmp_path), ".mp4")
+    assert "new" not in cache
+    assert cache.get_usage() == (0, 0)
+    # Written by a worker process, not indexed yet.
+    write_partial_movie(cache, "new", 10)
+    assert "new" in cache
+
+
+def test_files_used_the_longest_ago_are_evicted(tmp_path):
+    cache = PartialMovieCache(str(tmp_path), ".mp4")
+    paths = [write_partial_movie(cache, name, 100) for name in "abc"]
+    for path in paths:
+        cache.record_use([path], "SceneName")
+    cache.record_use([paths[0]], "OtherScene")
+
+    assert cache.evict(float("inf"), 250) == (1, 100)
+    assert "b" not in cache
+    assert not os.path.exists(paths[1])
+    assert cache.evict(1, float("inf")) == (1, 100)
+    assert "a" in cache
+    assert "c" not in cache
+
+
+def test_cache_is_shared(tmp_path):
+    cache = PartialMovieCache(str(tmp_path), ".mp4")
+    cache.record_use([write_partial_movie(cache, "a", 10)], "SceneName")
+    other_cache = PartialMovieCache(str(tmp_path), ".mp4")
+    assert "a" in other_cache
+    assert other_cache.flush() == 1
+    # The file was removed by another process.
+    assert "a" not in cache
@@ -1,6 +1,6 @@
 import pytest
 
-from manim import Mobject, Scene, tempconfig
+from manim import RIGHT, Animation, Dot, Mobject, Scene, Wait, tempconfig
 
 
 def test_scene_add_remove():
@@ -33,3 +33,37 @@ def test_scene_add_remove():
 
         # Check that Scene.remove() returns the instance (for chained calls)
         assert scene.add(Mobject()) is scene
+
+
+def test_fast_forward_to_frame():
+    with tempconfig({"dry_run": True, "frame_rate": 10}):
+        scene = Scene()
+        mob = Dot()
+        mob.add_updater(lambda m, dt: m.shift(dt * RIGHT))
+        scene.add(mob)
+        scene.compile_animation_data(Wait(run_time=1))
+        scene.begin_animations()
+        scene.duration = 1
+        scene.fast_forward_to_frame(5)
+        # The frame itself is updated when it is rendered.
+        assert scene.last_t == pytest.approx(0.4)
+        assert mob.get_center()[0] == pytest.approx(0.4)
+        assert scene.renderer.time == pytest.approx(0.5)
+
+
+def test_fast_forward_to_frame_with_updaters_without_dt():
+    def render_frames(frame_range):
+        scene = Scene()
+        mob = Dot()
+        # The updater accumulates state, without depending on the time.
+        mob.add_updater(lambda m: m.shift(RIGHT))
+        scene.add(mob)
+        scene.compile_animation_data(Animation(Mobject(), run_time=1))
+        scene.begin_animations()
+        scene.fast_forward_to_frame(frame_range[0])
+        for t in scene.get_frame_times(1)[frame_range[0] : frame_range[1]]:
+            scene.update_to_time(t)
+        return mob.get_center()[0]
+
+    with tempconfig({"dry_run": True, "frame_rate": 10}):
+        assert render_frames((5, 8)) == render_frames((0, 8)) == 8
@@ -28,6 +28,14 @@ class SceneWithMultipleWaitCalls(Scene):
         self.wait(1)
 
 
+class SceneWithIdenticalPlayCalls(Scene):
+    def construct(self):
+        square = Square()
+        self.add(square)
+        self.play(Animation(square))
+        self.play(Animation(square))
+
+
 class NoAnimations(Scene):
     def construct(self):
         dot = Dot().set_color(GREEN)
@@ -1,5 +1,5 @@
 import os
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 
 import pytest
 
@@ -82,3 +82,76 @@ def test_hash_logic_is_called_when_caching_is_enabled(using_temp_config):
         scene = SquareToCircle()
         scene.render()
         mocked.assert_called_once()
+
+
+def test_partial_movie_files_are_indexed_when_written(using_temp_config):
+    scene = SceneWithMultipleWaitCalls()
+    file_writer = scene.renderer.file_writer
+    cache = file_writer.partial_movie_cache
+    cache.record_use = Mock(wraps=cache.record_use)
+    scene.render()
+    # Each file is indexed as soon as it is written, before the scene ends.
+    partial_movie_files = file_writer.partial_movie_files
+    assert cache.record_use.call_args_list[: len(partial_movie_files)] == [
+        call([partial_movie_file], "SceneWithMultipleWaitCalls")
+        for partial_movie_file in partial_movie_files
+    ]
+
+
+def test_skipped_animations_are_not_rasterized(using_temp_config, disabling_caching):
+    config.save_last_frame = True
+    scene = SceneWithMultipleCalls()
+    renderer = scene.renderer
+    renderer.update_frame = Mock(wraps=renderer.update_frame)
+    scene.render()
+    # Only the last frame is rasterized, to be saved.
+    renderer.update_frame.assert_called_once()
+
+
+@pytest.mark.skipif(os.name == "nt", reason="parallel rendering requires fork()")
+def test_parallel_render(using_temp_config, disabling_caching):
+    config.parallel = True
+    config.render_workers = 2
+    scene = SceneWithMultipleWaitCalls()
+    renderer = scene.renderer
+    renderer.update_frame = Mock(wraps=renderer.update_frame)
+    scene.render()
+    # Frames are rasterized in the worker processes only.
+    renderer.update_frame.assert_not_called()
+    assert renderer.num_plays == 8
+    for partial_movie_file in renderer.file_writer.partial_movie_files:
+        assert_file_exists(partial_movie_file)
+    assert_file_exists(config["output_file"])
+
+
+@pytest.mark.skipif(os.name == "nt", reason="parallel rendering requires fork()")
+def test_parallel_render_reuses_identical_play_calls(using_temp_config):
+    config.parallel = True
+    config.render_workers = 2
+    scene = SceneWithIdenticalPlayCalls()
+    renderer = scene.renderer
+    renderer.play_in_worker = Mock(wraps=renderer.play_in_worker)
+    scene.render()
+    # The second play call is not written concurrently to the same partial movie
+    # file.
+    renderer.play_in_worker.assert_called_once()
+    first_hash, second_hash = renderer.animations_hashes
+    assert first_hash == second_hash
+    assert_file_exists(config["output_file"])
+
+
+@pytest.mark.skipif(os.name == "nt", reason="parallel rendering requires fork()")
+def test_parallel_render_splits_long_animations(using_temp_config, disabling_caching):
+    config.parallel = True
+    config.render_workers = 3
+    config.min_frames_per_shard = 5
+    scene = SquareToCircle()
+    scene.render()
+    file_writer = scene.renderer.file_writer
+    assert not file_writer.partial_movie_shards
+    (partial_movie_file,) = file_writer.partial_movie_files
+    assert_file_exists(partial_movie_file)
+    assert not [
+        f for f in os.listdir(file_writer.partial_movie_directory) if "_shard" in f
+    ]
+    assert_file_exists(config["output_file"])
@@ -0,0 +1,57 @@
+import io
+
+import numpy as np
+
+from manim.scene.scene_file_writer import _FrameWriterThread
+
+
+def test_frame_writer_thread_writes_frames_in_order():
+    stream = io.BytesIO()
+    frame_writer = _FrameWriterThread(stream, queue_size=2)
+    frame = np.zeros((4, 3, 4), dtype=np.uint8)
+    expected = b""
+    for i in range(10):
+        frame[:] = i
+        # The frame is reused right away, as the renderer does with its pixel array.
+        frame_writer.write(frame)
+        expected += frame.tobytes()
+    frame_writer.close()
+    assert stream.getvalue() == expected
+
+    stats = frame_writer.get_stats()
+    assert stats["frames"] == 10
+    # The thread keeps the last written frame, so one frame more than the queue
+    # size can be queued before it starts writing.
+    assert 1 <= stats["max_queue_depth"] <= 3
+    assert frame_writer.num_buffers <= 3
+
+
+def test_frame_writer_thread_repeats_identical_frames():
+    stream = io.BytesIO()
+    frame_writer = _FrameWriterThread(stream, queue_size=1)
+    frame = np.zeros((4, 3, 4), dtype=np.uint8)
+    expected = b""
+    for i in range(10):
+        frame[:] = i // 4
+        frame_writer.write(frame)
+        expected += frame.tobytes()
+    frame_writer.close()
+    assert stream.getvalue() == expected
+    assert frame_writer.get_stats()["duplicate_frames"] == 7
+
+
+def test_frame_writer_thread_writes_frames_read_into_its_buffers():
+    stream = io.BytesIO()
+    frame_writer = _FrameWriterThread(stream, queue_size=2)
+    expected = b""
+    for i in range(10):
+
+        def read_into(buffer, value=i // 2):
+            buffer[:] = value
+
+        frame_writer.write_from(read_into, (4, 3, 4), np.dtype(np.uint8))
+        expected += bytes([i // 2]) * 48
+    frame_writer.close()
+    assert stream.getvalue() == expected
+    assert frame_writer.get_stats()["duplicate_frames"] == 5
+    assert frame_writer.num_buffers <= 3
@@ -0,0 +1,43 @@
+import numpy as np
+
+from manim.utils import space_ops
+from manim.utils.space_ops import cross2d, earclip_triangulation
+
+
+def square_with_hole():
+    outer = [(0, 0, 0), (4, 0, 0), (4, 4, 0), (0, 4, 0)]
+    inner = [(1, 1, 0), (1, 3, 0), (3, 3, 0), (3, 1, 0)]
+    return np.array(outer + inner, dtype=float), [4, 8]
+
+
+def triangulated_area(verts, indices):
+    a, b, c = (verts[indices[k::3], :2] for k in range(3))
+    return np.abs(cross2d(b - a, c - a)).sum() / 2
+
+
+def test_earclip_triangulation_of_polygon_with_hole():
+    space_ops._earclip_triangulations.clear()
+    verts, ring_ends = square_with_hole()
+    indices = earclip_triangulation(verts, ring_ends)
+    assert len(indices) % 3 == 0
+    assert triangulated_area(verts, indices) == 12
+
+
+def test_earclip_triangulation_is_reused_for_affine_images():
+    space_ops._earclip_triangulations.clear()
+    verts, ring_ends = square_with_hole()
+    indices = earclip_triangulation(verts, ring_ends)
+
+    rotation = np.array([[0, -2, 0], [2, 0, 0], [0, 0, 1]])
+    moved = verts @ rotation.T + (5, -1, 0)
+    assert earclip_triangulation(moved, ring_ends).tolist() == indices.tolist()
+
+    # A mirror image has the opposite orientation, so it is triangulated again.
+    mirrored = verts * (-1, 1, 1)
+    indices = earclip_triangulation(mirrored, ring_ends)
+    assert triangulated_area(mirrored, indices) == 12
+
+    deformed = verts.copy()
+    deformed[2] = (6, 5, 0)
+    indices = earclip_triangulation(deformed, ring_ends)
+    assert np.isclose(triangulated_area(deformed, indices), 18)
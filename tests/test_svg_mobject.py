@@ -1,6 +1,10 @@
+from pathlib import Path
+
+import numpy as np
 from colour import Color
 
 from manim import *
+from manim.mobject.svg import svg_cache, svg_path
 from tests.helpers.path_utils import get_svg_resource
 
 
@@ -50,3 +54,67 @@ def test_stroke_overrides_color():
         get_svg_resource("heart.svg"), color="#334433", stroke_color=expected_color
     )
     assert svg.stroke_color == expected_color
+
+
+def test_svg_mobjects_are_cached(tmp_path):
+    with tempconfig({"media_dir": str(tmp_path)}):
+        tex_dir = config.get_dir("tex_dir")
+        tex_dir.mkdir(parents=True)
+        svg_file = tex_dir / "aabbb.svg"
+        svg_file.write_bytes(Path(get_svg_resource("aabbb.svg")).read_bytes())
+
+        parsed = SVGMobject(str(svg_file), unpack_groups=False)
+        assert len(list(tex_dir.glob("*.npz"))) == 1
+        from_memory = SVGMobject(str(svg_file), unpack_groups=False)
+        svg_cache._memory_cache.clear()
+        from_file = SVGMobject(str(svg_file), unpack_groups=False)
+
+        for svg in (from_memory, from_file):
+            family = svg.get_family()
+            assert [type(mob) for mob in family] == [
+                type(mob) for mob in parsed.get_family()
+            ]
+            for mob, parsed_mob in zip(family, parsed.get_family()):
+                np.testing.assert_array_equal(mob.points, parsed_mob.points)
+                assert mob.fill_color == parsed_mob.fill_color
+
+        # The cached mobjects are copies.
+        from_memory.family_members_with_points()[0].shift(RIGHT)
+        np.testing.assert_array_equal(
+            SVGMobject(str(svg_file), unpack_groups=False).get_all_points(),
+            parsed.get_all_points(),
+        )
+
+
+def test_parsed_paths_are_reused():
+    path_string = "M 0 0 L 1 0 L 1 1 Z M 2 2 C 3 3 4 4 5 5"
+    svg_path._parsed_paths.clear()
+    parsed = SVGPathMobject(path_string)
+    assert len(svg_path._parsed_paths) == 1
+    reused = SVGPathMobject(path_string)
+    np.testing.assert_array_equal(reused.points, parsed.points)
+    np.testing.assert_array_equal(reused.current_path_start, parsed.current_path_start)
+
+    # The cached points are copies.
+    reused.shift(RIGHT)
+    np.testing.assert_array_equal(SVGPathMobject(path_string).points, parsed.points)
+
+
+def test_path_string_to_points(monkeypatch):
+    path_string = (
+        "M 1,2 3-4 L 5.5.5 h 1 v -2 C 1 2 3 4 5 6 s 1 1 2e-1 2 "
+        "Q 0 0 1 1 t 2 2 1 -1 a 3 2 30 0 1 4 4 z m 2 2 l 1 1 Z"
+    )
+    points, current_path_start = svg_path.path_string_to_points(path_string)
+    np.testing.assert_array_equal(current_path_start, [3, 4, 0])
+
+    # The points are the same as those added by each path command.
+    def unsupported(path_string):
+        raise ValueError
+
+    svg_path._parsed_paths.clear()
+    parsed = SVGPathMobject(path_string)
+    svg_path._parsed_paths.clear()
+    monkeypatch.setattr(svg_path, "path_string_to_points", unsupported)
+    np.testing.assert_array_equal(SVGPathMobject(path_string).points, parsed.points)
+    svg_path._parsed_paths.clear()
@@ -2,7 +2,8 @@ from pathlib import Path
 
 import pytest
 
-from manim import MathTex, SingleStringMathTex, Tex, config
+from manim import MathTex, SingleStringMathTex, Tex, TexTemplate, config
+from manim.utils.tex_file_writing import tex_to_svg_file, tex_to_svg_files
 
 
 def test_MathTex():
@@ -72,3 +73,23 @@ def test_tex_white_space_and_non_whitespace_args():
     assert len(tex[1]) == len("".join((str_part_2 + separator).split()))
     assert len(tex[2]) == len("".join((str_part_3 + separator).split()))
     assert len(tex[3]) == len("".join(str_part_4.split()))
+
+
+def test_tex_to_svg_files():
+    expressions = ["u", "v^2", "u"]
+    svg_files = tex_to_svg_files(expressions, environment="align*")
+    assert svg_files == [
+        tex_to_svg_file(expression, environment="align*") for expression in expressions
+    ]
+    assert all(Path(svg_file).exists() for svg_file in svg_files)
+
+
+def test_texcode_for_expressions_on_pages():
+    template = TexTemplate()
+    texcode = template.get_texcode_for_expressions_on_pages(["a", "b"], "align*")
+    assert texcode.startswith(r"\documentclass[preview,multi=manimpage]{standalone}")
+    assert texcode.count(r"\begin{manimpage}" + "\n" + r"\begin{align*}") == 2
+    assert template.placeholder_text not in texcode
+
+    article = TexTemplate(documentclass=r"\documentclass{article}")
+    assert article.get_texcode_for_expressions_on_pages(["a", "b"]) is None
@@ -0,0 +1,31 @@
+import numpy as np
+
+from manim import BLUE, RED, Circle, Square, Transform, VGroup
+from manim.utils.paths import straight_path
+
+
+def test_transform_interpolates_all_submobjects():
+    """Test Transform interpolates each submobject at its own alpha"""
+    source = VGroup(*[Square(color=RED).shift(i * 0.5) for i in range(4)])
+    target = VGroup(*[Circle(color=BLUE).set_stroke(width=8) for _ in range(4)])
+    animation = Transform(source, target, lag_ratio=0.5)
+    animation.begin()
+    animation.interpolate(0.4)
+
+    families = zip(
+        source.submobjects,
+        animation.starting_mobject.submobjects,
+        animation.target_copy.submobjects,
+    )
+    for i, (submobject, start, end) in enumerate(families):
+        expected = start.copy().interpolate(
+            start, end, animation.get_sub_alpha(0.4, i, 4), straight_path
+        )
+        np.testing.assert_allclose(submobject.points, expected.points)
+        np.testing.assert_allclose(submobject.stroke_rgbas, expected.stroke_rgbas)
+        assert submobject.stroke_width == expected.stroke_width
+
+    animation.finish()
+    for submobject, end in zip(source, animation.target_copy):
+        np.testing.assert_allclose(submobject.points, end.points)
+        np.testing.assert_allclose(submobject.fill_rgbas, end.fill_rgbas)
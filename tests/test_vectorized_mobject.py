@@ -1,7 +1,18 @@
 import numpy as np
 import pytest
 
-from manim import Circle, Line, Mobject, Square, VDict, VGroup, VMobject
+from manim import (
+    ORIGIN,
+    RIGHT,
+    Circle,
+    Line,
+    Mobject,
+    Square,
+    VDict,
+    VectorizedPoint,
+    VGroup,
+    VMobject,
+)
 
 
 def test_vmobject_point_from_propotion():
@@ -28,6 +39,33 @@ def test_vmobject_point_from_propotion():
         obj.point_from_proportion(0)
 
 
+def test_vmobject_points_from_proportions():
+    obj = VMobject()
+    obj.set_points_as_corners([[0, 0, 0], [4, 0, 0], [4, 2, 0]])
+
+    np.testing.assert_allclose(
+        obj.points_from_proportions([0, 0.5, 0.75, 1]),
+        [[0, 0, 0], [3, 0, 0], [4, 0.5, 0], [4, 2, 0]],
+    )
+
+    # The cached lengths of the curves are updated when the points change.
+    obj.stretch(2, 1, about_point=ORIGIN)
+    np.testing.assert_allclose(obj.point_from_proportion(0.5), [4, 0, 0])
+
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        obj.points_from_proportions([0.5, -1])
+
+
+def test_vmobject_without_curves_has_no_curve_lengths():
+    for obj in [VMobject(), VGroup(), VectorizedPoint(RIGHT)]:
+        assert obj.get_curve_lengths().shape == (0,)
+        assert obj.get_arc_length() == 0
+
+    np.testing.assert_array_equal(
+        VectorizedPoint(RIGHT).point_from_proportion(0.5), RIGHT
+    )
+
+
 def test_vgroup_init():
     """Test the VGroup instantiation."""
     VGroup()
@@ -204,3 +242,35 @@ def test_vgroup_item_assignment_only_allows_vmobjects():
     vgroup = VGroup(VMobject())
     with pytest.raises(TypeError, match="All submobjects must be of type VMobject"):
         vgroup[0] = "invalid object"
+
+
+def test_insert_n_curves_splits_curves_evenly():
+    """Test inserted curves split the original curves into equal pieces"""
+    line = Line(ORIGIN, RIGHT)
+    line.insert_n_curves(3)
+    assert line.get_num_curves() == 4
+    np.testing.assert_allclose(
+        line.get_anchors()[:, 0], [0, 0.25, 0.25, 0.5, 0.5, 0.75, 0.75, 1]
+    )
+    square = Square()
+    anchors = square.get_anchors()
+    square.insert_n_curves(6)
+    assert square.get_num_curves() == 10
+    # Curves are split into 3, 2, 3 and 2 pieces, and keep their endpoints.
+    np.testing.assert_allclose(
+        square.get_anchors()[[0, 5, 6, 9]], anchors[[0, 1, 2, 3]]
+    )
+
+
+def test_pointwise_become_partial():
+    """Test the partial curve of a VMobject is the curve between the proportions"""
+    square = Square()
+    partial = VMobject().pointwise_become_partial(square, 0.125, 0.625)
+    assert partial.get_num_curves() == 3
+    np.testing.assert_allclose(
+        partial.get_start(), square.point_from_proportion(0.125), atol=1e-10
+    )
+    np.testing.assert_allclose(
+        partial.get_end(), square.point_from_proportion(0.625), atol=1e-10
+    )
+    np.testing.assert_allclose(partial.points[4:8], square.points[4:8])
@@ -0,0 +1,104 @@
+import moderngl
+import numpy as np
+import pytest
+
+from manim.renderer.shader import VertexArrayCache
+
+
+@pytest.fixture
+def context():
+    for backend in (None, "egl"):
+        try:
+            if backend is None:
+                context = moderngl.create_standalone_context()
+            else:
+                context = moderngl.create_standalone_context(backend=backend)
+            break
+        except Exception:
+            continue
+    else:
+        pytest.skip("No OpenGL context available")
+    yield context
+    context.release()
+
+
+@pytest.fixture
+def program(context):
+    return context.program(
+        vertex_shader="""
+        #version 330
+        in vec2 in_vert;
+        void main() {
+            gl_Position = vec4(in_vert, 0.0, 1.0);
+        }
+        """,
+        fragment_shader="""
+        #version 330
+        out vec4 frag_color;
+        void main() {
+            frag_color = vec4(1.0);
+        }
+        """,
+    )
+
+
+def squares(*corners):
+    """The two triangles of each square of side 1 with the given lower left corners."""
+    attributes = np.zeros(6 * len(corners), dtype=[("in_vert", np.float32, (2,))])
+    attributes["in_vert"] = [
+        (x + dx, y + dy)
+        for x, y in corners
+        for dx, dy in [(0, 0), (1, 0), (0, 1), (1, 0), (1, 1), (0, 1)]
+    ]
+    return attributes
+
+
+def draw(context, cache, program, attributes, indices=None):
+    framebuffer = context.simple_framebuffer((4, 4))
+    framebuffer.use()
+    framebuffer.clear()
+    cache.render("key", program, attributes, indices=indices)
+    pixels = np.frombuffer(framebuffer.read(components=1), dtype=np.uint8)
+    framebuffer.release()
+    return pixels.reshape((4, 4)) > 0
+
+
+def test_vertex_data_is_only_uploaded_when_it_changes(context, program):
+    cache = VertexArrayCache(context)
+    lower_left = squares((-1, -1))
+    drawn = draw(context, cache, program, lower_left)
+    assert drawn[:2, :2].all() and not drawn[2:, 2:].any()
+    assert cache.frame_bytes_uploaded == lower_left.nbytes
+    cache.end_frame()
+
+    assert draw(context, cache, program, lower_left).tolist() == drawn.tolist()
+    assert cache.frame_bytes_uploaded == 0
+    cache.end_frame()
+
+    # Buffers are resized for more vertices.
+    both = squares((-1, -1), (0, 0))
+    drawn = draw(context, cache, program, both)
+    assert drawn[:2, :2].all() and drawn[2:, 2:].all()
+    assert cache.frame_bytes_uploaded == both.nbytes
+
+    # Only the indexed vertices are drawn.
+    drawn = draw(context, cache, program, both, indices=np.arange(6, 12))
+    assert not drawn[:2, :2].any() and drawn[2:, 2:].all()
+    assert cache.buffers_created == 2
+    cache.release()
+
+
+def test_unused_buffers_are_reused(context, program):
+    cache = VertexArrayCache(context)
+    cache.render("first", program, squares((-1, -1)))
+    cache.end_frame()
+    assert cache.last_frame_bytes_uploaded > 0
+    # The buffers of the first key are recycled at the end of the first frame
+    # it isn't drawn in.
+    cache.end_frame()
+    assert not cache.vertex_arrays
+    cache.render("second", program, squares((0, 0)))
+    cache.end_frame()
+    assert list(cache.vertex_arrays) == ["second"]
+    assert cache.buffers_created == 1
+    cache.release()